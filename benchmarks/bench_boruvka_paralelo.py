@@ -0,0 +1,44 @@
+"""Escalamiento del MST de Borůvka en paralelo según el número de procesos.
+
+Uso: python -m benchmarks.bench_boruvka_paralelo [--tamanos 100000] [--procesos 1 2 4 8]
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+from service.boruvka_paralelo import mst_boruvka_paralelo
+from service.mst_disperso import mst_euclidiano
+
+
+def generar_coordenadas(n: int, semilla: int = 42) -> np.ndarray:
+    rng = np.random.default_rng(semilla)
+    return rng.uniform((86.0, 14.0), (118.0, 33.0), size=(n, 2))
+
+
+def medir(funcion, *args):
+    inicio = time.perf_counter()
+    resultado = funcion(*args)
+    return time.perf_counter() - inicio, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tamanos', type=int, nargs='+', default=[100000])
+    parser.add_argument('--procesos', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    print(f"CPUs disponibles: {os.cpu_count()}")
+    print(f"{'n':>9} {'procesos':>9} {'tiempo (s)':>11} {'aceleración':>12} {'peso MST':>14}")
+    for n in args.tamanos:
+        coordenadas = generar_coordenadas(n)
+        t_base, (_, _, pesos) = medir(mst_euclidiano, coordenadas)
+        print(f"{n:>9} {'secuencial':>9} {t_base:11.3f} {'1.0x':>12} {np.sort(pesos).sum():14.6f}")
+        for procesos in args.procesos:
+            t, (_, _, pesos) = medir(mst_boruvka_paralelo, coordenadas, procesos)
+            print(f"{n:>9} {procesos:>9} {t:11.3f} {t_base / t:11.2f}x {np.sort(pesos).sum():14.6f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark de la construcción de pesos del grafo completo.
+
+Compara el doble ciclo original (calcular_distancia + add_edge por par)
+contra el cálculo por lotes en forma condensada.
+
+Uso: python -m benchmarks.bench_grafo_completo [--tamanos 1000 5000 10000]
+"""
+import argparse
+import random
+import time
+
+import networkx as nx
+
+from models import Estado
+from service import KruskalGraphStrategy
+
+
+def generar_estados(n: int, semilla: int = 42):
+    rnd = random.Random(semilla)
+    return {
+        f"E{i}": Estado(f"E{i}", (rnd.uniform(86.0, 118.0), rnd.uniform(14.0, 33.0)))
+        for i in range(n)
+    }
+
+
+def construir_legado(estados):
+    """Implementación original: un add_edge de networkx por cada par"""
+    estrategia = KruskalGraphStrategy()
+    grafo = nx.Graph()
+    estados_lista = list(estados.values())
+    for i in range(len(estados_lista)):
+        for j in range(i + 1, len(estados_lista)):
+            estado1 = estados_lista[i]
+            estado2 = estados_lista[j]
+            distancia = estrategia.calcular_distancia(estado1, estado2)
+            grafo.add_edge(estado1.nombre, estado2.nombre, weight=distancia)
+    return grafo
+
+
+def construir_lotes(estados):
+    return KruskalGraphStrategy().calcular_distancias(estados)
+
+
+def medir(funcion, *args) -> float:
+    inicio = time.perf_counter()
+    funcion(*args)
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tamanos', type=int, nargs='+', default=[1000, 5000, 10000])
+    parser.add_argument('--max-legado', type=int, default=2000,
+                        help="Tamaño máximo para medir la versión original (usa mucha memoria)")
+    args = parser.parse_args()
+
+    print(f"{'n':>7} {'pares':>12} {'legado (s)':>12} {'lotes (s)':>12} {'aceleración':>12}")
+    for n in args.tamanos:
+        estados = generar_estados(n)
+        t_lotes = medir(construir_lotes, estados)
+        if n <= args.max_legado:
+            t_legado = medir(construir_legado, estados)
+            legado = f"{t_legado:12.3f}"
+            aceleracion = f"{t_legado / t_lotes:11.1f}x"
+        else:
+            legado = f"{'omitido':>12}"
+            aceleracion = f"{'-':>12}"
+        print(f"{n:>7} {n * (n - 1) // 2:>12} {legado} {t_lotes:12.3f} {aceleracion}")
+
+
+if __name__ == "__main__":
+    main()
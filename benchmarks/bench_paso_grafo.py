@@ -0,0 +1,95 @@
+"""Latencia de un paso de la vista del MST: redibujo completo contra resalte con blitting.
+
+Con el backend Agg (sin pantalla) mide:
+- dibujo inicial: crear la capa del MST y el primer `canvas.draw()`;
+- paso original: `clf()` + redibujar todo en cada cambio de estado;
+- paso con blitting: mover solo el marcador (`CapaMST.resaltar`).
+
+Uso: python -m benchmarks.bench_paso_grafo [--tamanos 32 1000 10000] [--pasos 20]
+"""
+import argparse
+import statistics
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+
+import networkx as nx
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from benchmarks.bench_boruvka_paralelo import generar_coordenadas
+from service.mst_disperso import mst_euclidiano
+from views.graph_view import CapaMST
+
+
+def generar_mst(n: int):
+    coordenadas = generar_coordenadas(n)
+    origen, destino, pesos = mst_euclidiano(coordenadas)
+    nombres = [f"E{i}" for i in range(n)]
+    grafo = nx.Graph()
+    grafo.add_nodes_from(nombres)
+    grafo.add_weighted_edges_from(
+        (nombres[u], nombres[v], w) for u, v, w in zip(origen.tolist(), destino.tolist(), pesos.tolist())
+    )
+    return grafo, dict(zip(nombres, map(tuple, coordenadas.tolist()))), nombres
+
+
+def nueva_figura() -> Figure:
+    fig = Figure(figsize=(8, 6), dpi=100)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def paso_original(fig: Figure, grafo, posiciones, estado: str):
+    """Comportamiento previo: reconstruir y dibujar todo en cada paso"""
+    capa = CapaMST(fig, grafo, posiciones)
+    capa.marcador.set_animated(False)
+    capa.desconectar()
+    capa.resaltar(estado)
+    fig.canvas.draw()
+
+
+def mediana_ms(funcion, argumentos) -> float:
+    tiempos = []
+    for args in argumentos:
+        inicio = time.perf_counter()
+        funcion(*args)
+        tiempos.append(time.perf_counter() - inicio)
+    return statistics.median(tiempos) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tamanos', type=int, nargs='+', default=[32, 1000, 10000])
+    parser.add_argument('--pasos', type=int, default=20)
+    parser.add_argument('--max-original', type=int, default=1000,
+                        help="Tamaño máximo para medir el redibujo completo (lento)")
+    args = parser.parse_args()
+
+    print(f"{'n':>7} {'inicial (ms)':>13} {'original (ms)':>14} {'blitting (ms)':>14} {'aceleración':>12}")
+    for n in args.tamanos:
+        grafo, posiciones, nombres = generar_mst(n)
+        estados = [nombres[(i * 7919) % n] for i in range(args.pasos)]
+
+        fig = nueva_figura()
+        inicio = time.perf_counter()
+        capa = CapaMST(fig, grafo, posiciones)
+        fig.canvas.draw()
+        inicial = (time.perf_counter() - inicio) * 1000
+        blitting = mediana_ms(capa.resaltar, [(estado,) for estado in estados])
+
+        if n <= args.max_original:
+            fig_original = nueva_figura()
+            pasos = estados[:max(3, args.pasos // 4)]
+            original = mediana_ms(paso_original, [(fig_original, grafo, posiciones, e) for e in pasos])
+            columna = f"{original:14.1f}"
+            aceleracion = f"{original / blitting:11.0f}x"
+        else:
+            columna = f"{'omitido':>14}"
+            aceleracion = f"{'-':>12}"
+        print(f"{n:>7} {inicial:13.1f} {columna} {blitting:14.2f} {aceleracion}")
+
+
+if __name__ == "__main__":
+    main()
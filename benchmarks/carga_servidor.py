@@ -0,0 +1,169 @@
+"""Prueba de carga del servicio de viajes: peticiones por segundo y latencia p99.
+
+Abre `--sesiones` clientes concurrentes, cada uno con su conexión y su
+sesión, que repiten el ciclo de un jugador (estado_actual, validar,
+confirmar, avanzar; resumen y sesión nueva al completar el viaje) durante
+`--duracion` segundos, contados desde que todas las sesiones existen. Sin
+`--puerto` levanta el servidor en otro proceso.
+
+Uso: python -m benchmarks.carga_servidor [--sesiones 1000] [--duracion 10]
+     python -m benchmarks.carga_servidor --puerto 8765   # servidor ya en marcha
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import socket
+import statistics
+import time
+from typing import Any, Dict, List, Optional
+
+HOST = '127.0.0.1'
+
+
+class Cliente:
+    """Conexión JSON-RPC con una petición en vuelo; registra la latencia de cada una"""
+
+    def __init__(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        self.lector = lector
+        self.escritor = escritor
+        self.latencias: List[float] = []
+        self.errores = 0
+        self._siguiente_id = 0
+
+    @classmethod
+    async def conectar(cls, puerto: int) -> "Cliente":
+        lector, escritor = await asyncio.open_connection(HOST, puerto, limit=1 << 20)
+        return cls(lector, escritor)
+
+    async def llamar(self, metodo: str, **parametros: Any) -> Any:
+        self._siguiente_id += 1
+        mensaje = {'jsonrpc': '2.0', 'id': self._siguiente_id, 'method': metodo, 'params': parametros}
+        inicio = time.perf_counter()
+        self.escritor.write(json.dumps(mensaje).encode('utf-8') + b'\n')
+        await self.escritor.drain()
+        respuesta = json.loads(await self.lector.readline())
+        self.latencias.append(time.perf_counter() - inicio)
+        if 'error' in respuesta:
+            self.errores += 1
+            return None
+        return respuesta['result']
+
+    def cerrar(self):
+        self.escritor.close()
+
+
+async def jugador(
+    puerto: int,
+    seleccion: List[int],
+    listos: asyncio.Barrier,
+    arranque: asyncio.Event,
+    limite: Dict[str, float]
+) -> Cliente:
+    cliente = await Cliente.conectar(puerto)
+    sesion = (await cliente.llamar('crear_sesion'))['sesion']
+    await listos.wait()
+    await arranque.wait()
+    cliente.latencias.clear()
+    while time.perf_counter() < limite['fin']:
+        estado = await cliente.llamar('estado_actual', sesion=sesion)
+        if estado is None or estado['completado']:
+            await cliente.llamar('resumen', sesion=sesion)
+            await cliente.llamar('cerrar_sesion', sesion=sesion)
+            sesion = (await cliente.llamar('crear_sesion'))['sesion']
+            continue
+        await cliente.llamar('validar', sesion=sesion, dulces=seleccion)
+        await cliente.llamar('confirmar', sesion=sesion, dulces=seleccion)
+        await cliente.llamar('avanzar', sesion=sesion)
+    cliente.cerrar()
+    return cliente
+
+
+async def medir(puerto: int, sesiones: int, duracion: float) -> Dict[str, Any]:
+    control = await Cliente.conectar(puerto)
+    dulces = await control.llamar('dulces')
+    seleccion = [dulce['indice'] for dulce in sorted(dulces, key=lambda dulce: dulce['peso'])[:3]]
+
+    listos = asyncio.Barrier(sesiones + 1)
+    arranque = asyncio.Event()
+    limite = {'fin': float('inf')}
+    tareas = [
+        asyncio.create_task(jugador(puerto, seleccion, listos, arranque, limite))
+        for _ in range(sesiones)
+    ]
+    await listos.wait()
+    inicio = time.perf_counter()
+    limite['fin'] = inicio + duracion
+    arranque.set()
+    clientes = await asyncio.gather(*tareas)
+    transcurrido = time.perf_counter() - inicio
+
+    servidor = await control.llamar('estadisticas')
+    control.cerrar()
+    latencias = sorted(t for cliente in clientes for t in cliente.latencias)
+    return {
+        'peticiones': len(latencias),
+        'errores': sum(cliente.errores for cliente in clientes),
+        'segundos': transcurrido,
+        'rps': len(latencias) / transcurrido,
+        'p50_ms': statistics.median(latencias) * 1000,
+        'p99_ms': latencias[min(len(latencias) - 1, int(len(latencias) * 0.99))] * 1000,
+        'max_ms': latencias[-1] * 1000,
+        'servidor': servidor,
+    }
+
+
+def _servir_en_proceso(puerto: int):
+    from servidor import crear_servicio, servir
+    asyncio.run(servir(crear_servicio(), HOST, puerto, aviso=False))
+
+
+def _puerto_libre() -> int:
+    with socket.socket() as s:
+        s.bind((HOST, 0))
+        return s.getsockname()[1]
+
+
+def _esperar_servidor(puerto: int, espera_s: float = 60.0):
+    limite = time.monotonic() + espera_s
+    while True:
+        try:
+            socket.create_connection((HOST, puerto), timeout=1.0).close()
+            return
+        except OSError:
+            if time.monotonic() > limite:
+                raise
+            time.sleep(0.1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sesiones', type=int, default=1000)
+    parser.add_argument('--duracion', type=float, default=10.0, help="Segundos de medición")
+    parser.add_argument('--puerto', type=int, help="Puerto de un servidor ya en marcha")
+    args = parser.parse_args()
+
+    proceso: Optional[multiprocessing.Process] = None
+    puerto = args.puerto
+    if puerto is None:
+        puerto = _puerto_libre()
+        proceso = multiprocessing.Process(target=_servir_en_proceso, args=(puerto,), daemon=True)
+        proceso.start()
+    try:
+        _esperar_servidor(puerto)
+        resultado = asyncio.run(medir(puerto, args.sesiones, args.duracion))
+    finally:
+        if proceso is not None:
+            proceso.terminate()
+            proceso.join()
+
+    print(f"{'sesiones':>9} {'peticiones':>11} {'errores':>8} {'pet/s':>9} "
+          f"{'p50 (ms)':>9} {'p99 (ms)':>9} {'máx (ms)':>9}")
+    print(f"{args.sesiones:>9} {resultado['peticiones']:>11} {resultado['errores']:>8} "
+          f"{resultado['rps']:9.0f} {resultado['p50_ms']:9.2f} {resultado['p99_ms']:9.2f} "
+          f"{resultado['max_ms']:9.2f}")
+    print("Servidor:", ", ".join(f"{clave} {valor}" for clave, valor in resultado['servidor'].items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Perfil de arranque de la interfaz: tiempos de importación y tiempo hasta el primer cuadro.
+
+Ejecuta subprocesos limpios (sin módulos ya cargados) y reporta:
+- `python -X importtime -c "import main"`: módulos más costosos (acumulado).
+- Tiempo hasta el primer cuadro de la ventana y hasta tener la ruta cargada
+  (requiere pantalla; sin DISPLAY se omite).
+
+Con --verificar termina con código 1 si se supera el presupuesto, para usarlo
+como prueba de regresión en CI.
+
+Uso: python -m benchmarks.perfil_arranque [--top 15] [--repeticiones 3] [--verificar]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+# Presupuestos por defecto (ms)
+PRESUPUESTO_IMPORTACION_MS = 250.0
+PRESUPUESTO_PRIMER_CUADRO_MS = 800.0
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_MEDIR_VENTANA = """
+import json, time
+import main
+app = main.MexicoTravelApp()
+limite = time.perf_counter() + 60
+while not (app.cargado and 'primer_cuadro' in app.tiempos_arranque) and time.perf_counter() < limite:
+    app.root.update()
+app.root.destroy()
+print(json.dumps(app.tiempos_arranque))
+"""
+
+
+def _python(*argumentos: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *argumentos], cwd=RAIZ, capture_output=True, text=True, check=True
+    )
+
+
+def perfil_importaciones() -> Tuple[float, List[Tuple[float, str]]]:
+    """Tiempo total de `import main` (ms) y módulos ordenados por tiempo acumulado"""
+    salida = _python('-X', 'importtime', '-c', 'import main').stderr
+    modulos = []
+    total = 0.0
+    for linea in salida.splitlines():
+        if not linea.startswith('import time:'):
+            continue
+        # Formato: "import time: propio | acumulado | módulo" (microsegundos)
+        _, acumulado, nombre = (campo.strip() for campo in linea.split(':', 1)[1].split('|'))
+        if not acumulado.isdigit():
+            continue  # Cabecera
+        modulo = nombre.strip()
+        modulos.append((int(acumulado) / 1000.0, modulo))
+        if modulo == 'main':
+            total = int(acumulado) / 1000.0
+    modulos.sort(reverse=True)
+    return total, modulos
+
+
+def tiempos_ventana() -> Optional[Dict[str, float]]:
+    """Tiempo (s) hasta el primer cuadro y hasta la carga completa; None sin pantalla"""
+    if sys.platform.startswith('linux') and not os.environ.get('DISPLAY'):
+        return None
+    return json.loads(_python('-c', _MEDIR_VENTANA).stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--repeticiones', type=int, default=3)
+    parser.add_argument('--presupuesto-importacion-ms', type=float, default=PRESUPUESTO_IMPORTACION_MS)
+    parser.add_argument('--presupuesto-primer-cuadro-ms', type=float, default=PRESUPUESTO_PRIMER_CUADRO_MS)
+    parser.add_argument('--verificar', action='store_true', help="Código de salida 1 si se excede el presupuesto")
+    args = parser.parse_args()
+
+    totales = []
+    for _ in range(args.repeticiones):
+        total, modulos = perfil_importaciones()
+        totales.append(total)
+    importacion = statistics.median(totales)
+    print(f"import main: {importacion:.1f} ms (mediana de {args.repeticiones})")
+    print(f"{'acumulado (ms)':>15}  módulo")
+    for milisegundos, modulo in modulos[:args.top]:
+        print(f"{milisegundos:>15.1f}  {modulo}")
+
+    excedidos = []
+    if importacion > args.presupuesto_importacion_ms:
+        excedidos.append(f"importación {importacion:.1f} ms > {args.presupuesto_importacion_ms:.0f} ms")
+
+    ventanas = [tiempos_ventana() for _ in range(args.repeticiones)]
+    if ventanas[0] is None:
+        print("\nSin pantalla (DISPLAY): se omite el tiempo hasta el primer cuadro")
+    else:
+        primer_cuadro = statistics.median(v['primer_cuadro'] for v in ventanas) * 1000
+        listo = statistics.median(v['listo'] for v in ventanas) * 1000
+        print(f"\nprimer cuadro: {primer_cuadro:.1f} ms   ruta cargada: {listo:.1f} ms")
+        if primer_cuadro > args.presupuesto_primer_cuadro_ms:
+            excedidos.append(
+                f"primer cuadro {primer_cuadro:.1f} ms > {args.presupuesto_primer_cuadro_ms:.0f} ms"
+            )
+
+    for mensaje in excedidos:
+        print(f"PRESUPUESTO EXCEDIDO: {mensaje}", file=sys.stderr)
+    if args.verificar and excedidos:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
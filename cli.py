@@ -0,0 +1,192 @@
+"""Ejecución sin interfaz gráfica: escenarios JSON de entrada, resultados JSON de salida.
+
+Uso:
+    python cli.py escenarios/*.json --salida resultados/
+    python cli.py escenario.json            # imprime los resultados en stdout
+
+Un escenario admite las claves (todas opcionales):
+    nombre, estados, dulces, inicio (estado de partida; por omisión
+    ESTADO_INICIAL o el primero del catálogo), red_carreteras, estrategia ('auto', 'kruskal',
+    'kruskal_arreglos', 'disperso', 'prim', 'boruvka'), metrica, refinar
+    (true o parámetros de MejoradorRuta), plan ('peso' o 'variedad'), cache,
+    multiinicio (true o {heuristicas, num_procesos, tamano_tabla}: mejor
+    preorden del MST probando todos los inicios, sin refinar).
+
+No importa tkinter ni matplotlib; networkx solo se carga si la estrategia
+elegida lo necesita.
+"""
+import argparse
+import inspect
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from controller import ViajeController
+from repositories import ArchivoDataRepository, CacheCalculos, DataRepository
+from service import MejoradorRuta, estrategia_por_nombre, metrica_por_nombre
+from utils import RUTA_RED_CARRETERAS
+
+
+def _ruta_relativa(ruta: Optional[str], base: str) -> Optional[str]:
+    if ruta is None or os.path.isabs(ruta):
+        return ruta
+    return os.path.join(base, ruta)
+
+
+def cargar_escenarios(ruta: str) -> List[Dict[str, Any]]:
+    """Lee un archivo de escenario (objeto JSON o lista de objetos)"""
+    with open(ruta, encoding='utf-8') as archivo:
+        contenido = json.load(archivo)
+    escenarios = contenido if isinstance(contenido, list) else [contenido]
+    base = os.path.dirname(os.path.abspath(ruta))
+    nombre_archivo = os.path.splitext(os.path.basename(ruta))[0]
+    for i, escenario in enumerate(escenarios):
+        if not isinstance(escenario, dict):
+            raise ValueError(f"Escenario inválido en {ruta}: se esperaba un objeto JSON")
+        escenario.setdefault('nombre', nombre_archivo if len(escenarios) == 1 else f"{nombre_archivo}_{i}")
+        escenario['_base'] = base
+    return escenarios
+
+
+def _opciones(
+    escenario: Dict[str, Any],
+    clave: str,
+    funcion: Optional[Callable[..., Any]],
+    reservados: Sequence[str] = ()
+) -> Optional[Dict[str, Any]]:
+    """Parámetros de una clave opcional (true o un objeto); None si está desactivada"""
+    valor = escenario.get(clave, False)
+    if not valor:
+        return None
+    if funcion is None:
+        raise ValueError(f"'{clave}' no está disponible con esta estrategia")
+    if valor is True:
+        return {}
+    if not isinstance(valor, dict):
+        raise ValueError(f"'{clave}' debe ser true o un objeto con parámetros")
+    desconocidos = set(valor) & set(reservados)
+    try:
+        if desconocidos:
+            raise TypeError(f"no se puede indicar {', '.join(sorted(desconocidos))}")
+        inspect.signature(funcion).bind_partial(**valor)
+    except TypeError as error:
+        raise ValueError(f"Parámetros inválidos en '{clave}': {error}") from None
+    return valor
+
+
+def ejecutar_escenario(escenario: Dict[str, Any]) -> Dict[str, Any]:
+    """Calcula ruta, MST, resumen y (opcionalmente) plan de dulces de un escenario"""
+    comienzo = time.perf_counter()
+    base = escenario.get('_base', os.getcwd())
+    ruta_red = RUTA_RED_CARRETERAS
+    if 'red_carreteras' in escenario:  # null desactiva la red
+        ruta_red = _ruta_relativa(escenario['red_carreteras'], base)
+    if escenario.get('estados'):
+        repositorio: DataRepository = ArchivoDataRepository(
+            _ruta_relativa(escenario['estados'], base),
+            _ruta_relativa(escenario.get('dulces'), base),
+            ruta_red
+        )
+    else:
+        repositorio = DataRepository(ruta_red)
+
+    metrica = metrica_por_nombre(escenario.get('metrica', 'euclidiana'))
+    num_estados = len(repositorio.obtener_estados())
+    estrategia = estrategia_por_nombre(escenario.get('estrategia', 'auto'), num_estados, metrica)
+    refinar = _opciones(escenario, 'refinar', MejoradorRuta, ('metrica',))
+    mejorador = None if refinar is None else MejoradorRuta(metrica=metrica, **refinar)
+    cache = CacheCalculos() if escenario.get('cache', True) else None
+    inicio = escenario.get('inicio')
+    if inicio is not None and not isinstance(inicio, str):
+        raise ValueError("'inicio' debe ser el nombre de un estado")
+
+    controller = ViajeController(
+        estrategia, mejorador, cache=cache, data_repository=repositorio, inicio=inicio
+    )
+    ruta = controller.viaje.ruta_estados
+    nombres = ruta.nombres() if hasattr(ruta, 'nombres') else [estado.nombre for estado in ruta]
+    resultado: Dict[str, Any] = {
+        'nombre': escenario['nombre'],
+        'estrategia': type(estrategia).__name__,
+        'metrica': metrica.nombre,
+        'num_estados': num_estados,
+        'inicio': nombres[0] if nombres else None,
+        'peso_mst': controller.graph_strategy.obtener_peso_total_mst(),
+        'longitud_ruta_inicial': controller.longitud_ruta_inicial,
+        'longitud_ruta': controller.longitud_ruta,
+        'ruta': nombres,
+    }
+    buscar = getattr(controller.graph_strategy, 'calcular_ruta_multiinicio', None)
+    multiinicio = _opciones(escenario, 'multiinicio', buscar, ('estados',))
+    if multiinicio is not None:
+        _, busqueda = buscar(controller.estados, **multiinicio)
+        nombres_grafo = controller.graph_strategy.nombres
+        resultado['multiinicio'] = {
+            'inicio': nombres_grafo[busqueda.inicio],
+            'heuristica': busqueda.heuristica,
+            'longitud': busqueda.longitud,
+            'evaluadas': busqueda.evaluadas,
+            'tiempo_s': busqueda.tiempo_s,
+            'ruta': [nombres_grafo[i] for i in busqueda.ruta.tolist()],
+            'tabla': [
+                {'inicio': nombres_grafo[inicio], 'heuristica': heuristica, 'longitud': longitud}
+                for inicio, heuristica, longitud in busqueda.tabla
+            ],
+        }
+    if escenario.get('plan'):
+        dulces = controller.obtener_dulces_disponibles()
+        plan = controller.sugerir_plan(escenario['plan'])
+        resultado['plan'] = {
+            'objetivo': plan.objetivo,
+            'peso_total': plan.peso_total,
+            'variedad': plan.variedad,
+            'selecciones': [
+                {'estado': estado, 'dulces': [dulces[i].nombre for i in seleccion]}
+                for estado, seleccion in zip(nombres, plan.selecciones)
+            ],
+        }
+    resultado['tiempo_s'] = time.perf_counter() - comienzo
+    return resultado
+
+
+def _ejecutar_seguro(escenario: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        return ejecutar_escenario(escenario)
+    except (OSError, TypeError, ValueError) as error:
+        # Un escenario mal formado no interrumpe el lote
+        return {'nombre': escenario.get('nombre'), 'error': str(error)}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Calcula rutas y resúmenes de escenarios sin interfaz gráfica")
+    parser.add_argument('escenarios', nargs='+', help="Archivos JSON de escenario")
+    parser.add_argument('--salida', help="Directorio donde escribir <nombre>.json por escenario")
+    parser.add_argument('--procesos', type=int, default=1, help="Escenarios en paralelo (procesos)")
+    args = parser.parse_args(argv)
+
+    escenarios = [escenario for ruta in args.escenarios for escenario in cargar_escenarios(ruta)]
+    if args.procesos > 1 and len(escenarios) > 1:
+        with ProcessPoolExecutor(max_workers=args.procesos) as pool:
+            resultados = list(pool.map(_ejecutar_seguro, escenarios))
+    else:
+        resultados = [_ejecutar_seguro(escenario) for escenario in escenarios]
+
+    if args.salida:
+        os.makedirs(args.salida, exist_ok=True)
+        for resultado in resultados:
+            with open(os.path.join(args.salida, f"{resultado['nombre']}.json"), 'w', encoding='utf-8') as archivo:
+                json.dump(resultado, archivo, ensure_ascii=False, indent=2)
+    else:
+        json.dump(resultados, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write('\n')
+
+    for resultado in resultados:
+        if 'error' in resultado:
+            print(f"Error en {resultado['nombre']}: {resultado['error']}", file=sys.stderr)
+    return 1 if any('error' in resultado for resultado in resultados) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
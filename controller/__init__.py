@@ -1,4 +1,10 @@
 # En controllers/__init__.py
 from .viaje_controller import ViajeController
+from .tareas import TareaRuta, CalculoCancelado
+from .sesiones import InstantaneaRuta, AlmacenSesiones, SesionNoEncontrada
+from .servicio import ServicioViajes
 
-__all__ = ['ViajeController']  # Controla qué se exporta con import *
\ No newline at end of file
+__all__ = [
+    'ViajeController', 'TareaRuta', 'CalculoCancelado',
+    'InstantaneaRuta', 'AlmacenSesiones', 'SesionNoEncontrada', 'ServicioViajes'
+]  # Controla qué se exporta con import *
\ No newline at end of file
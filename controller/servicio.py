@@ -0,0 +1,190 @@
+"""Operaciones del viaje por sesión, expuestas como JSON-RPC 2.0.
+
+`ServicioViajes` no hace E/S: `procesar` recibe el texto de una petición
+(o de un lote) y devuelve el de la respuesta. El transporte asíncrono está
+en `servidor.py`.
+"""
+import inspect
+import json
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from .sesiones import AlmacenSesiones, InstantaneaRuta, SesionNoEncontrada
+from .viaje_controller import ViajeController
+
+# Códigos de error de JSON-RPC 2.0 y propios del servicio
+ERROR_SINTAXIS = -32700
+ERROR_PETICION = -32600
+ERROR_METODO = -32601
+ERROR_PARAMETROS = -32602
+ERROR_INTERNO = -32603
+ERROR_VIAJE = -32000
+ERROR_SESION = -32001
+
+
+class ErrorRPC(Exception):
+    def __init__(self, codigo: int, mensaje: str):
+        super().__init__(mensaje)
+        self.codigo = codigo
+        self.mensaje = mensaje
+
+
+class ServicioViajes:
+    """Sesiones de viaje sobre una ruta compartida.
+
+    Métodos: crear_sesion, cerrar_sesion, dulces, estado_actual, validar,
+    confirmar, avanzar, resumen y estadisticas. Los que actúan sobre un
+    viaje reciben `sesion`; `validar` y `confirmar` además `dulces`
+    (índices del catálogo).
+    """
+    METODOS = (
+        'crear_sesion', 'cerrar_sesion', 'dulces', 'estado_actual', 'validar',
+        'confirmar', 'avanzar', 'resumen', 'estadisticas'
+    )
+
+    def __init__(
+        self,
+        instantanea: InstantaneaRuta,
+        almacen: Optional[AlmacenSesiones[ViajeController]] = None
+    ):
+        self.instantanea = instantanea
+        self.almacen: AlmacenSesiones[ViajeController] = almacen or AlmacenSesiones()
+        self._dulces: Optional[List[Dict[str, Any]]] = None
+        self._metodos: Dict[str, Callable[..., Any]] = {
+            nombre: getattr(self, nombre) for nombre in self.METODOS
+        }
+        self._firmas = {nombre: inspect.signature(metodo) for nombre, metodo in self._metodos.items()}
+
+    # Operaciones
+    def crear_sesion(self) -> Dict[str, Any]:
+        controller = self.instantanea.nueva_sesion()
+        sesion = self.almacen.crear(controller)
+        return {'sesion': sesion, **self._estado(controller)}
+
+    def cerrar_sesion(self, sesion: str) -> bool:
+        return self.almacen.cerrar(sesion)
+
+    def dulces(self) -> List[Dict[str, Any]]:
+        """Catálogo de dulces (igual para todas las sesiones)"""
+        if self._dulces is None:
+            self._dulces = [
+                {'indice': i, 'nombre': dulce.nombre, 'peso': dulce.peso}
+                for i, dulce in enumerate(self.instantanea.dulces)
+            ]
+        return self._dulces
+
+    def estado_actual(self, sesion: str) -> Dict[str, Any]:
+        return self._estado(self._sesion(sesion))
+
+    def validar(self, sesion: str, dulces: Sequence[int]) -> Dict[str, Any]:
+        controller = self._sesion(sesion)
+        valida, mensaje = controller.validar_seleccion_dulces(self._indices(dulces))
+        return {'valida': valida, 'mensaje': mensaje}
+
+    def confirmar(self, sesion: str, dulces: Sequence[int]) -> Dict[str, Any]:
+        controller = self._sesion(sesion)
+        indices = self._indices(dulces)
+        valida, mensaje = controller.validar_seleccion_dulces(indices)
+        if valida:
+            controller.confirmar_seleccion_dulces(indices)
+        return {'confirmada': valida, 'mensaje': mensaje, **self._estado(controller)}
+
+    def avanzar(self, sesion: str) -> Dict[str, Any]:
+        controller = self._sesion(sesion)
+        avanzado = controller.avanzar_siguiente_estado()
+        return {'avanzado': avanzado, **self._estado(controller)}
+
+    def resumen(self, sesion: str) -> Dict[str, Any]:
+        controller = self._sesion(sesion)
+        visitados = {
+            nombre: [dulce.nombre for dulce in seleccion.dulces_seleccionados]
+            for nombre, seleccion in controller.viaje.estados_visitados.items()
+        }
+        return {**controller.obtener_resumen_final(), 'visitados': visitados}
+
+    def estadisticas(self) -> Dict[str, Any]:
+        return {**self.almacen.estadisticas(), 'paradas': len(self.instantanea.ruta)}
+
+    def _sesion(self, sesion: str) -> ViajeController:
+        if not isinstance(sesion, str):
+            raise ErrorRPC(ERROR_PARAMETROS, "`sesion` debe ser una cadena")
+        return self.almacen.obtener(sesion)
+
+    @staticmethod
+    def _indices(dulces: Sequence[int]) -> List[int]:
+        """Solo comprueba el tipo; el rango y los repetidos los valida el controlador"""
+        if not isinstance(dulces, list) or not all(
+            isinstance(i, int) and not isinstance(i, bool) for i in dulces
+        ):
+            raise ErrorRPC(ERROR_PARAMETROS, "`dulces` debe ser una lista de índices enteros")
+        return dulces
+
+    @staticmethod
+    def _estado(controller: ViajeController) -> Dict[str, Any]:
+        viaje = controller.viaje
+        estado = viaje.estado_actual
+        return {
+            'estado': estado.nombre if estado is not None else None,
+            'parada': viaje.estado_actual_index + 1,
+            'total_paradas': len(viaje.ruta_estados),
+            'completado': viaje.viaje_completado,
+            'confirmado': estado is not None and estado.nombre in viaje.estados_visitados,
+            'peso_total': viaje.peso_total,
+            'peso_maximo': viaje.peso_maximo,
+            'hay_seleccion_factible': controller.hay_seleccion_factible(),
+        }
+
+    # JSON-RPC
+    def procesar(self, texto: str | bytes) -> Optional[str]:
+        """Respuesta JSON a una petición o lote; None si todo eran notificaciones"""
+        try:
+            mensaje = json.loads(texto)
+        except (ValueError, UnicodeDecodeError):
+            return json.dumps(_error(None, ERROR_SINTAXIS, "JSON inválido"))
+        if isinstance(mensaje, list):
+            if not mensaje:
+                return json.dumps(_error(None, ERROR_PETICION, "Lote vacío"))
+            respuestas = [r for r in map(self.despachar, mensaje) if r is not None]
+            return json.dumps(respuestas, ensure_ascii=False) if respuestas else None
+        respuesta = self.despachar(mensaje)
+        return json.dumps(respuesta, ensure_ascii=False) if respuesta is not None else None
+
+    def despachar(self, mensaje: Any) -> Optional[Dict[str, Any]]:
+        """Ejecuta una petición ya decodificada; las notificaciones (sin id) no tienen respuesta"""
+        if not isinstance(mensaje, dict) or mensaje.get('jsonrpc') != '2.0' \
+                or not isinstance(mensaje.get('method'), str):
+            identificador = mensaje.get('id') if isinstance(mensaje, dict) else None
+            return _error(identificador, ERROR_PETICION, "Petición JSON-RPC 2.0 inválida")
+        identificador = mensaje.get('id')
+        es_notificacion = 'id' not in mensaje
+        try:
+            resultado = self._llamar(mensaje['method'], mensaje.get('params', {}))
+        except ErrorRPC as error:
+            respuesta = _error(identificador, error.codigo, error.mensaje)
+        except SesionNoEncontrada as error:
+            respuesta = _error(identificador, ERROR_SESION, str(error))
+        except ValueError as error:
+            respuesta = _error(identificador, ERROR_VIAJE, str(error))
+        except Exception as error:  # El servicio sigue atendiendo a las demás sesiones
+            respuesta = _error(identificador, ERROR_INTERNO, f"Error interno: {error}")
+        else:
+            respuesta = {'jsonrpc': '2.0', 'id': identificador, 'result': resultado}
+        return None if es_notificacion else respuesta
+
+    def _llamar(self, metodo: str, parametros: Any) -> Any:
+        funcion = self._metodos.get(metodo)
+        if funcion is None:
+            raise ErrorRPC(ERROR_METODO, f"Método desconocido: {metodo}")
+        if isinstance(parametros, list):
+            args, kwargs = parametros, {}
+        elif isinstance(parametros, dict):
+            args, kwargs = [], parametros
+        else:
+            raise ErrorRPC(ERROR_PARAMETROS, "`params` debe ser una lista o un objeto")
+        try:
+            self._firmas[metodo].bind(*args, **kwargs)
+        except TypeError as error:
+            raise ErrorRPC(ERROR_PARAMETROS, f"Parámetros inválidos para {metodo}: {error}")
+        return funcion(*args, **kwargs)
+
+
+def _error(identificador: Any, codigo: int, mensaje: str) -> Dict[str, Any]:
+    return {'jsonrpc': '2.0', 'id': identificador, 'error': {'code': codigo, 'message': mensaje}}
@@ -0,0 +1,158 @@
+"""Sesiones de viaje que comparten una misma ruta calculada.
+
+`InstantaneaRuta` guarda de una vez el grafo, la ruta y los catálogos (de
+solo lectura); cada sesión es un `ViajeController` ligero creado sobre ella,
+con su propio `Viaje` como único estado. `AlmacenSesiones` las guarda en
+memoria con expiración por inactividad y desalojo LRU.
+"""
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Dict, Generic, Mapping, Sequence, Tuple, TypeVar
+import numpy as np
+from models import Dulce, Estado, RutaEstados
+from service import GraphStrategy, IndiceSeleccionDulces, PlanificadorDulces
+from .viaje_controller import ViajeController
+
+# Inactividad tras la que una sesión expira y máximo de sesiones vivas
+TTL_SESIONES_S = 30 * 60.0
+MAXIMO_SESIONES = 10_000
+
+T = TypeVar('T')
+
+
+class SesionNoEncontrada(LookupError):
+    """La sesión no existe, expiró o fue desalojada"""
+
+
+@dataclass(frozen=True)
+class InstantaneaRuta:
+    """Ruta calculada y catálogos compartidos por todas las sesiones (solo lectura)"""
+    graph_strategy: GraphStrategy
+    estados: Mapping[str, Estado]
+    dulces: Sequence[Dulce]
+    indice_dulces: IndiceSeleccionDulces
+    planificador: PlanificadorDulces
+    ruta: Sequence[Estado]
+    longitud_ruta_inicial: float
+    longitud_ruta: float
+
+    @classmethod
+    def desde_controlador(cls, controller: ViajeController) -> "InstantaneaRuta":
+        """Congela la ruta ya calculada de `controller`"""
+        if len(controller.viaje.ruta_estados) == 0:
+            raise ValueError("El controlador no tiene una ruta calculada")
+        estados = controller.estados
+        if isinstance(estados, dict):
+            estados = MappingProxyType(estados)
+        ruta = controller.viaje.ruta_estados
+        if isinstance(ruta, RutaEstados):
+            indices = np.array(ruta.indices, dtype=np.int64)
+            indices.setflags(write=False)
+            ruta = RutaEstados(indices, list(controller.graph_strategy.nombres), estados)
+        else:
+            ruta = tuple(ruta)
+        return cls(
+            graph_strategy=controller.graph_strategy,
+            estados=estados,
+            dulces=controller.dulces_disponibles,
+            indice_dulces=controller.indice_dulces,
+            planificador=PlanificadorDulces(controller.dulces_disponibles),
+            ruta=ruta,
+            longitud_ruta_inicial=controller.longitud_ruta_inicial,
+            longitud_ruta=controller.longitud_ruta
+        )
+
+    def nueva_sesion(self) -> ViajeController:
+        """Controlador con un viaje nuevo sobre esta ruta; no recalcula nada.
+
+        La estrategia, los estados y la ruta son compartidos: agregar, quitar
+        o mover estados en la sesión lanza ValueError.
+        """
+        return ViajeController(instantanea=self)
+
+
+class AlmacenSesiones(Generic[T]):
+    """Sesiones en memoria con expiración por inactividad (TTL) y desalojo LRU.
+
+    El diccionario está en orden de último acceso, así que la sesión más
+    antigua siempre está al frente: purgar las expiradas y desalojar la
+    menos usada solo miran el frente y cada operación es O(1) amortizado.
+    """
+
+    def __init__(
+        self,
+        ttl_s: float = TTL_SESIONES_S,
+        maximo: int = MAXIMO_SESIONES,
+        reloj: Callable[[], float] = time.monotonic
+    ):
+        if ttl_s <= 0 or maximo < 1:
+            raise ValueError("El TTL y el máximo de sesiones deben ser positivos")
+        self.ttl_s = ttl_s
+        self.maximo = maximo
+        self._reloj = reloj
+        self._sesiones: "OrderedDict[str, Tuple[T, float]]" = OrderedDict()
+        self.creadas = 0
+        self.expiradas = 0
+        self.desalojadas = 0
+
+    def __len__(self) -> int:
+        return len(self._sesiones)
+
+    def __contains__(self, sesion: object) -> bool:
+        return sesion in self._sesiones
+
+    def crear(self, valor: T) -> str:
+        """Guarda `valor` en una sesión nueva y devuelve su identificador"""
+        ahora = self._reloj()
+        self._purgar(ahora)
+        while len(self._sesiones) >= self.maximo:
+            self._sesiones.popitem(last=False)
+            self.desalojadas += 1
+        sesion = secrets.token_urlsafe(12)
+        self._sesiones[sesion] = (valor, ahora)
+        self.creadas += 1
+        return sesion
+
+    def obtener(self, sesion: str) -> T:
+        """Valor de la sesión; renueva su TTL y la marca como la más reciente"""
+        ahora = self._reloj()
+        entrada = self._sesiones.get(sesion)
+        if entrada is None:
+            raise SesionNoEncontrada(f"Sesión desconocida o expirada: {sesion}")
+        valor, ultimo_acceso = entrada
+        if ahora - ultimo_acceso > self.ttl_s:
+            del self._sesiones[sesion]
+            self.expiradas += 1
+            raise SesionNoEncontrada(f"Sesión desconocida o expirada: {sesion}")
+        self._sesiones[sesion] = (valor, ahora)
+        self._sesiones.move_to_end(sesion)
+        return valor
+
+    def cerrar(self, sesion: str) -> bool:
+        return self._sesiones.pop(sesion, None) is not None
+
+    def purgar(self) -> int:
+        """Elimina las sesiones expiradas; devuelve cuántas"""
+        return self._purgar(self._reloj())
+
+    def _purgar(self, ahora: float) -> int:
+        eliminadas = 0
+        while self._sesiones:
+            sesion, (_, ultimo_acceso) = next(iter(self._sesiones.items()))
+            if ahora - ultimo_acceso <= self.ttl_s:
+                break
+            del self._sesiones[sesion]
+            eliminadas += 1
+        self.expiradas += eliminadas
+        return eliminadas
+
+    def estadisticas(self) -> Dict[str, int]:
+        return {
+            'activas': len(self._sesiones),
+            'creadas': self.creadas,
+            'expiradas': self.expiradas,
+            'desalojadas': self.desalojadas,
+        }
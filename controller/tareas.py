@@ -0,0 +1,43 @@
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+# Recibe (etapa, fracción completada entre 0 y 1)
+CallbackProgreso = Callable[[str, float], None]
+
+
+class CalculoCancelado(Exception):
+    """El cálculo se detuvo porque se solicitó su cancelación"""
+
+
+class TareaRuta:
+    """Cálculo de ruta en segundo plano: un Future más una señal de cancelación.
+
+    La cancelación es cooperativa: el trabajo se detiene al terminar la etapa
+    en curso (cierre métrico, MST, refinamiento) y el Future termina con
+    `CalculoCancelado`.
+    """
+
+    def __init__(self, future: "Future[Any]", evento_cancelacion: threading.Event):
+        self.future = future
+        self._evento_cancelacion = evento_cancelacion
+
+    def cancelar(self):
+        self._evento_cancelacion.set()
+        self.future.cancel()  # Solo surte efecto si aún no empezó
+
+    @property
+    def cancelada(self) -> bool:
+        return self._evento_cancelacion.is_set()
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def resultado(self, timeout: Optional[float] = None) -> Any:
+        return self.future.result(timeout)
+
+    def error(self) -> Optional[BaseException]:
+        """Excepción del cálculo (None si terminó bien); solo válido con `done()`"""
+        if self.future.cancelled():
+            return CalculoCancelado()
+        return self.future.exception()
@@ -1,29 +1,260 @@
-from typing import List, Optional, Dict, Tuple, Union
-from networkx import Graph
-from models import Viaje, EstadoViaje
+import copy
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Iterator, List, Mapping, Optional, Dict, Sequence, Tuple, TYPE_CHECKING
+import numpy as np
+from models import Viaje, EstadoViaje, RutaEstados
 from models import Estado, Dulce
-from repositories import DataRepository
-from service import GraphStrategy, KruskalGraphStrategy  # Cambiado de 'service'
+from repositories import DataRepository, CacheCalculos
+from service import (
+    GraphStrategy, IndiceSeleccionDulces, MejoradorRuta, PlanDulces, PlanificadorDulces,
+    longitud_ruta, resolver_inicio, seleccionar_estrategia
+)
+from service.cierre_metrico import cierre_metrico
+from .tareas import CalculoCancelado, CallbackProgreso, TareaRuta
+
+if TYPE_CHECKING:
+    from .sesiones import InstantaneaRuta
+
+
+class VistaGrafos(Mapping[str, Any]):
+    """Acceso perezoso a los grafos de la estrategia.
+
+    Los arreglos ('arbol', 'coordenadas') se devuelven tal cual; las vistas
+    de networkx solo se construyen cuando se leen sus claves.
+    """
+    CLAVES = ('grafo_completo', 'mst_grafo', 'pos_estados', 'arbol', 'coordenadas')
+    
+    def __init__(self, graph_strategy: GraphStrategy):
+        self._graph_strategy = graph_strategy
+    
+    def __getitem__(self, clave: str) -> Any:
+        if clave not in self.CLAVES:
+            raise KeyError(clave)
+        return getattr(self._graph_strategy, clave, None)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.CLAVES)
+    
+    def __len__(self) -> int:
+        return len(self.CLAVES)
 
 
 class ViajeController:
     """Controlador principal para la lógica del viaje"""
     
-    def __init__(self, graph_strategy: Optional[GraphStrategy] = None):
-        self.data_repository = DataRepository()
-        self.graph_strategy = graph_strategy or KruskalGraphStrategy()  # Valor por defecto
+    def __init__(
+        self,
+        graph_strategy: Optional[GraphStrategy] = None,
+        mejorador_ruta: Optional[MejoradorRuta] = None,
+        cache: Optional[CacheCalculos] = None,
+        data_repository: Optional[DataRepository] = None,
+        calcular_al_iniciar: bool = True,
+        instantanea: Optional["InstantaneaRuta"] = None,
+        inicio: Optional[str] = None
+    ):
+        # Repositorio en memoria por defecto; ArchivoDataRepository para catálogos grandes
+        self.data_repository = data_repository or DataRepository()
+        self.mejorador_ruta = mejorador_ruta  # Etapa opcional de 2-opt / Or-opt
+        self.cache = cache  # Caché en disco opcional de distancias, MST y ruta
+        self.inicio = inicio  # Estado de partida; None: ESTADO_INICIAL o el primero del catálogo
+        self.longitud_ruta_inicial = 0.0
+        self.longitud_ruta = 0.0
         self.viaje = Viaje()
+        self._ejecutor: Optional[Executor] = None
+        self._posiciones_ruta: Optional[Dict[str, int]] = None
+        self._compartida = instantanea is not None
+        if instantanea is not None:
+            # Sesión sobre una ruta ya calculada: no se recalcula ni se copia nada
+            self._usar_instantanea(instantanea)
+            return
         self.estados = self.data_repository.obtener_estados()
         self.dulces_disponibles = self.data_repository.obtener_dulces()
-        self._inicializar_viaje()
+        self.indice_dulces = IndiceSeleccionDulces(self.dulces_disponibles)
+        self._planificador: Optional[PlanificadorDulces] = None
+        # Por defecto se usa el motor más rápido para el tamaño del conjunto
+        self.graph_strategy = graph_strategy or seleccionar_estrategia(len(self.estados))
+        # Sin cálculo inicial, la ruta se obtiene con `iniciar_calculo_ruta`
+        if calcular_al_iniciar:
+            self._inicializar_viaje()
+    
+    def _usar_instantanea(self, instantanea: "InstantaneaRuta"):
+        self.estados = instantanea.estados
+        self.dulces_disponibles = instantanea.dulces
+        self.indice_dulces = instantanea.indice_dulces
+        self._planificador = instantanea.planificador
+        self.graph_strategy = instantanea.graph_strategy
+        self.longitud_ruta_inicial = instantanea.longitud_ruta_inicial
+        self.longitud_ruta = instantanea.longitud_ruta
+        self.viaje.ruta_estados = instantanea.ruta
+    
+    def iniciar_calculo_ruta(
+        self,
+        progreso: Optional[CallbackProgreso] = None,
+        ejecutor: Optional[Executor] = None
+    ) -> TareaRuta:
+        """Calcula la ruta en un hilo de trabajo y devuelve la tarea sin bloquear.
+        
+        `progreso` se invoca desde ese hilo: la interfaz debe reenviarlo a su
+        propio hilo (p. ej. con una cola que sondea `root.after`). El viaje no
+        cambia hasta que el cálculo termina.
+        """
+        if ejecutor is None:
+            if self._ejecutor is None:
+                self._ejecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ruta')
+            ejecutor = self._ejecutor
+        cancelacion = threading.Event()
+        future = ejecutor.submit(self._inicializar_viaje, progreso, cancelacion.is_set)
+        return TareaRuta(future, cancelacion)
     
-    def _inicializar_viaje(self):
+    def _inicializar_viaje(
+        self,
+        progreso: Optional[CallbackProgreso] = None,
+        cancelado: Optional[Any] = None
+    ):
         """Inicializa el viaje con la ruta calculada"""
         if not self.graph_strategy:
             raise ValueError("Estrategia de grafo no proporcionada")
         
-        _, ruta = self.graph_strategy.calcular_ruta(self.estados)
+        def avanzar(etapa: str, fraccion: float):
+            if cancelado is not None and cancelado():
+                raise CalculoCancelado()
+            if progreso is not None:
+                progreso(etapa, fraccion)
+        
+        # Se calcula sobre una copia: si se cancela, la estrategia queda intacta
+        estrategia = copy.copy(self.graph_strategy)
+        
+        # Con red de carreteras, las estrategias usan distancias por carretera
+        avanzar('red de carreteras', 0.0)
+        red = self.data_repository.obtener_red_carreteras()
+        if red is not None and hasattr(estrategia, 'establecer_distancias'):
+            nombres = list(self.estados.keys())
+            estrategia.establecer_distancias(
+                nombres, cierre_metrico(red, nombres, cache=self.cache)
+            )
+        
+        avanzar('árbol de expansión mínima', 0.2)
+        ruta = self._calcular_ruta_con_cache(estrategia, red)
+        coordenadas_estrategia = getattr(estrategia, 'coordenadas', None)
+        if isinstance(ruta, RutaEstados) and coordenadas_estrategia is not None:
+            # Sin materializar los Estado de la ruta (catálogos grandes)
+            coordenadas = coordenadas_estrategia[np.asarray(ruta.indices, dtype=np.int64)]
+        else:
+            coordenadas = np.array([estado.coordenadas for estado in ruta], dtype=np.float64)
+        orden = np.arange(len(ruta))
+        metrica = getattr(estrategia, 'metrica', None)
+        longitud_inicial = longitud_final = longitud_ruta(coordenadas, orden, metrica)
+        
+        if self.mejorador_ruta is not None and len(ruta) > 0:
+            avanzar('refinamiento de la ruta', 0.8)
+            resultado = self.mejorador_ruta.mejorar(coordenadas, orden)
+            longitud_final = resultado.longitud_final
+            if isinstance(ruta, RutaEstados):
+                ruta = ruta.reordenada(resultado.ruta.tolist())
+            else:
+                ruta = [ruta[i] for i in resultado.ruta.tolist()]
+        
+        avanzar('listo', 1.0)
+        # Las estrategias solo reasignan atributos: se copian de vuelta y se conserva la identidad
+        vars(self.graph_strategy).update(vars(estrategia))
+        self.longitud_ruta_inicial = longitud_inicial
+        self.longitud_ruta = longitud_final
         self.viaje.ruta_estados = ruta
+        self._posiciones_ruta = None
+    
+    def _calcular_ruta_con_cache(self, estrategia: GraphStrategy, red) -> Any:
+        """Calcula la ruta, o la restaura de la caché si los datos no cambiaron"""
+        inicio = resolver_inicio(self.estados, self.inicio)
+        if self.cache is None or not hasattr(estrategia, 'exportar_resultado'):
+            return estrategia.calcular_ruta(self.estados, inicio)[1]
+        
+        clave = self.cache.clave(
+            'ruta', self.data_repository.huella_datos(red), estrategia.identificador(), inicio
+        )
+        datos = self.cache.cargar(clave)
+        if datos is not None:
+            try:
+                return estrategia.restaurar_resultado(self.estados, datos)
+            except (KeyError, ValueError):
+                self.cache.invalidar(clave)
+        
+        _, ruta = estrategia.calcular_ruta(self.estados, inicio)
+        self.cache.guardar(clave, estrategia.exportar_resultado())
+        return ruta
+    
+    # Cambios del conjunto de estados: MST incremental y reparación local de la ruta
+    def agregar_estado(self, nombre: str, coordenadas: Tuple[float, float]):
+        """Agrega un estado; entra en la ruta después del estado actual"""
+        self._exigir_ruta_propia()
+        if nombre in self.estados:
+            raise ValueError(f"El estado ya existe: {nombre}")
+        fijas, ruta, previas = self._ruta_a_reparar()
+        estados = self._estados_modificables()
+        estados[nombre] = Estado(nombre, tuple(coordenadas))
+        self._aplicar_ruta(self.graph_strategy.insertar_estado(estados, nombre, fijas, ruta), previas)
+    
+    def eliminar_estado(self, nombre: str):
+        """Quita un estado pendiente (los visitados y el actual no se pueden quitar)"""
+        self._exigir_ruta_propia()
+        if nombre not in self.estados:
+            raise ValueError(f"Estado desconocido: {nombre}")
+        fijas, ruta, previas = self._ruta_a_reparar()
+        estados = self._estados_modificables()
+        anterior = estados.pop(nombre)
+        try:
+            reparada = self.graph_strategy.eliminar_estado(estados, nombre, fijas, ruta)
+        except ValueError:
+            estados[nombre] = anterior
+            raise
+        self._aplicar_ruta(reparada, previas)
+    
+    def mover_estado(self, nombre: str, coordenadas: Tuple[float, float]):
+        """Cambia las coordenadas de un estado; si está pendiente se reubica en la ruta"""
+        self._exigir_ruta_propia()
+        if nombre not in self.estados:
+            raise ValueError(f"Estado desconocido: {nombre}")
+        fijas, ruta, previas = self._ruta_a_reparar()
+        estados = self._estados_modificables()
+        estados[nombre] = Estado(nombre, tuple(coordenadas))
+        self._aplicar_ruta(self.graph_strategy.mover_estado(estados, nombre, fijas, ruta), previas)
+    
+    def _exigir_ruta_propia(self):
+        # Con una instantánea, estrategia, estados y ruta son de todas las sesiones
+        if self._compartida:
+            raise ValueError("Una sesión sobre una ruta compartida no puede cambiar los estados")
+    
+    def _estados_modificables(self) -> Dict[str, Estado]:
+        # El catálogo del repositorio es de solo lectura: se copia al primer cambio
+        if not isinstance(self.estados, dict):
+            self.estados = dict(self.estados)
+        return self.estados
+    
+    def _paradas_fijas(self) -> int:
+        """Paradas ya visitadas más la actual: la reparación no las mueve"""
+        return self.viaje.estado_actual_index + 1
+    
+    def _ruta_a_reparar(self) -> Tuple[int, np.ndarray, List[str]]:
+        """Paradas fijas, índices de la ruta que sigue el viaje (ya refinada) y nombres fijos"""
+        fijas = self._paradas_fijas()
+        ruta = self.viaje.ruta_estados
+        if isinstance(ruta, RutaEstados):
+            indices = np.asarray(ruta.indices, dtype=np.int64)
+            nombres = ruta.nombres()
+        else:
+            posiciones = {nombre: i for i, nombre in enumerate(self.graph_strategy.nombres)}
+            nombres = [estado.nombre for estado in ruta]
+            indices = np.array([posiciones[nombre] for nombre in nombres], dtype=np.int64)
+        return fijas, indices, nombres[:fijas]
+    
+    def _aplicar_ruta(self, ruta: RutaEstados, previas: Sequence[str] = ()):
+        if ruta.nombres()[:len(previas)] != list(previas):
+            # Invariante de la reparación local: lo visitado no se reordena
+            raise RuntimeError("La reparación de la ruta cambió paradas ya visitadas")
+        metrica = getattr(self.graph_strategy, 'metrica', None)
+        self.longitud_ruta = longitud_ruta(self.graph_strategy.coordenadas, ruta.indices, metrica)
+        self.viaje.ruta_estados = ruta
+        self._posiciones_ruta = None
     
     def obtener_estado_actual(self) -> Optional[Estado]:
         return self.viaje.estado_actual
@@ -33,15 +264,47 @@ class ViajeController:
             return "¡Viaje Completado!"
         return f"Progreso: {self.viaje.estado_actual_index + 1}/{len(self.viaje.ruta_estados)}"
     
+    def posicion_en_ruta(self, nombre: str) -> Optional[int]:
+        """Parada (desde 0) del estado en la ruta; el mapa se arma una sola vez"""
+        if self._posiciones_ruta is None:
+            ruta = self.viaje.ruta_estados
+            nombres = ruta.nombres() if hasattr(ruta, 'nombres') else [estado.nombre for estado in ruta]
+            self._posiciones_ruta = {nombre: i for i, nombre in enumerate(nombres)}
+        return self._posiciones_ruta.get(nombre)
+    
+    def describir_estado(self, nombre: str) -> str:
+        """Resumen de un estado para el mapa: parada en la ruta y dulces elegidos"""
+        posicion = self.posicion_en_ruta(nombre)
+        if posicion is None:
+            return f"{nombre}\nFuera de la ruta"
+        if posicion == self.viaje.estado_actual_index:
+            situacion = "estado actual"
+        elif posicion < self.viaje.estado_actual_index:
+            situacion = "visitado"
+        else:
+            situacion = "pendiente"
+        lineas = [nombre, f"Parada {posicion + 1}/{len(self.viaje.ruta_estados)} ({situacion})"]
+        seleccion = self.viaje.estados_visitados.get(nombre)
+        if seleccion is not None:
+            lineas.append(", ".join(dulce.nombre for dulce in seleccion.dulces_seleccionados))
+            lineas.append(f"{seleccion.peso_dulces:.1f} kg")
+        return "\n".join(lineas)
+    
     def obtener_peso_info(self) -> str:
         return f"Peso actual: {self.viaje.peso_total:.1f} kg / {self.viaje.peso_maximo} kg"
     
-    def obtener_dulces_disponibles(self) -> List[Dulce]:
+    def obtener_dulces_disponibles(self) -> Sequence[Dulce]:
         return self.dulces_disponibles
     
     def validar_seleccion_dulces(self, indices_seleccionados: List[int]) -> Tuple[bool, str]:
         if len(indices_seleccionados) != 3:
             return False, "Debes seleccionar exactamente 3 dulces."
+        total = len(self.dulces_disponibles)
+        if not all(0 <= i < total for i in indices_seleccionados):
+            return False, f"Los índices de dulces deben estar entre 0 y {total - 1}."
+        # El índice de selecciones y el planificador cuentan dulces distintos
+        if len(set(indices_seleccionados)) != len(indices_seleccionados):
+            return False, "Debes seleccionar 3 dulces distintos."
         
         dulces_seleccionados = [self.dulces_disponibles[i] for i in indices_seleccionados]
         
@@ -54,6 +317,30 @@ class ViajeController:
         
         return True, ""
     
+    def peso_disponible(self) -> float:
+        return self.viaje.peso_maximo - self.viaje.peso_total
+    
+    def hay_seleccion_factible(self) -> bool:
+        """¿Queda alguna combinación de 3 dulces que quepa en el peso restante?"""
+        return self.indice_dulces.hay_seleccion_factible(self.peso_disponible())
+    
+    def obtener_dulces_seleccionables(self, indices_seleccionados: Sequence[int] = ()) -> List[bool]:
+        """Por cada dulce, si aún puede completar una selección válida junto a los ya marcados"""
+        return self.indice_dulces.seleccionables(self.peso_disponible(), indices_seleccionados).tolist()
+    
+    def sugerir_plan(self, objetivo: str = 'peso') -> PlanDulces:
+        """Plan de dulces para los estados que faltan por confirmar, dentro del peso restante.
+        
+        Lanza ValueError si ningún plan cabe.
+        """
+        if self._planificador is None:
+            self._planificador = PlanificadorDulces(self.dulces_disponibles)
+        restantes = len(self.viaje.ruta_estados) - self.viaje.estado_actual_index
+        estado_actual = self.viaje.estado_actual
+        if estado_actual is not None and estado_actual.nombre in self.viaje.estados_visitados:
+            restantes -= 1
+        return self._planificador.planificar(restantes, self.peso_disponible(), objetivo)
+    
     def confirmar_seleccion_dulces(self, indices_seleccionados: List[int]) -> bool:
         es_valida, mensaje = self.validar_seleccion_dulces(indices_seleccionados)
         if not es_valida:
@@ -65,10 +352,17 @@ class ViajeController:
         
         dulces_seleccionados = [self.dulces_disponibles[i] for i in indices_seleccionados]
         estado_viaje = EstadoViaje(estado_actual, dulces_seleccionados)
-        self.viaje.estados_visitados[estado_actual.nombre] = estado_viaje
+        self.viaje.registrar_seleccion(estado_viaje)
         
         return True
     
+    def deshacer_seleccion(self) -> Optional[str]:
+        """Deshace la última selección confirmada; devuelve el estado afectado"""
+        return self.viaje.deshacer()
+    
+    def rehacer_seleccion(self) -> Optional[str]:
+        return self.viaje.rehacer()
+    
     def avanzar_siguiente_estado(self) -> bool:
         if self.viaje.viaje_completado:
             return False
@@ -89,16 +383,14 @@ class ViajeController:
         return {
             'estados_visitados': len(self.viaje.estados_visitados),
             'peso_total': self.viaje.peso_total,
-            'total_dulces': len(self.viaje.estados_visitados) * 3,
-            'peso_mst': self.graph_strategy.obtener_peso_total_mst()
+            'total_dulces': self.viaje.total_dulces,
+            'peso_mst': self.graph_strategy.obtener_peso_total_mst(),
+            'longitud_ruta_inicial': self.longitud_ruta_inicial,
+            'longitud_ruta': self.longitud_ruta
         }
     
-    def obtener_grafos(self) -> Dict[str, Union[Graph, Dict[str, Tuple[float, float]], None]]:
+    def obtener_grafos(self) -> VistaGrafos:
         if not self.graph_strategy:
             raise ValueError("La estrategia de grafo no tiene los atributos esperados")
         
-        return {
-            'grafo_completo': getattr(self.graph_strategy, 'grafo_completo', None),
-            'mst_grafo': getattr(self.graph_strategy, 'mst_grafo', None),
-            'pos_estados': getattr(self.graph_strategy, 'pos_estados', None)
-        }
\ No newline at end of file
+        return VistaGrafos(self.graph_strategy)
\ No newline at end of file
@@ -1,27 +1,109 @@
+# Referencia para medir el arranque: antes de cualquier otra importación
+import time
+_INICIO = time.perf_counter()
+
+import queue
 import tkinter as tk
-from controller import ViajeController
-from views import ViajeView, GraphView
-from service import KruskalGraphStrategy
+from typing import Dict, Optional
+from views import ViajeView
 from utils import PESO_MAXIMO, ESTADO_INICIAL, _DIRECTIONS
 
+# Intervalo (ms) con el que el bucle de eventos revisa el cálculo en segundo plano
+_INTERVALO_SONDEO_MS = 50
+
 class MexicoTravelApp:
-    """Aplicación principal que coordina MVC"""
+    """Aplicación principal que coordina MVC.
+    
+    La ventana se muestra antes de cargar lo pesado: el controlador y
+    GraphView (matplotlib, networkx) se crean en el primer ciclo del bucle de
+    eventos, y la ruta se calcula en un hilo de trabajo cuyo progreso se
+    sondea con `root.after`, así el bucle nunca se bloquea.
+    """
     
     def __init__(self):
         self.root = tk.Tk()
         self._configurar_ventana()
-        
-        # Inicialización con las dependencias
-        self.graph_strategy = KruskalGraphStrategy()
-        self.controller = ViajeController(self.graph_strategy)
+        self.tiempos_arranque: Dict[str, float] = {}
+        self.controller = None
+        self.graph_strategy = None
+        self.graph_view = None
+        self.tarea_ruta = None
+        self._progreso_ruta: "queue.Queue" = queue.Queue()
         self.view = ViajeView(self.root)
+        self.view.habilitar_confirmar(False)
+        self.view.mostrar_carga()
+        self.view.on_cancelar_calculo = self._cancelar_calculo
+        self.view.on_reintentar_calculo = self._iniciar_calculo
+        self.root.bind('<Map>', self._registrar_primer_cuadro, add='+')
+        self.root.after(1, self._cargar_diferido)
+    
+    @property
+    def cargado(self) -> bool:
+        return self.graph_view is not None
+    
+    def _registrar_primer_cuadro(self, _evento=None):
+        self.tiempos_arranque.setdefault('primer_cuadro', time.perf_counter() - _INICIO)
+    
+    def _cargar_diferido(self):
+        """Crea el controlador una vez visible la ventana y lanza el cálculo de la ruta"""
+        from controller import ViajeController
+        from repositories import CacheCalculos
         
+        # Inicialización con las dependencias (el controlador elige el motor de MST)
+        self.controller = ViajeController(cache=CacheCalculos(), calcular_al_iniciar=False)
+        self.graph_strategy = self.controller.graph_strategy
+        self._iniciar_calculo()
+    
+    def _iniciar_calculo(self):
+        """Calcula la ruta en segundo plano; el progreso llega por una cola"""
+        self.view.mostrar_carga()
+        # El callback corre en el hilo de trabajo: solo encola, Tk se toca desde aquí
+        self.tarea_ruta = self.controller.iniciar_calculo_ruta(
+            lambda etapa, fraccion: self._progreso_ruta.put((etapa, fraccion))
+        )
+        self.root.after(_INTERVALO_SONDEO_MS, self._sondear_calculo)
+    
+    def _cancelar_calculo(self):
+        if self.tarea_ruta is not None:
+            self.tarea_ruta.cancelar()
+    
+    def _sondear_calculo(self):
+        """Vacía la cola de progreso y, al terminar el cálculo, completa la vista"""
+        while True:
+            try:
+                etapa, fraccion = self._progreso_ruta.get_nowait()
+            except queue.Empty:
+                break
+            self.view.actualizar_carga(etapa, fraccion)
+        
+        tarea = self.tarea_ruta
+        if not tarea.done():
+            self.root.after(_INTERVALO_SONDEO_MS, self._sondear_calculo)
+            return
+        
+        from controller import CalculoCancelado
+        error = tarea.error()
+        if isinstance(error, CalculoCancelado):
+            self.view.mostrar_carga_interrumpida("Cálculo cancelado")
+            return
+        if error is not None:
+            self.view.mostrar_carga_interrumpida("No se pudo calcular la ruta")
+            self.view.mostrar_mensaje_error("Error al calcular la ruta", str(error))
+            return
+        self._mostrar_ruta_calculada()
+    
+    def _mostrar_ruta_calculada(self):
+        from views import GraphView
+        
+        self.view.ocultar_carga()
         # Corrección 1: Usar el frame correcto para el gráfico
         graph_frame = self.view.obtener_graph_frame()  # Asegúrate que devuelve un Frame válido
     
         self.graph_view = GraphView(graph_frame)
         self._conectar_eventos()
+        self.view.habilitar_confirmar(True)
         self._inicializar_vista()
+        self.tiempos_arranque['listo'] = time.perf_counter() - _INICIO
     
     def _configurar_ventana(self):
         """Configuración básica de la ventana principal"""
@@ -34,6 +116,9 @@ class MexicoTravelApp:
         self.view.on_confirmar_seleccion = self._manejar_confirmacion
         self.view.on_siguiente_estado = self._manejar_siguiente_estado
         self.view.on_mostrar_grafo_completo = self._manejar_grafo_completo
+        self.view.on_cambio_seleccion = self._manejar_cambio_seleccion
+        self.graph_view.on_seleccionar_estado = self._manejar_clic_estado
+        self.graph_view.on_describir_estado = self.controller.describir_estado
     
     def _inicializar_vista(self):
         """Inicializa la vista con los datos iniciales"""
@@ -49,9 +134,15 @@ class MexicoTravelApp:
             self.view.actualizar_progreso(self.controller.obtener_progreso())
             self.view.actualizar_peso(self.controller.obtener_peso_info())
             self.view.cargar_dulces(self.controller.obtener_dulces_disponibles())
+            self._manejar_cambio_seleccion([])
+            if not self.controller.hay_seleccion_factible():
+                self.view.agregar_info_viaje("⚠️ Ninguna combinación de 3 dulces cabe en el peso restante.\n")
             
             grafos = self.controller.obtener_grafos()
-            if grafos and grafos['mst_grafo'] is not None and grafos['pos_estados'] is not None:
+            if grafos and self.graph_view.muestra_mst(grafos['mst_grafo']):
+                # El MST ya está dibujado: solo se mueve el resalte (sin reconstruir posiciones)
+                self.graph_view.resaltar_estado(estado_actual.nombre)
+            elif grafos and grafos['mst_grafo'] is not None and grafos['pos_estados'] is not None:
                 self.graph_view.actualizar_grafo_mst(
                     grafos['mst_grafo'],
                     grafos['pos_estados'],
@@ -71,6 +162,16 @@ class MexicoTravelApp:
         for msg in mensajes:
             self.view.agregar_info_viaje(msg + "\n")
     
+    def _manejar_cambio_seleccion(self, indices_seleccionados):
+        """Atenúa los dulces que ya no pueden completar una selección que quepa"""
+        self.view.actualizar_dulces_seleccionables(
+            self.controller.obtener_dulces_seleccionables(indices_seleccionados)
+        )
+    
+    def _manejar_clic_estado(self, nombre: str):
+        """Clic en un estado del mapa: agrega su resumen a la información del viaje"""
+        self.view.agregar_info_viaje("📍 " + self.controller.describir_estado(nombre).replace("\n", "\n   ") + "\n")
+    
     def _manejar_confirmacion(self, indices_seleccionados):
         """Maneja la confirmación de selección de dulces"""
         valido, mensaje = self.controller.validar_seleccion_dulces(indices_seleccionados)
@@ -107,11 +208,13 @@ class MexicoTravelApp:
         grafos = self.controller.obtener_grafos()
         resumen = self.controller.obtener_resumen_final()
         
-        if grafos and all(key in grafos for key in ['grafo_completo', 'mst_grafo', 'pos_estados']):
+        # Se usan los arreglos: materializar el grafo completo en networkx es O(n²)
+        if grafos and grafos['arbol'] is not None and grafos['coordenadas'] is not None:
+            arbol = grafos['arbol']
             self.graph_view.mostrar_comparacion_grafos(
-                grafos['grafo_completo'],
-                grafos['mst_grafo'],
-                grafos['pos_estados'],
+                grafos['coordenadas'],
+                arbol.nombres,
+                arbol,
                 resumen['peso_mst'] if resumen else 0.0
             )
     
@@ -130,6 +233,10 @@ class MexicoTravelApp:
             self.view.agregar_info_viaje(f"Estados visitados: {resumen['estados_visitados']}\n")
             self.view.agregar_info_viaje(f"Peso total: {resumen['peso_total']:.1f} kg\n")
             self.view.agregar_info_viaje(f"Total dulces: {resumen['total_dulces']}\n")
+            longitud = f"Longitud de la ruta: {resumen['longitud_ruta']:.1f}"
+            if self.controller.mejorador_ruta is not None:
+                longitud += f" (sin refinar: {resumen['longitud_ruta_inicial']:.1f})"
+            self.view.agregar_info_viaje(longitud + "\n")
             
             self.view.mostrar_mensaje_info(
                 "¡Felicidades!",
@@ -141,6 +248,8 @@ class MexicoTravelApp:
     def run(self):
         """Inicia el bucle principal de la aplicación"""
         self.root.mainloop()
+        # Al cerrar la ventana a mitad del cálculo, se pide detenerlo
+        self._cancelar_calculo()
 
 def main():
     """Punto de entrada principal"""
@@ -1,6 +1,9 @@
 # En models/__init__.py
 from .estado import Estado, Dulce
-from .viaje import Viaje, EstadoViaje
+from .viaje import Viaje, EstadoViaje, CambioSeleccion
+from .ruta import RutaEstados
+from .red_carreteras import RedCarreteras
+from .catalogo import TablaNombres, CatalogoEstados, CatalogoDulces
 
 # Ahora puedes hacer:
 # from models import Estado, Viaje
@@ -0,0 +1,139 @@
+import sys
+import numpy as np
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Union, overload
+from models.estado import Estado, Dulce
+
+
+class TablaNombres(Sequence[str]):
+    """Tabla de cadenas internadas, guardada como bytes UTF-8 contiguos + desplazamientos.
+
+    Cada nombre se decodifica (e interna) solo al leerlo; el índice inverso
+    nombre -> posición se construye la primera vez que se busca por nombre.
+    """
+
+    def __init__(self, datos: np.ndarray, desplazamientos: np.ndarray):
+        if len(desplazamientos) == 0 or desplazamientos[-1] != len(datos):
+            raise ValueError("Los desplazamientos no corresponden a los datos de la tabla")
+        self.datos = datos
+        self.desplazamientos = desplazamientos
+        self._cadenas: List[Optional[str]] = [None] * (len(desplazamientos) - 1)
+        self._indice: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def desde_lista(cls, nombres: Sequence[str]) -> "TablaNombres":
+        codificados = [nombre.encode('utf-8') for nombre in nombres]
+        desplazamientos = np.zeros(len(codificados) + 1, dtype=np.int64)
+        np.cumsum([len(c) for c in codificados], out=desplazamientos[1:])
+        tabla = cls(np.frombuffer(b''.join(codificados), dtype=np.uint8), desplazamientos)
+        tabla._cadenas = [sys.intern(nombre) for nombre in nombres]
+        return tabla
+
+    def __len__(self) -> int:
+        return len(self._cadenas)
+
+    @overload
+    def __getitem__(self, posicion: int) -> str: ...
+
+    @overload
+    def __getitem__(self, posicion: slice) -> List[str]: ...
+
+    def __getitem__(self, posicion: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(posicion, slice):
+            return [self[i] for i in range(*posicion.indices(len(self)))]
+        cadena = self._cadenas[posicion]
+        if cadena is None:
+            i = posicion % len(self)
+            inicio, fin = int(self.desplazamientos[i]), int(self.desplazamientos[i + 1])
+            cadena = sys.intern(self.datos[inicio:fin].tobytes().decode('utf-8'))
+            self._cadenas[i] = cadena
+        return cadena
+
+    def indice(self, nombre: str) -> int:
+        """Posición de `nombre` en la tabla (KeyError si no existe)"""
+        if self._indice is None:
+            self._indice = {cadena: i for i, cadena in enumerate(self)}
+            if len(self._indice) != len(self):
+                raise ValueError("La tabla de nombres contiene duplicados")
+        return self._indice[nombre]
+
+    def __contains__(self, nombre: object) -> bool:
+        try:
+            self.indice(nombre)  # type: ignore[arg-type]
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def lista(self) -> List[str]:
+        return list(self)
+
+
+class CatalogoEstados(Mapping[str, Estado]):
+    """Almacén columnar de estados: nombres internados y coordenadas (n, 2).
+
+    Las columnas `longitudes`/`latitudes` son vistas de `coordenadas`, que se
+    guarda intercalada porque así la leen los kernels de distancias. Ofrece
+    la interfaz del diccionario nombre -> Estado; cada `Estado` es una vista
+    de dos campos sobre su fila.
+    """
+
+    def __init__(self, nombres: TablaNombres, coordenadas: np.ndarray):
+        if len(coordenadas) != len(nombres):
+            raise ValueError("El número de coordenadas no coincide con el de nombres")
+        self.nombres = nombres
+        self.coordenadas = coordenadas
+
+    @classmethod
+    def desde_filas(cls, filas: Mapping[str, Sequence[float]]) -> "CatalogoEstados":
+        coordenadas = np.array(list(filas.values()), dtype=np.float64).reshape(len(filas), 2)
+        return cls(TablaNombres.desde_lista(list(filas)), coordenadas)
+
+    @property
+    def longitudes(self) -> np.ndarray:
+        return self.coordenadas[:, 0]
+
+    @property
+    def latitudes(self) -> np.ndarray:
+        return self.coordenadas[:, 1]
+
+    def __getitem__(self, nombre: str) -> Estado:
+        return Estado.vista(self, self.nombres.indice(nombre))
+
+    def estado(self, i: int) -> Estado:
+        return Estado.vista(self, range(len(self))[i])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.nombres)
+
+    def __len__(self) -> int:
+        return len(self.nombres)
+
+    def __contains__(self, nombre: object) -> bool:
+        return nombre in self.nombres
+
+
+class CatalogoDulces(Sequence[Dulce]):
+    """Almacén columnar de dulces: nombres internados y pesos; cada `Dulce` es una vista"""
+
+    def __init__(self, nombres: TablaNombres, pesos: np.ndarray):
+        if len(pesos) != len(nombres):
+            raise ValueError("El número de pesos no coincide con el de nombres")
+        self.nombres = nombres
+        self.pesos = pesos
+
+    @classmethod
+    def desde_filas(cls, filas: Mapping[str, float]) -> "CatalogoDulces":
+        return cls(TablaNombres.desde_lista(list(filas)), np.array(list(filas.values()), dtype=np.float64))
+
+    def __len__(self) -> int:
+        return len(self.nombres)
+
+    @overload
+    def __getitem__(self, posicion: int) -> Dulce: ...
+
+    @overload
+    def __getitem__(self, posicion: slice) -> List[Dulce]: ...
+
+    def __getitem__(self, posicion: Union[int, slice]) -> Union[Dulce, List[Dulce]]:
+        if isinstance(posicion, slice):
+            return [Dulce.vista(self, i) for i in range(*posicion.indices(len(self)))]
+        return Dulce.vista(self, range(len(self))[posicion])
@@ -1,25 +1,98 @@
-from dataclasses import dataclass
-from typing import Tuple
+from typing import Any, Tuple
+
+
+class _FilaSuelta:
+    """Tabla de una sola fila para los modelos creados fuera de un catálogo"""
+    __slots__ = ('nombres', 'coordenadas', 'pesos')
+
+    def __init__(self, nombre: str, coordenadas: Any = None, peso: Any = None):
+        self.nombres = (nombre,)
+        self.coordenadas = (coordenadas,)
+        self.pesos = (peso,)
+
 
-@dataclass
 class Estado:
-    """Modelo que representa un estado de México"""
-    nombre: str
-    coordenadas: Tuple[float, float]
-    
+    """Modelo que representa un estado de México.
+
+    Es una vista de una fila de un catálogo columnar (`CatalogoEstados`);
+    solo guarda la tabla y el número de fila.
+    """
+    __slots__ = ('_tabla', '_fila')
+
+    def __init__(self, nombre: str, coordenadas: Tuple[float, float]):
+        self._tabla: Any = _FilaSuelta(nombre, tuple(coordenadas))
+        self._fila = 0
+
+    @classmethod
+    def vista(cls, tabla: Any, fila: int) -> "Estado":
+        """Estado sobre la fila `fila` de una tabla con `nombres` y `coordenadas`"""
+        estado = cls.__new__(cls)
+        estado._tabla = tabla
+        estado._fila = fila
+        return estado
+
+    @property
+    def nombre(self) -> str:
+        return self._tabla.nombres[self._fila]
+
+    @property
+    def coordenadas(self) -> Tuple[float, float]:
+        longitud, latitud = self._tabla.coordenadas[self._fila]
+        return float(longitud), float(latitud)
+
     @property
     def longitud(self) -> float:
-        return self.coordenadas[0]
-    
+        return float(self._tabla.coordenadas[self._fila][0])
+
     @property
     def latitud(self) -> float:
-        return self.coordenadas[1]
+        return float(self._tabla.coordenadas[self._fila][1])
+
+    def __eq__(self, otro: object) -> bool:
+        if not isinstance(otro, Estado):
+            return NotImplemented
+        return self.nombre == otro.nombre and self.coordenadas == otro.coordenadas
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Estado(nombre={self.nombre!r}, coordenadas={self.coordenadas!r})"
+
 
-@dataclass
 class Dulce:
-    """Modelo que representa un dulce típico"""
-    nombre: str
-    peso: float
-    
+    """Modelo que representa un dulce típico (vista de una fila de `CatalogoDulces`)"""
+    __slots__ = ('_tabla', '_fila')
+
+    def __init__(self, nombre: str, peso: float):
+        self._tabla: Any = _FilaSuelta(nombre, peso=float(peso))
+        self._fila = 0
+
+    @classmethod
+    def vista(cls, tabla: Any, fila: int) -> "Dulce":
+        """Dulce sobre la fila `fila` de una tabla con `nombres` y `pesos`"""
+        dulce = cls.__new__(cls)
+        dulce._tabla = tabla
+        dulce._fila = fila
+        return dulce
+
+    @property
+    def nombre(self) -> str:
+        return self._tabla.nombres[self._fila]
+
+    @property
+    def peso(self) -> float:
+        return float(self._tabla.pesos[self._fila])
+
+    def __eq__(self, otro: object) -> bool:
+        if not isinstance(otro, Dulce):
+            return NotImplemented
+        return self.nombre == otro.nombre and self.peso == otro.peso
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Dulce(nombre={self.nombre!r}, peso={self.peso!r})"
+
     def __str__(self) -> str:
-        return f"{self.nombre} ({self.peso} kg)"
\ No newline at end of file
+        return f"{self.nombre} ({self.peso} kg)"
+
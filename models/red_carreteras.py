@@ -0,0 +1,21 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass
+class RedCarreteras:
+    """Red de carreteras dispersa: nodos con nombre y tramos ponderados (km)"""
+    nodos: List[str]
+    origen: np.ndarray
+    destino: np.ndarray
+    pesos: np.ndarray
+    huella: str = ""  # Hash del contenido de origen, para cachés
+    
+    @property
+    def num_nodos(self) -> int:
+        return len(self.nodos)
+    
+    @property
+    def num_tramos(self) -> int:
+        return len(self.origen)
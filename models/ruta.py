@@ -0,0 +1,41 @@
+from typing import Iterator, List, Mapping, Sequence, Union, overload
+from models.estado import Estado
+
+
+class RutaEstados(Sequence[Estado]):
+    """Ruta guardada como arreglo de índices; los `Estado` se obtienen al leerlos"""
+    
+    def __init__(self, indices: Sequence[int], nombres: List[str], estados: Mapping[str, Estado]):
+        self.indices = indices
+        self._nombres = nombres
+        self._estados = estados
+    
+    def __len__(self) -> int:
+        return len(self.indices)
+    
+    @overload
+    def __getitem__(self, posicion: int) -> Estado: ...
+    
+    @overload
+    def __getitem__(self, posicion: slice) -> List[Estado]: ...
+    
+    def __getitem__(self, posicion: Union[int, slice]) -> Union[Estado, List[Estado]]:
+        if isinstance(posicion, slice):
+            return [self._estado(i) for i in self.indices[posicion]]
+        return self._estado(self.indices[posicion])
+    
+    def __iter__(self) -> Iterator[Estado]:
+        for i in self.indices:
+            yield self._estado(i)
+    
+    def _estado(self, indice) -> Estado:
+        return self._estados[self._nombres[int(indice)]]
+    
+    def reordenada(self, orden: Sequence[int]) -> "RutaEstados":
+        """Nueva ruta con las posiciones de `orden` (índices sobre esta ruta)"""
+        indices = [self.indices[i] for i in orden]
+        return RutaEstados(indices, self._nombres, self._estados)
+    
+    def nombres(self) -> List[str]:
+        """Nombres en orden de visita, sin materializar los estados"""
+        return [self._nombres[int(i)] for i in self.indices]
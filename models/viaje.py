@@ -1,39 +1,110 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from types import MappingProxyType
+from typing import List, Dict, Mapping, NamedTuple, Optional, Sequence
 from models import Estado, Dulce
 
-@dataclass
+@dataclass(slots=True)
 class EstadoViaje:
-    """Modelo que representa el estado de un viaje"""
+    """Modelo que representa el estado de un viaje (selección inmutable una vez creada)"""
     estado: Estado
     dulces_seleccionados: List[Dulce] = field(default_factory=list)
-    
+    _peso: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._peso = sum(dulce.peso for dulce in self.dulces_seleccionados)
+
     @property
     def peso_dulces(self) -> float:
-        return sum(dulce.peso for dulce in self.dulces_seleccionados)
+        return self._peso
+
+
+class CambioSeleccion(NamedTuple):
+    """Entrada del historial: selección de un estado antes y después del cambio"""
+    nombre: str
+    anterior: Optional[EstadoViaje]
+    nueva: Optional[EstadoViaje]
+
 
 @dataclass
 class Viaje:
-    """Modelo principal que representa el viaje completo"""
-    ruta_estados: List[Estado] = field(default_factory=list)
-    estados_visitados: Dict[str, EstadoViaje] = field(default_factory=dict)
+    """Modelo principal que representa el viaje completo.
+
+    Las selecciones se registran con `registrar_seleccion`, que mantiene los
+    acumulados de peso y de dulces; consultas, deshacer y rehacer son O(1).
+    """
+    ruta_estados: Sequence[Estado] = field(default_factory=list)
     peso_maximo: float = 20.0
     estado_actual_index: int = 0
-    
+    _visitados: Dict[str, EstadoViaje] = field(default_factory=dict, init=False, repr=False)
+    _peso_total: float = field(default=0.0, init=False, repr=False)
+    _total_dulces: int = field(default=0, init=False, repr=False)
+    _historial: List[CambioSeleccion] = field(default_factory=list, init=False, repr=False)
+    _rehechos: List[CambioSeleccion] = field(default_factory=list, init=False, repr=False)
+
+    @property
+    def estados_visitados(self) -> Mapping[str, EstadoViaje]:
+        """Vista de solo lectura; los cambios pasan por `registrar_seleccion`"""
+        return MappingProxyType(self._visitados)
+
     @property
     def peso_total(self) -> float:
-        return sum(estado_viaje.peso_dulces for estado_viaje in self.estados_visitados.values())
-    
+        return self._peso_total
+
+    @property
+    def total_dulces(self) -> int:
+        return self._total_dulces
+
     @property
     def estado_actual(self) -> Optional[Estado]:
         if self.estado_actual_index < len(self.ruta_estados):
             return self.ruta_estados[self.estado_actual_index]
         return None
-    
+
     @property
     def viaje_completado(self) -> bool:
         return self.estado_actual_index >= len(self.ruta_estados)
-    
+
     def puede_agregar_dulces(self, dulces: List[Dulce]) -> bool:
         peso_dulces = sum(dulce.peso for dulce in dulces)
-        return self.peso_total + peso_dulces <= self.peso_maximo
\ No newline at end of file
+        # Holgura mínima para que sumas con error de redondeo no rechacen planes exactos
+        return self.peso_total + peso_dulces <= self.peso_maximo + 1e-9
+
+    def registrar_seleccion(self, estado_viaje: EstadoViaje):
+        """Guarda (o reemplaza) la selección de un estado y descarta lo deshecho"""
+        nombre = estado_viaje.estado.nombre
+        cambio = CambioSeleccion(nombre, self._visitados.get(nombre), estado_viaje)
+        self._aplicar(cambio.nombre, cambio.anterior, cambio.nueva)
+        self._historial.append(cambio)
+        self._rehechos.clear()
+
+    def deshacer(self) -> Optional[str]:
+        """Revierte el último cambio; devuelve el estado afectado o None si no hay"""
+        if not self._historial:
+            return None
+        cambio = self._historial.pop()
+        self._aplicar(cambio.nombre, cambio.nueva, cambio.anterior)
+        self._rehechos.append(cambio)
+        return cambio.nombre
+
+    def rehacer(self) -> Optional[str]:
+        """Vuelve a aplicar el último cambio deshecho"""
+        if not self._rehechos:
+            return None
+        cambio = self._rehechos.pop()
+        self._aplicar(cambio.nombre, cambio.anterior, cambio.nueva)
+        self._historial.append(cambio)
+        return cambio.nombre
+
+    def _aplicar(self, nombre: str, quitar: Optional[EstadoViaje], poner: Optional[EstadoViaje]):
+        if quitar is not None:
+            self._peso_total -= quitar.peso_dulces
+            self._total_dulces -= len(quitar.dulces_seleccionados)
+        if poner is not None:
+            self._peso_total += poner.peso_dulces
+            self._total_dulces += len(poner.dulces_seleccionados)
+            self._visitados[nombre] = poner
+        else:
+            del self._visitados[nombre]
+        if not self._visitados:
+            # Sin selecciones el acumulado vuelve a cero exacto (sin deriva de redondeo)
+            self._peso_total = 0.0
@@ -1,5 +1,10 @@
 from .data_repository import DataRepository
+from .cache_repository import CacheCalculos
+from .archivo_repository import ArchivoDataRepository, escribir_columnar
 
 __all__ = [
-    'DataRepository'
+    'DataRepository',
+    'CacheCalculos',
+    'ArchivoDataRepository',
+    'escribir_columnar'
 ]
\ No newline at end of file
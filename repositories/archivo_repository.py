@@ -0,0 +1,193 @@
+import csv
+import hashlib
+import json
+import os
+import struct
+import sys
+import numpy as np
+from itertools import islice
+from typing import Iterator, List, Optional, Sequence, Tuple
+from models import CatalogoDulces, CatalogoEstados, Dulce, RedCarreteras, TablaNombres
+from utils import RUTA_RED_CARRETERAS
+from .data_repository import DataRepository
+
+# Filas parseadas por bloque al leer formatos de texto
+FILAS_POR_BLOQUE = 65536
+
+# Formato columnar binario: magia, longitud de la cabecera JSON, cabecera y columnas alineadas
+EXTENSION_COLUMNAR = '.col'
+MAGIA_COLUMNAR = b'PGCOL\x00\x01\n'
+ALINEACION_COLUMNAR = 64
+
+COLUMNAS_ESTADOS = ('nombre', 'longitud', 'latitud')
+COLUMNAS_DULCES = ('nombre', 'peso')
+
+
+def _filas_csv(ruta: str, columnas: Sequence[str]) -> Iterator[List[str]]:
+    with open(ruta, newline='', encoding='utf-8') as archivo:
+        for fila in csv.reader(archivo):
+            if not fila or fila[0].startswith('#') or fila[0] == columnas[0]:
+                continue
+            if len(fila) != len(columnas):
+                raise ValueError(f"Fila inválida en {ruta}: {fila}")
+            yield fila
+
+
+def _filas_jsonl(ruta: str, columnas: Sequence[str]) -> Iterator[list]:
+    with open(ruta, encoding='utf-8') as archivo:
+        for numero, linea in enumerate(archivo, 1):
+            if not linea.strip():
+                continue
+            registro = json.loads(linea)
+            try:
+                yield [registro[columna] for columna in columnas]
+            except KeyError as error:
+                raise ValueError(f"Falta la columna {error} en {ruta}:{numero}") from None
+
+
+def _bloques(filas: Iterator[list], tamano: int) -> Iterator[List[list]]:
+    while True:
+        bloque = list(islice(filas, tamano))
+        if not bloque:
+            return
+        yield bloque
+
+
+def _cargar_texto(ruta: str, columnas: Sequence[str]) -> Tuple[TablaNombres, np.ndarray]:
+    """Parsea CSV o JSON Lines por bloques: nombres internados y valores en un arreglo (n, k)"""
+    lector = _filas_csv if ruta.endswith('.csv') else _filas_jsonl
+    nombres: List[str] = []
+    partes: List[np.ndarray] = []
+    for bloque in _bloques(lector(ruta, columnas), FILAS_POR_BLOQUE):
+        nombres.extend(sys.intern(str(fila[0]).strip()) for fila in bloque)
+        partes.append(np.array([tuple(map(float, fila[1:])) for fila in bloque], dtype=np.float64))
+    if partes:
+        valores = np.concatenate(partes)
+    else:
+        valores = np.empty((0, len(columnas) - 1), dtype=np.float64)
+    return TablaNombres.desde_lista(nombres), np.ascontiguousarray(valores)
+
+
+def escribir_columnar(ruta: str, nombres: Sequence[str], valores: np.ndarray):
+    """Escribe nombres y valores (n, k) en el formato columnar binario"""
+    tabla = TablaNombres.desde_lista(nombres)
+    valores = np.ascontiguousarray(valores, dtype='<f8')
+    columnas = {
+        'nombres_datos': np.ascontiguousarray(tabla.datos, dtype=np.uint8),
+        'nombres_desplazamientos': np.ascontiguousarray(tabla.desplazamientos, dtype='<i8'),
+        'valores': valores,
+    }
+
+    def alinear(posicion: int) -> int:
+        return -(-posicion // ALINEACION_COLUMNAR) * ALINEACION_COLUMNAR
+
+    # La cabecera se fija a un tamaño alineado antes de conocer los desplazamientos
+    descripcion = {
+        nombre: {'dtype': arreglo.dtype.str, 'forma': list(arreglo.shape), 'desplazamiento': 0}
+        for nombre, arreglo in columnas.items()
+    }
+    borrador = json.dumps({'filas': len(tabla), 'columnas': descripcion}).encode('utf-8')
+    posicion = alinear(len(MAGIA_COLUMNAR) + 8 + len(borrador) + 32 * len(columnas))
+    for nombre, arreglo in columnas.items():
+        descripcion[nombre]['desplazamiento'] = posicion
+        posicion = alinear(posicion + arreglo.nbytes)
+    cabecera = json.dumps({'filas': len(tabla), 'columnas': descripcion}).encode('utf-8')
+
+    temporal = ruta + '.tmp'
+    with open(temporal, 'wb') as archivo:
+        archivo.write(MAGIA_COLUMNAR)
+        archivo.write(struct.pack('<Q', len(cabecera)))
+        archivo.write(cabecera)
+        for nombre, arreglo in columnas.items():
+            archivo.seek(descripcion[nombre]['desplazamiento'])
+            archivo.write(arreglo.tobytes())
+    os.replace(temporal, ruta)
+
+
+def leer_columnar(ruta: str, mmap: bool = True) -> Tuple[TablaNombres, np.ndarray]:
+    """Lee el formato columnar binario; con `mmap` las columnas no se copian a memoria"""
+    with open(ruta, 'rb') as archivo:
+        if archivo.read(len(MAGIA_COLUMNAR)) != MAGIA_COLUMNAR:
+            raise ValueError(f"{ruta} no es un archivo columnar válido")
+        (longitud,) = struct.unpack('<Q', archivo.read(8))
+        cabecera = json.loads(archivo.read(longitud).decode('utf-8'))
+
+    columnas = {}
+    for nombre, columna in cabecera['columnas'].items():
+        forma = tuple(columna['forma'])
+        dtype = np.dtype(columna['dtype'])
+        if mmap and int(np.prod(forma)) > 0:
+            columnas[nombre] = np.memmap(
+                ruta, dtype=dtype, mode='r', offset=columna['desplazamiento'], shape=forma
+            )
+        else:
+            columnas[nombre] = np.fromfile(
+                ruta, dtype=dtype, count=int(np.prod(forma)), offset=columna['desplazamiento']
+            ).reshape(forma)
+    tabla = TablaNombres(columnas['nombres_datos'], columnas['nombres_desplazamientos'])
+    return tabla, columnas['valores']
+
+
+def cargar_tabla(ruta: str, columnas: Sequence[str], mmap: bool = True) -> Tuple[TablaNombres, np.ndarray]:
+    """Carga una tabla nombre + valores según la extensión (.csv, .jsonl o .col)"""
+    if ruta.endswith(EXTENSION_COLUMNAR):
+        tabla, valores = leer_columnar(ruta, mmap)
+    elif ruta.endswith(('.csv', '.jsonl')):
+        tabla, valores = _cargar_texto(ruta, columnas)
+    else:
+        raise ValueError(f"Formato de catálogo no soportado: {ruta}")
+    if valores.shape[1:] != (len(columnas) - 1,):
+        raise ValueError(f"{ruta} no tiene las columnas esperadas: {', '.join(columnas)}")
+    return tabla, valores
+
+
+class ArchivoDataRepository(DataRepository):
+    """Repositorio respaldado por archivos (CSV, JSON Lines o columnar binario).
+
+    Los catálogos se cargan una sola vez: coordenadas y pesos quedan en
+    arreglos contiguos (mapeados en memoria para el formato columnar) y los
+    `Estado`/`Dulce` se crean solo cuando se leen. Sin `ruta_dulces` se usan
+    los dulces incluidos en el juego.
+    """
+
+    def __init__(
+        self,
+        ruta_estados: str,
+        ruta_dulces: Optional[str] = None,
+        ruta_red: Optional[str] = RUTA_RED_CARRETERAS,
+        mmap: bool = True
+    ):
+        super().__init__(ruta_red)
+        self.ruta_estados = ruta_estados
+        self.ruta_dulces = ruta_dulces
+        self.mmap = mmap
+        self._estados: Optional[CatalogoEstados] = None
+        self._dulces: Optional[Sequence[Dulce]] = None
+        self._huella_estados: Optional[str] = None
+
+    def obtener_estados(self) -> CatalogoEstados:  # type: ignore[override]
+        if self._estados is None:
+            nombres, coordenadas = cargar_tabla(self.ruta_estados, COLUMNAS_ESTADOS, self.mmap)
+            self._estados = CatalogoEstados(nombres, coordenadas)
+        return self._estados
+
+    def obtener_dulces(self) -> Sequence[Dulce]:  # type: ignore[override]
+        if self._dulces is None:
+            if self.ruta_dulces is None:
+                self._dulces = DataRepository.obtener_dulces()
+            else:
+                nombres, pesos = cargar_tabla(self.ruta_dulces, COLUMNAS_DULCES, self.mmap)
+                self._dulces = CatalogoDulces(nombres, pesos[:, 0])
+        return self._dulces
+
+    def huella_datos(self, red: Optional[RedCarreteras] = None) -> str:  # type: ignore[override]
+        """Hash del archivo de estados (leído por bloques) y de la red, si hay"""
+        if self._huella_estados is None:
+            resumen = hashlib.sha256()
+            with open(self.ruta_estados, 'rb') as archivo:
+                for bloque in iter(lambda: archivo.read(1 << 20), b''):
+                    resumen.update(bloque)
+            self._huella_estados = resumen.hexdigest()
+        if red is None:
+            return self._huella_estados
+        return hashlib.sha256((self._huella_estados + red.huella).encode('utf-8')).hexdigest()
@@ -0,0 +1,107 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import numpy as np
+from typing import Dict, Optional
+from utils import DIRECTORIO_CACHE
+
+# Tamaño máximo por defecto de la caché en disco (bytes)
+TAMANO_MAXIMO_CACHE = 512 * 1024 * 1024
+
+
+class CacheCalculos:
+    """Caché en disco direccionada por contenido para matrices, árboles y rutas.
+
+    Cada entrada es un directorio `<clave>/` con un `.npy` por arreglo, que se
+    carga con `mmap_mode='r'` (sin copiar a memoria). Al superar el tamaño
+    máximo se eliminan las entradas usadas hace más tiempo (LRU por mtime).
+    """
+
+    def __init__(self, directorio: str = DIRECTORIO_CACHE, tamano_maximo: int = TAMANO_MAXIMO_CACHE):
+        self.directorio = directorio
+        self.tamano_maximo = tamano_maximo
+
+    @staticmethod
+    def clave(*partes: str) -> str:
+        """Clave estable a partir de las partes que determinan el resultado"""
+        resumen = hashlib.sha256()
+        for parte in partes:
+            resumen.update(parte.encode('utf-8'))
+            resumen.update(b'\0')
+        return resumen.hexdigest()[:32]
+
+    def _ruta(self, clave: str) -> str:
+        return os.path.join(self.directorio, clave)
+
+    def cargar(self, clave: str) -> Optional[Dict[str, np.ndarray]]:
+        ruta = self._ruta(clave)
+        if not os.path.isdir(ruta):
+            return None
+        try:
+            arreglos = {
+                nombre[:-4]: np.load(os.path.join(ruta, nombre), mmap_mode='r')
+                for nombre in os.listdir(ruta) if nombre.endswith('.npy')
+            }
+        except (OSError, ValueError):
+            # Entrada corrupta o escrita a medias: se descarta
+            shutil.rmtree(ruta, ignore_errors=True)
+            return None
+        os.utime(ruta)  # Marca de uso reciente para el LRU
+        return arreglos
+
+    def guardar(self, clave: str, arreglos: Dict[str, np.ndarray]):
+        os.makedirs(self.directorio, exist_ok=True)
+        temporal = tempfile.mkdtemp(prefix='.tmp-', dir=self.directorio)
+        try:
+            for nombre, arreglo in arreglos.items():
+                np.save(os.path.join(temporal, nombre + '.npy'), np.asarray(arreglo))
+            destino = self._ruta(clave)
+            # Las entradas solo aparecen completas (por renombrado) y la clave
+            # determina el contenido: si ya existe, otro proceso la escribió
+            if not os.path.isdir(destino):
+                try:
+                    os.replace(temporal, destino)
+                except OSError:
+                    if not os.path.isdir(destino):
+                        raise
+        finally:
+            shutil.rmtree(temporal, ignore_errors=True)
+        self._desalojar()
+
+    def _entradas(self):
+        if not os.path.isdir(self.directorio):
+            return []
+        entradas = []
+        for nombre in os.listdir(self.directorio):
+            ruta = os.path.join(self.directorio, nombre)
+            if nombre.startswith('.') or not os.path.isdir(ruta):
+                continue
+            try:
+                tamano = sum(
+                    os.path.getsize(os.path.join(ruta, archivo)) for archivo in os.listdir(ruta)
+                )
+                entradas.append((os.path.getmtime(ruta), tamano, ruta))
+            except OSError:
+                continue  # Desalojada por otro proceso mientras se recorría
+        return entradas
+
+    def tamano_total(self) -> int:
+        return sum(tamano for _, tamano, _ in self._entradas())
+
+    def _desalojar(self):
+        """Elimina las entradas menos usadas hasta respetar el tamaño máximo"""
+        entradas = sorted(self._entradas())
+        total = sum(tamano for _, tamano, _ in entradas)
+        for _, tamano, ruta in entradas:
+            if total <= self.tamano_maximo:
+                break
+            shutil.rmtree(ruta, ignore_errors=True)
+            total -= tamano
+
+    def invalidar(self, clave: str):
+        shutil.rmtree(self._ruta(clave), ignore_errors=True)
+
+    def limpiar(self):
+        for _, _, ruta in self._entradas():
+            shutil.rmtree(ruta, ignore_errors=True)
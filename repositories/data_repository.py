@@ -1,11 +1,21 @@
-from typing import Dict, List
-from models import Estado, Dulce
+import csv
+import hashlib
+import os
+import numpy as np
+from functools import lru_cache
+from typing import Dict, List, Optional
+from models import CatalogoDulces, CatalogoEstados, RedCarreteras
+from utils import RUTA_RED_CARRETERAS
 
 class DataRepository:
-    """Repositorio para gestionar los datos del juego"""
+    """Repositorio para gestionar los datos del juego.
+    
+    Los catálogos son de solo lectura y se construyen una vez por proceso.
+    """
     
     @staticmethod
-    def obtener_estados() -> Dict[str, Estado]:
+    @lru_cache(maxsize=1)
+    def obtener_estados() -> CatalogoEstados:
         estados_data = {
             'Aguascalientes': (102.3, 21.9),
             'Baja California': (115.0, 30.4),
@@ -40,13 +50,11 @@ class DataRepository:
             'Zacatecas': (102.6, 23.3),
             'Ciudad de México': (99.1, 19.4)
         }
-        return {
-            nombre: Estado(nombre, coordenadas) 
-            for nombre, coordenadas in estados_data.items()
-        }
+        return CatalogoEstados.desde_filas(estados_data)
     
     @staticmethod
-    def obtener_dulces() -> List[Dulce]:
+    @lru_cache(maxsize=1)
+    def obtener_dulces() -> CatalogoDulces:
         dulces_data = {
             'Ate de membrillo': 0.5,
             'Cajeta': 0.3,
@@ -79,4 +87,60 @@ class DataRepository:
             'Dulce de cacahuate': 0.35,
             'Dulce de calabaza': 0.4
         }
-        return [Dulce(nombre, peso) for nombre, peso in dulces_data.items()]
\ No newline at end of file
+        return CatalogoDulces.desde_filas(dulces_data)
+    
+    @classmethod
+    def huella_datos(cls, red: Optional[RedCarreteras] = None) -> str:
+        """Hash del conjunto de estados (y de la red de carreteras, si hay).
+        
+        Cambia en cuanto cambian los datos, lo que invalida las entradas de caché.
+        """
+        resumen = hashlib.sha256()
+        for nombre, estado in cls.obtener_estados().items():
+            longitud, latitud = estado.coordenadas
+            resumen.update(f"{nombre}\0{longitud!r}\0{latitud!r}\n".encode('utf-8'))
+        if red is not None:
+            resumen.update(red.huella.encode('utf-8'))
+        return resumen.hexdigest()
+    
+    def __init__(self, ruta_red: Optional[str] = RUTA_RED_CARRETERAS):
+        self.ruta_red = ruta_red  # None desactiva la red de carreteras
+    
+    def obtener_red_carreteras(self, ruta: Optional[str] = None) -> Optional[RedCarreteras]:
+        """Carga la red de carreteras desde un CSV local (origen,destino,distancia_km).
+        
+        Los nodos que coinciden con nombres de estados sirven como extremos del
+        cierre métrico; el resto son cruces intermedios. Devuelve None si el
+        archivo no existe.
+        """
+        ruta = ruta or self.ruta_red
+        if not ruta or not os.path.exists(ruta):
+            return None
+        
+        with open(ruta, 'rb') as archivo:
+            huella = hashlib.sha256(archivo.read()).hexdigest()
+        
+        indices: Dict[str, int] = {}
+        origen: List[int] = []
+        destino: List[int] = []
+        pesos: List[float] = []
+        with open(ruta, newline='', encoding='utf-8') as archivo:
+            for fila in csv.reader(archivo):
+                if not fila or fila[0].startswith('#') or fila[0] == 'origen':
+                    continue
+                if len(fila) != 3:
+                    raise ValueError(f"Fila inválida en {ruta}: {fila}")
+                a, b, distancia = fila[0].strip(), fila[1].strip(), float(fila[2])
+                if distancia < 0:
+                    raise ValueError(f"Distancia negativa en {ruta}: {fila}")
+                origen.append(indices.setdefault(a, len(indices)))
+                destino.append(indices.setdefault(b, len(indices)))
+                pesos.append(distancia)
+        
+        return RedCarreteras(
+            list(indices),
+            np.array(origen, dtype=np.int64),
+            np.array(destino, dtype=np.int64),
+            np.array(pesos, dtype=np.float64),
+            huella
+        )
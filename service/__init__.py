@@ -1,9 +1,57 @@
 
-from .graph_service import GraphStrategy, KruskalGraphStrategy
+from .graph_service import (
+    GraphStrategy,
+    ArbolGraphStrategy,
+    KruskalGraphStrategy,
+    KruskalArrayGraphStrategy,
+    SparseGraphStrategy,
+    PrimGraphStrategy,
+    BoruvkaGraphStrategy,
+    seleccionar_estrategia,
+    estrategia_por_nombre,
+    resolver_inicio
+)
+from .arbol import ArbolExpansion
+from .metricas import (
+    Metrica,
+    MetricaEuclidiana,
+    MetricaHaversine,
+    MetricaEquirectangular,
+    metrica_por_nombre
+)
+from .mejora_ruta import MejoradorRuta, ResultadoMejora, longitud_ruta
+from .seleccion_dulces import IndiceSeleccionDulces
+from .planificador_dulces import PlanificadorDulces, PlanDulces
+from .busqueda_multiinicio import buscar_multiinicio, ResultadoBusqueda
 
 # Configuración inicial del logger
 # import logging
 # logging.basicConfig(level=logging.INFO)
 # logger = logging.getLogger(__name__)
 
-__all__ = ['GraphStrategy', 'KruskalGraphStrategy']
\ No newline at end of file
+__all__ = [
+    'GraphStrategy',
+    'ArbolGraphStrategy',
+    'KruskalGraphStrategy',
+    'KruskalArrayGraphStrategy',
+    'SparseGraphStrategy',
+    'PrimGraphStrategy',
+    'BoruvkaGraphStrategy',
+    'seleccionar_estrategia',
+    'estrategia_por_nombre',
+    'resolver_inicio',
+    'ArbolExpansion',
+    'MejoradorRuta',
+    'ResultadoMejora',
+    'longitud_ruta',
+    'Metrica',
+    'MetricaEuclidiana',
+    'MetricaHaversine',
+    'MetricaEquirectangular',
+    'metrica_por_nombre',
+    'IndiceSeleccionDulces',
+    'PlanificadorDulces',
+    'PlanDulces',
+    'buscar_multiinicio',
+    'ResultadoBusqueda'
+]
\ No newline at end of file
@@ -0,0 +1,73 @@
+import numpy as np
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple, TYPE_CHECKING
+from .recorrido import adyacencia_csr, preorden
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+
+@dataclass
+class ArbolExpansion:
+    """Árbol de expansión mínima en arreglos compactos.
+
+    `origen[k]`, `destino[k]` y `pesos[k]` describen la arista k; los índices
+    refieren a `nombres`. Las aristas se guardan en orden canónico
+    (peso, origen, destino) con origen < destino, de modo que el resultado no
+    depende del motor que calculó el árbol. `padres` se llena al enraizar el
+    árbol (-1 en la raíz).
+    """
+    nombres: List[str]
+    origen: np.ndarray
+    destino: np.ndarray
+    pesos: np.ndarray
+    padres: np.ndarray = None  # type: ignore[assignment]
+    _csr: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        origen = np.minimum(self.origen, self.destino)
+        destino = np.maximum(self.origen, self.destino)
+        orden = np.lexsort((destino, origen, self.pesos))
+        self.origen = origen[orden]
+        self.destino = destino[orden]
+        self.pesos = np.asarray(self.pesos, dtype=np.float64)[orden]
+        if self.padres is None:
+            self.padres = np.full(len(self.nombres), -1, dtype=np.int64)
+    
+    @property
+    def num_nodos(self) -> int:
+        return len(self.nombres)
+    
+    def peso_total(self) -> float:
+        return float(self.pesos.sum())
+    
+    def adyacencia(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Adyacencia CSR (indptr, vecinos, pesos) con vecinos ordenados por (peso, índice)"""
+        if self._csr is None:
+            self._csr = adyacencia_csr(self.num_nodos, self.origen, self.destino, self.pesos)
+        return self._csr
+    
+    def preorden(self, raiz: int) -> np.ndarray:
+        """Orden de visita en preorden desde `raiz`; también actualiza `padres`"""
+        indptr, vecinos, _ = self.adyacencia()
+        orden, self.padres = preorden(indptr, vecinos, raiz)
+        return orden
+    
+    def enraizar(self, raiz: int) -> np.ndarray:
+        """Calcula el arreglo de padres tomando `raiz` como raíz"""
+        self.preorden(raiz)
+        return self.padres
+    
+    def como_networkx(self) -> "nx.Graph":
+        """Vista de networkx del árbol, para la capa de visualización"""
+        import networkx as nx
+        grafo = nx.Graph()
+        grafo.add_nodes_from(self.nombres)
+        nombres = self.nombres
+        grafo.add_weighted_edges_from(
+            (nombres[u], nombres[v], peso)
+            for u, v, peso in zip(self.origen.tolist(), self.destino.tolist(), self.pesos.tolist())
+        )
+        return grafo
@@ -0,0 +1,164 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+from .indice_espacial import IndiceEspacial
+from .mst_disperso import (
+    K_VECINOS, Candidatas, candidatas_por_vecinos, contraer, reducir_candidatas,
+    resolver_dudosos, tablas_de_mejores
+)
+
+# Estado de cada proceso trabajador: vistas sobre la memoria compartida
+_TRABAJADOR: Dict[str, object] = {}
+
+
+class _ArreglosCompartidos:
+    """Arreglos de numpy respaldados por bloques de memoria compartida"""
+
+    def __init__(self):
+        self.bloques: List[shared_memory.SharedMemory] = []
+        self.descriptores: Dict[str, Tuple[str, Tuple[int, ...], str]] = {}
+        self.arreglos: Dict[str, np.ndarray] = {}
+
+    def crear(self, nombre: str, forma: Tuple[int, ...], tipo) -> np.ndarray:
+        tipo = np.dtype(tipo)
+        tamano = max(int(np.prod(forma)) * tipo.itemsize, 1)
+        bloque = shared_memory.SharedMemory(create=True, size=tamano)
+        self.bloques.append(bloque)
+        self.descriptores[nombre] = (bloque.name, forma, tipo.str)
+        arreglo = np.ndarray(forma, dtype=tipo, buffer=bloque.buf)
+        self.arreglos[nombre] = arreglo
+        return arreglo
+
+    def liberar(self):
+        self.arreglos.clear()
+        for bloque in self.bloques:
+            bloque.close()
+            bloque.unlink()
+        self.bloques.clear()
+
+
+def _inicializar_trabajador(descriptores: Dict[str, Tuple[str, Tuple[int, ...], str]]):
+    """Adjunta la memoria compartida y construye el índice espacial local"""
+    for nombre, (bloque_nombre, forma, tipo) in descriptores.items():
+        bloque = shared_memory.SharedMemory(name=bloque_nombre)
+        _TRABAJADOR[nombre + '_bloque'] = bloque
+        _TRABAJADOR[nombre] = np.ndarray(forma, dtype=np.dtype(tipo), buffer=bloque.buf)
+    _TRABAJADOR['indice'] = IndiceEspacial(_TRABAJADOR['coordenadas'])
+
+
+def _tarea_k_vecinos(celdas: np.ndarray, k: int):
+    indice: IndiceEspacial = _TRABAJADOR['indice']  # type: ignore[assignment]
+    indice.k_vecinos_en_celdas(k, celdas, _TRABAJADOR['vecinos'], _TRABAJADOR['dist_vecinos'])
+
+
+def _tarea_candidatas(inicio: int, fin: int) -> Tuple[Candidatas, np.ndarray]:
+    return candidatas_por_vecinos(
+        np.arange(inicio, fin),
+        _TRABAJADOR['etiquetas'],
+        _TRABAJADOR['vecinos'],
+        _TRABAJADOR['dist_vecinos']
+    )
+
+
+def _tarea_dudosos(puntos: np.ndarray, num_componentes: int) -> Candidatas:
+    dist_vecinos: np.ndarray = _TRABAJADOR['dist_vecinos']  # type: ignore[assignment]
+    # Copias locales: cada trabajador afina sus cotas sin afectar a los demás
+    return resolver_dudosos(
+        _TRABAJADOR['indice'],  # type: ignore[arg-type]
+        puntos,
+        _TRABAJADOR['etiquetas'],  # type: ignore[arg-type]
+        dist_vecinos[:, -1],
+        np.array(_TRABAJADOR['mejor_peso'][:num_componentes]),  # type: ignore[index]
+        np.array(_TRABAJADOR['mejor_u'][:num_componentes]),  # type: ignore[index]
+        np.array(_TRABAJADOR['mejor_v'][:num_componentes])  # type: ignore[index]
+    )
+
+
+def _repartir(n: int, partes: int) -> List[Tuple[int, int]]:
+    limites = np.linspace(0, n, partes + 1).astype(int)
+    return [(int(a), int(b)) for a, b in zip(limites[:-1], limites[1:]) if b > a]
+
+
+def mst_boruvka_paralelo(
+    coordenadas: np.ndarray,
+    num_procesos: Optional[int] = None,
+    k: int = K_VECINOS,
+    tareas_por_proceso: int = 4
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MST euclidiano exacto con las fases de Borůvka repartidas en procesos.
+
+    Coordenadas, listas de vecinos, etiquetas de componente y mejores aristas
+    viven en memoria compartida; los trabajadores solo reciben rangos de
+    índices y devuelven candidatas compactas. La contracción de componentes
+    se hace en el proceso principal entre rondas.
+    """
+    n = len(coordenadas)
+    if n < 2:
+        vacio = np.empty(0, dtype=np.int64)
+        return vacio, vacio.copy(), np.empty(0, dtype=np.float64)
+
+    num_procesos = num_procesos or os.cpu_count() or 1
+    k = min(k, n - 1)
+    partes = num_procesos * tareas_por_proceso
+    compartidos = _ArreglosCompartidos()
+    try:
+        coords = compartidos.crear('coordenadas', (n, 2), np.float64)
+        coords[:] = coordenadas
+        vecinos = compartidos.crear('vecinos', (n, k), np.int64)
+        dist_vecinos = compartidos.crear('dist_vecinos', (n, k), np.float64)
+        etiquetas = compartidos.crear('etiquetas', (n,), np.int64)
+        etiquetas[:] = np.arange(n)
+        mejor_peso = compartidos.crear('mejor_peso', (n,), np.float64)
+        mejor_u = compartidos.crear('mejor_u', (n,), np.int64)
+        mejor_v = compartidos.crear('mejor_v', (n,), np.int64)
+
+        with ProcessPoolExecutor(
+            max_workers=num_procesos,
+            initializer=_inicializar_trabajador,
+            initargs=(compartidos.descriptores,)
+        ) as pool:
+            # Fase 1: listas de k vecinos, repartidas por celdas de la rejilla
+            celdas = IndiceEspacial(coords).celdas_ocupadas()
+            list(pool.map(_tarea_k_vecinos, np.array_split(celdas, partes), [k] * partes))
+            cota = dist_vecinos[:, -1]
+
+            num_componentes = n
+            aristas = []
+            while num_componentes > 1:
+                # Fase 2: arista más barata por componente según los vecinos
+                rangos = _repartir(n, partes)
+                resultados = list(pool.map(_tarea_candidatas, *zip(*rangos)))
+                candidatas = reducir_candidatas(
+                    *(np.concatenate(columna) for columna in zip(*(r[0] for r in resultados)))
+                )
+                sin_candidato = np.concatenate([r[1] for r in resultados])
+                pesos_c, u_c, v_c = tablas_de_mejores(candidatas, num_componentes)
+
+                # Fase 3: búsqueda exacta solo donde las listas de vecinos no bastan
+                dudosos = sin_candidato[cota[sin_candidato] <= pesos_c[etiquetas[sin_candidato]]]
+                if len(dudosos):
+                    mejor_peso[:num_componentes] = pesos_c
+                    mejor_u[:num_componentes] = u_c
+                    mejor_v[:num_componentes] = v_c
+                    # Agrupar por componente reparte mejor las cotas entre procesos
+                    dudosos = dudosos[np.argsort(etiquetas[dudosos], kind='stable')]
+                    trozos = [t for t in np.array_split(dudosos, partes) if len(t)]
+                    mejoras = list(pool.map(_tarea_dudosos, trozos, [num_componentes] * len(trozos)))
+                    candidatas = reducir_candidatas(
+                        *(np.concatenate(columna) for columna in zip(candidatas, *mejoras))
+                    )
+                    pesos_c, u_c, v_c = tablas_de_mejores(candidatas, num_componentes)
+
+                # Contracción de componentes en el proceso principal
+                nuevas_etiquetas, num_componentes, nuevas = contraer(
+                    coords, etiquetas, num_componentes, u_c, v_c
+                )
+                etiquetas[:] = nuevas_etiquetas
+                aristas.append(nuevas)
+
+        origen, destino, pesos = zip(*aristas)
+        return np.concatenate(origen), np.concatenate(destino), np.concatenate(pesos)
+    finally:
+        compartidos.liberar()
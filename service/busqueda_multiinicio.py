@@ -0,0 +1,247 @@
+"""Búsqueda de la mejor ruta en preorden del MST probando todos los inicios.
+
+Cada combinación (estado inicial, heurística de orden de los hijos) produce
+un recorrido en preorden; se mide su longitud real y se devuelve la mejor
+junto con una tabla ordenada. Las heurísticas ordenan los vecinos con una
+clave por arista dirigida que no depende de la raíz (se calcula una vez con
+un recorrido de re-enraizado), así que cada inicio cuesta un solo preorden.
+
+Con varios procesos, la adyacencia ordenada de cada heurística, las
+coordenadas y (si las hay) las distancias fijas viven en memoria compartida
+de solo lectura; las tareas reciben únicamente rangos de inicios.
+"""
+import os
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+from .arbol import ArbolExpansion
+from .boruvka_paralelo import _ArreglosCompartidos, _repartir
+from .metricas import Metrica, MetricaEuclidiana
+from .recorrido import preorden
+
+# Clave con la que cada heurística ordena los hijos (menor primero)
+HEURISTICAS = (
+    'peso',         # Arista más ligera primero (el DFS original)
+    'tamano',       # Subárbol con menos nodos primero: el mayor queda al final
+    'longitud',     # Subárbol con menos peso total primero
+    'profundidad',  # Rama menos profunda primero: la más larga no se desanda
+)
+# Por debajo de este número de preórdenes no compensa crear procesos
+MINIMO_PARALELO = 2000
+
+_TRABAJADOR: Dict[str, object] = {}
+
+
+@dataclass
+class ResultadoBusqueda:
+    """Mejor recorrido encontrado y tabla de combinaciones ordenada por longitud"""
+    ruta: np.ndarray
+    inicio: int
+    heuristica: str
+    longitud: float
+    tabla: List[Tuple[int, str, float]] = field(default_factory=list)  # (inicio, heurística, longitud)
+    evaluadas: int = 0
+    tiempo_s: float = 0.0
+
+
+def claves_por_arista(arbol: ArbolExpansion) -> Dict[str, np.ndarray]:
+    """Para cada heurística, la clave de cada arista dirigida (fuente, vecino) del CSR.
+
+    La clave describe la rama que se abre al cruzar la arista, así que vale
+    para cualquier raíz: con raíz 0 se obtienen los agregados de cada
+    subárbol y el lado complementario se deduce de ellos.
+    """
+    n = arbol.num_nodos
+    indptr, vecinos, pesos = arbol.adyacencia()
+    fuente = np.repeat(np.arange(n), np.diff(indptr))
+    orden, padres = preorden(indptr, vecinos, 0)
+    peso_padre = np.zeros(n)
+    # Peso de la arista (padre, hijo) de cada nodo que no es raíz
+    es_hacia_padre = padres[fuente] == vecinos
+    peso_padre[fuente[es_hacia_padre]] = pesos[es_hacia_padre]
+
+    # Agregados del subárbol de cada nodo con raíz 0 (postorden)
+    tamano = np.ones(n, dtype=np.int64)
+    longitud = np.zeros(n)
+    profundidad = np.zeros(n)
+    # Las dos ramas más profundas de cada nodo, para el re-enraizado
+    mejor = np.zeros(n)
+    segundo = np.zeros(n)
+    mejor_hijo = np.full(n, -1, dtype=np.int64)
+    padres_lista = padres.tolist()
+    for v in reversed(orden[1:].tolist()):
+        p = padres_lista[v]
+        tamano[p] += tamano[v]
+        longitud[p] += longitud[v] + peso_padre[v]
+        rama = profundidad[v] + peso_padre[v]
+        if rama > mejor[p]:
+            segundo[p], mejor[p], mejor_hijo[p] = mejor[p], rama, v
+        elif rama > segundo[p]:
+            segundo[p] = rama
+        profundidad[p] = mejor[p]
+
+    # Profundidad "hacia arriba": rama más larga de v saliendo por su padre
+    arriba = np.zeros(n)
+    for v in orden[1:].tolist():
+        p = padres_lista[v]
+        hermano = segundo[p] if mejor_hijo[p] == v else mejor[p]
+        arriba[v] = peso_padre[v] + max(arriba[p], hermano)
+
+    total = float(arbol.pesos.sum())
+    hacia_hijo = ~es_hacia_padre
+    # Valor de la rama que se abre al ir de `fuente` a `vecino`
+    tamano_rama = np.where(hacia_hijo, tamano[vecinos], n - tamano[fuente])
+    longitud_rama = np.where(hacia_hijo, longitud[vecinos] + pesos, total - longitud[fuente])
+    profundidad_rama = np.where(hacia_hijo, profundidad[vecinos] + pesos, arriba[fuente])
+    return {
+        'peso': pesos,
+        'tamano': tamano_rama.astype(np.float64),
+        'longitud': longitud_rama,
+        'profundidad': profundidad_rama,
+    }
+
+
+def _adyacencias_ordenadas(arbol: ArbolExpansion, heuristicas: Sequence[str]) -> np.ndarray:
+    """Vecinos del CSR reordenados por la clave de cada heurística (una fila por heurística)"""
+    indptr, vecinos, pesos = arbol.adyacencia()
+    fuente = np.repeat(np.arange(arbol.num_nodos), np.diff(indptr))
+    claves = claves_por_arista(arbol)
+    filas = []
+    for heuristica in heuristicas:
+        if heuristica not in claves:
+            raise ValueError(f"Heurística desconocida: {heuristica}")
+        # Desempate por peso y por índice: el orden es determinista
+        orden = np.lexsort((vecinos, pesos, claves[heuristica], fuente))
+        filas.append(vecinos[orden])
+    return np.array(filas, dtype=np.int64).reshape(len(heuristicas), len(vecinos))
+
+
+def _longitud(ruta: np.ndarray, coordenadas: np.ndarray, metrica: Metrica,
+              distancias: Optional[np.ndarray]) -> float:
+    if len(ruta) < 2:
+        return 0.0
+    a, b = ruta[:-1], ruta[1:]
+    if distancias is not None:
+        n = len(coordenadas)
+        i, j = np.minimum(a, b), np.maximum(a, b)
+        return float(distancias[i * (2 * n - i - 1) // 2 + (j - i - 1)].sum())
+    return float(metrica.distancias_lote(coordenadas[a], coordenadas[b]).sum())
+
+
+def _evaluar(
+    inicios: np.ndarray,
+    indptr: np.ndarray,
+    adyacencias: np.ndarray,
+    coordenadas: np.ndarray,
+    metrica: Metrica,
+    distancias: Optional[np.ndarray]
+) -> np.ndarray:
+    """Longitudes (len(inicios), heurísticas) de los preórdenes"""
+    resultado = np.empty((len(inicios), len(adyacencias)))
+    for h, vecinos in enumerate(adyacencias):
+        for k, inicio in enumerate(inicios.tolist()):
+            ruta, _ = preorden(indptr, vecinos, inicio)
+            resultado[k, h] = _longitud(ruta, coordenadas, metrica, distancias)
+    return resultado
+
+
+def _inicializar_trabajador(descriptores, metrica: Metrica):
+    from multiprocessing import shared_memory
+    for nombre, (bloque_nombre, forma, tipo) in descriptores.items():
+        bloque = shared_memory.SharedMemory(name=bloque_nombre)
+        _TRABAJADOR[nombre + '_bloque'] = bloque
+        _TRABAJADOR[nombre] = np.ndarray(forma, dtype=np.dtype(tipo), buffer=bloque.buf)
+    _TRABAJADOR['metrica'] = metrica
+
+
+def _tarea_evaluar(inicio: int, fin: int) -> np.ndarray:
+    return _evaluar(
+        _TRABAJADOR['inicios'][inicio:fin],  # type: ignore[index]
+        _TRABAJADOR['indptr'],  # type: ignore[arg-type]
+        _TRABAJADOR['adyacencias'],  # type: ignore[arg-type]
+        _TRABAJADOR['coordenadas'],  # type: ignore[arg-type]
+        _TRABAJADOR['metrica'],  # type: ignore[arg-type]
+        _TRABAJADOR.get('distancias')  # type: ignore[arg-type]
+    )
+
+
+def buscar_multiinicio(
+    arbol: ArbolExpansion,
+    coordenadas: np.ndarray,
+    metrica: Optional[Metrica] = None,
+    distancias: Optional[np.ndarray] = None,
+    inicios: Optional[Sequence[int]] = None,
+    heuristicas: Sequence[str] = HEURISTICAS,
+    num_procesos: Optional[int] = None,
+    tamano_tabla: int = 20,
+    tareas_por_proceso: int = 4
+) -> ResultadoBusqueda:
+    """Evalúa el preorden del MST desde cada inicio con cada heurística.
+
+    `distancias` (forma condensada) sustituye a la métrica, p. ej. con la red
+    de carreteras. A igual longitud gana la heurística listada primero y
+    luego el inicio de menor índice.
+    """
+    comienzo = time.perf_counter()
+    metrica = metrica or MetricaEuclidiana()
+    coordenadas = np.ascontiguousarray(coordenadas, dtype=np.float64)
+    n = arbol.num_nodos
+    if n == 0:
+        raise ValueError("No hay estados para recorrer")
+    inicios_arr = np.arange(n) if inicios is None else np.asarray(inicios, dtype=np.int64)
+    if len(inicios_arr) == 0 or len(heuristicas) == 0:
+        raise ValueError("Se necesita al menos un inicio y una heurística")
+    indptr, _, _ = arbol.adyacencia()
+    adyacencias = _adyacencias_ordenadas(arbol, heuristicas)
+
+    num_procesos = num_procesos or os.cpu_count() or 1
+    if num_procesos == 1 or len(inicios_arr) * len(heuristicas) < MINIMO_PARALELO:
+        longitudes = _evaluar(inicios_arr, indptr, adyacencias, coordenadas, metrica, distancias)
+    else:
+        compartidos = _ArreglosCompartidos()
+        try:
+            arreglos = {
+                'inicios': inicios_arr, 'indptr': indptr,
+                'adyacencias': adyacencias, 'coordenadas': coordenadas,
+            }
+            if distancias is not None:
+                arreglos['distancias'] = np.asarray(distancias, dtype=np.float64)
+            for nombre, arreglo in arreglos.items():
+                compartidos.crear(nombre, arreglo.shape, arreglo.dtype)[...] = arreglo
+            rangos = _repartir(len(inicios_arr), num_procesos * tareas_por_proceso)
+            with ProcessPoolExecutor(
+                max_workers=num_procesos,
+                initializer=_inicializar_trabajador,
+                initargs=(compartidos.descriptores, metrica)
+            ) as pool:
+                longitudes = np.concatenate(list(pool.map(_tarea_evaluar, *zip(*rangos))))
+        finally:
+            compartidos.liberar()
+
+    # Orden: longitud, heurística (en el orden dado), inicio
+    k_inicio, k_heuristica = np.meshgrid(np.arange(len(inicios_arr)), np.arange(len(heuristicas)),
+                                         indexing='ij')
+    inicio_plano, heuristica_plana = k_inicio.ravel(), k_heuristica.ravel()
+    longitud_plana = longitudes.ravel()
+    orden = np.lexsort((inicios_arr[inicio_plano], heuristica_plana, longitud_plana))
+
+    def fila(i: int) -> Tuple[int, str, float]:
+        return (int(inicios_arr[inicio_plano[i]]), heuristicas[heuristica_plana[i]],
+                float(longitud_plana[i]))
+
+    # El mejor sale del orden completo, sea cual sea el tamaño de la tabla
+    mejor = int(orden[0])
+    inicio, heuristica, longitud = fila(mejor)
+    tabla = [fila(i) for i in orden[:max(tamano_tabla, 0)].tolist()]
+    ruta, _ = preorden(indptr, adyacencias[heuristica_plana[mejor]], inicio)
+    return ResultadoBusqueda(
+        ruta=ruta,
+        inicio=inicio,
+        heuristica=heuristica,
+        longitud=longitud,
+        tabla=tabla,
+        evaluadas=int(longitudes.size),
+        tiempo_s=time.perf_counter() - comienzo
+    )
@@ -0,0 +1,117 @@
+import heapq
+import math
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, TYPE_CHECKING
+from models import RedCarreteras
+from .recorrido import adyacencia_csr
+
+if TYPE_CHECKING:
+    from repositories.cache_repository import CacheCalculos
+
+# Fuentes por tarea enviada al pool de procesos
+FUENTES_POR_LOTE = 8
+
+# Adyacencia CSR del proceso trabajador (se recibe una vez al iniciar)
+_RED: Dict[str, object] = {}
+
+
+def _inicializar_trabajador(indptr: np.ndarray, vecinos: np.ndarray, pesos: np.ndarray):
+    _RED['indptr'] = indptr.tolist()
+    _RED['vecinos'] = vecinos.tolist()
+    _RED['pesos'] = pesos.tolist()
+
+
+def dijkstra(
+    indptr: List[int],
+    vecinos: List[int],
+    pesos: List[float],
+    fuente: int,
+    objetivos: List[int]
+) -> List[float]:
+    """Distancias más cortas desde `fuente` a cada objetivo (heap binario + CSR).
+
+    Se detiene en cuanto todos los objetivos quedan fijados.
+    """
+    distancias: Dict[int, float] = {fuente: 0.0}
+    fijados = set()
+    pendientes = set(objetivos)
+    pendientes.discard(fuente)
+    monticulo = [(0.0, fuente)]
+    while monticulo and pendientes:
+        distancia, nodo = heapq.heappop(monticulo)
+        if nodo in fijados:
+            continue
+        fijados.add(nodo)
+        pendientes.discard(nodo)
+        for posicion in range(indptr[nodo], indptr[nodo + 1]):
+            vecino = vecinos[posicion]
+            nueva = distancia + pesos[posicion]
+            if nueva < distancias.get(vecino, math.inf):
+                distancias[vecino] = nueva
+                heapq.heappush(monticulo, (nueva, vecino))
+    return [distancias.get(objetivo, math.inf) for objetivo in objetivos]
+
+
+def _tarea_lote(posiciones: List[int], objetivos: List[int]) -> List[List[float]]:
+    """Filas condensadas: desde objetivos[i] solo hacia objetivos[i + 1:]"""
+    return [
+        dijkstra(
+            _RED['indptr'], _RED['vecinos'], _RED['pesos'],  # type: ignore[arg-type]
+            objetivos[i], objetivos[i + 1:]
+        )
+        for i in posiciones
+    ]
+
+
+def cierre_metrico(
+    red: RedCarreteras,
+    nombres: List[str],
+    num_procesos: Optional[int] = None,
+    cache: Optional["CacheCalculos"] = None
+) -> np.ndarray:
+    """Distancias por carretera entre los estados `nombres`, en forma condensada.
+
+    Ejecuta un Dijkstra multi-origen por lotes de fuentes en un pool de
+    procesos. Con `cache`, el resultado se guarda en disco con una clave
+    derivada del contenido de la red y de los nombres, de modo que las
+    siguientes ejecuciones omiten la fase de Dijkstra.
+    """
+    clave = None
+    if cache is not None and red.huella:
+        clave = cache.clave('cierre_metrico', red.huella, *nombres)
+        guardado = cache.cargar(clave)
+        if guardado is not None and 'distancias' in guardado:
+            return guardado['distancias']
+
+    indice_nodo = {nodo: i for i, nodo in enumerate(red.nodos)}
+    faltantes = [nombre for nombre in nombres if nombre not in indice_nodo]
+    if faltantes:
+        raise ValueError(f"Estados sin nodo en la red de carreteras: {', '.join(faltantes)}")
+
+    indptr, vecinos, pesos = adyacencia_csr(red.num_nodos, red.origen, red.destino, red.pesos)
+    objetivos = [indice_nodo[nombre] for nombre in nombres]
+    # La matriz es simétrica: la fila i solo necesita los objetivos j > i
+    posiciones = list(range(len(objetivos) - 1))
+    lotes = [posiciones[i:i + FUENTES_POR_LOTE] for i in range(0, len(posiciones), FUENTES_POR_LOTE)]
+
+    if num_procesos == 1 or len(lotes) <= 1:
+        _inicializar_trabajador(indptr, vecinos, pesos)
+        filas = [fila for lote in lotes for fila in _tarea_lote(lote, objetivos)]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=num_procesos,
+            initializer=_inicializar_trabajador,
+            initargs=(indptr, vecinos, pesos)
+        ) as pool:
+            resultados = pool.map(_tarea_lote, lotes, [objetivos] * len(lotes))
+            filas = [fila for lote in resultados for fila in lote]
+
+    condensada = np.array([d for fila in filas for d in fila], dtype=np.float64)
+    if np.isinf(condensada).any():
+        raise ValueError("La red de carreteras no conecta todos los estados")
+
+    if clave is not None:
+        cache.guardar(clave, {'distancias': condensada})
+    return condensada
+
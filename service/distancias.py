@@ -0,0 +1,86 @@
+import numpy as np
+from typing import List, Mapping, Optional, Tuple
+from models.catalogo import CatalogoEstados
+from models.estado import Estado
+from .metricas import Metrica, MetricaEuclidiana
+
+# Filas procesadas por bloque para acotar la memoria temporal
+_FILAS_POR_BLOQUE = 256
+
+
+def coordenadas_a_arreglo(estados: Mapping[str, Estado]) -> Tuple[List[str], np.ndarray]:
+    """Convierte los estados en una lista de nombres y un arreglo (n, 2) contiguo"""
+    if isinstance(estados, CatalogoEstados):
+        # Catálogo en arreglos: sin materializar ningún Estado
+        return estados.nombres.lista(), np.ascontiguousarray(estados.coordenadas, dtype=np.float64)
+    nombres = list(estados.keys())
+    coordenadas = np.array(
+        [estado.coordenadas for estado in estados.values()],
+        dtype=np.float64
+    ).reshape(len(nombres), 2)
+    return nombres, np.ascontiguousarray(coordenadas)
+
+
+def distancias_condensadas(coordenadas: np.ndarray, metrica: Optional[Metrica] = None) -> np.ndarray:
+    """Distancias de todos los pares (i < j) en forma condensada (euclidiana por defecto)"""
+    metrica = metrica or MetricaEuclidiana()
+    n = len(coordenadas)
+    total = n * (n - 1) // 2
+    resultado = np.empty(total, dtype=np.float64)
+    if total == 0:
+        return resultado
+
+    columnas = np.arange(n)
+    inicio = 0
+    for a in range(0, n, _FILAS_POR_BLOQUE):
+        b = min(a + _FILAS_POR_BLOQUE, n)
+        # Solo se calcula la parte a la derecha de la diagonal del bloque
+        mascara = columnas[a:][None, :] > columnas[a:b, None]
+        bloque = metrica.matriz(coordenadas[a:b], coordenadas[a:])[mascara]
+        resultado[inicio:inicio + len(bloque)] = bloque
+        inicio += len(bloque)
+    return resultado
+
+
+def pares_condensados(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Índices (i, j) de cada posición del arreglo condensado"""
+    i, j = np.triu_indices(n, k=1)
+    return i, j
+
+
+def pares_desde_posiciones(posiciones: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Convierte posiciones condensadas en pares (i, j) sin materializar todos los pares"""
+    posiciones = np.asarray(posiciones, dtype=np.int64)
+    # Inicio de cada fila i: i * (2n - i - 1) / 2
+    b = 2 * n - 1
+    i = np.floor((b - np.sqrt(b * b - 8.0 * posiciones)) / 2).astype(np.int64)
+    # Corrección por redondeo en los límites de fila
+    inicio_fila = i * (b - i) // 2
+    i = np.where(posiciones < inicio_fila, i - 1, i)
+    inicio_fila = i * (b - i) // 2
+    siguiente_fila = (i + 1) * (b - i - 1) // 2
+    i = np.where(posiciones >= siguiente_fila, i + 1, i)
+    inicio_fila = i * (b - i) // 2
+    j = posiciones - inicio_fila + i + 1
+    return i, j
+
+
+def posicion_condensada(i: int, j: int, n: int) -> int:
+    """Posición del par (i, j) dentro del arreglo condensado"""
+    if i == j:
+        raise ValueError("No existe distancia de un estado consigo mismo")
+    if i > j:
+        i, j = j, i
+    return i * (2 * n - i - 1) // 2 + (j - i - 1)
+
+
+def fila_condensada(condensada: np.ndarray, i: int, n: int) -> np.ndarray:
+    """Fila i de la matriz de distancias completa (con 0 en la diagonal)"""
+    fila = np.empty(n, dtype=np.float64)
+    j = np.arange(i)
+    # Pares (j, i) con j < i: una posición por fila anterior
+    fila[:i] = condensada[j * (2 * n - j - 1) // 2 + (i - j - 1)]
+    fila[i] = 0.0
+    inicio = i * (2 * n - i - 1) // 2
+    fila[i + 1:] = condensada[inicio:inicio + n - i - 1]
+    return fila
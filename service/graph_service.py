@@ -1,82 +1,542 @@
-import networkx as nx
-from typing import Dict, List, Tuple, Optional
+import numpy as np
+from typing import Dict, List, Mapping, Sequence, Tuple, Optional, Union, TYPE_CHECKING
 from models.estado import Estado
+from models.ruta import RutaEstados
 from abc import ABC, abstractmethod
+from .arbol import ArbolExpansion
+from .distancias import (
+    coordenadas_a_arreglo, distancias_condensadas, fila_condensada, pares_condensados,
+    pares_desde_posiciones
+)
+from .mst_disperso import mst_euclidiano, K_VECINOS
+from .mst_dinamico import (
+    desplazar_ruta, eliminar_nodo, insertar_en_ruta, insertar_nodo, quitar_de_ruta
+)
+from .boruvka_paralelo import mst_boruvka_paralelo
+from .busqueda_multiinicio import HEURISTICAS, ResultadoBusqueda, buscar_multiinicio
+from .union_find import UnionFind
+from .metricas import Metrica, MetricaEuclidiana
+from utils import ESTADO_INICIAL
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+# Umbral del selector automático de estrategia (medido con coordenadas aleatorias)
+UMBRAL_NODOS_DISPERSO = 2000
+
+def resolver_inicio(estados: Mapping[str, Estado], inicio: Optional[str] = None) -> str:
+    """Estado donde empieza la ruta.
+
+    Un `inicio` explícito debe estar en el catálogo (si no, ValueError); sin
+    él se usa ESTADO_INICIAL y, si el catálogo no lo tiene, su primer estado.
+    """
+    if inicio is not None:
+        if inicio not in estados:
+            raise ValueError(f"El estado inicial no está en el catálogo: {inicio}")
+        return inicio
+    if ESTADO_INICIAL in estados:
+        return ESTADO_INICIAL
+    for nombre in estados:
+        return nombre
+    raise ValueError("No hay estados para recorrer")
+
 
 class GraphStrategy(ABC):
     """Interfaz de grafos"""
     @abstractmethod
-    def calcular_ruta(self, estados: Dict[str, Estado]) -> Tuple[nx.Graph, List[Estado]]:
+    def calcular_ruta(
+        self, estados: Dict[str, Estado], inicio: Optional[str] = None
+    ) -> Tuple[Union["nx.Graph", ArbolExpansion], Sequence[Estado]]:
         pass
-    
+
     @abstractmethod
     def obtener_peso_total_mst(self) -> float:
         """Nuevo método abstracto requerido"""
         pass
 
-class KruskalGraphStrategy(GraphStrategy):
+class ArbolGraphStrategy(GraphStrategy):
+    """Base para estrategias que guardan el MST en arreglos compactos.
+
+    Las vistas de networkx (`grafo_completo`, `mst_grafo`) se construyen
+    solo cuando alguien las solicita. Los pesos se calculan con `metrica`
+    (euclidiana por defecto).
+    """
+    def __init__(self, metrica: Optional[Metrica] = None):
+        self.metrica: Metrica = metrica or MetricaEuclidiana()
+        self._grafo_completo: Optional["nx.Graph"] = None
+        self._mst_grafo: Optional["nx.Graph"] = None
+        self.nombres: List[str] = []
+        self.coordenadas: Optional[np.ndarray] = None
+        self.distancias: Optional[np.ndarray] = None  # Forma condensada (i < j)
+        self.arbol: Optional[ArbolExpansion] = None
+        self.ruta_indices: Optional[np.ndarray] = None
+        # Distancias externas (p. ej. cierre métrico de carreteras) que sustituyen a la métrica
+        self.distancias_fijas: Optional[np.ndarray] = None
+        self._nombres_fijos: List[str] = []
+
+    @property
+    def grafo_completo(self) -> Optional["nx.Graph"]:
+        """Grafo completo de networkx, construido solo cuando se solicita"""
+        if self.distancias is None and self.coordenadas is not None:
+            if self.distancias_fijas is not None:
+                self.distancias = self.distancias_fijas
+            else:
+                self.distancias = distancias_condensadas(self.coordenadas, self.metrica)
+        if self._grafo_completo is None and self.distancias is not None:
+            self._grafo_completo = self._construir_grafo_networkx()
+        return self._grafo_completo
+
+    @grafo_completo.setter
+    def grafo_completo(self, grafo: Optional["nx.Graph"]):
+        self._grafo_completo = grafo
+
+    @property
+    def mst_grafo(self) -> "nx.Graph":
+        """Vista de networkx del MST, construida a partir de los arreglos"""
+        if self._mst_grafo is None:
+            if self.arbol is not None:
+                self._mst_grafo = self.arbol.como_networkx()
+            else:
+                import networkx as nx
+                self._mst_grafo = nx.Graph()
+        return self._mst_grafo
+
+    @mst_grafo.setter
+    def mst_grafo(self, grafo: "nx.Graph"):
+        self._mst_grafo = grafo
+
+    @property
+    def pos_estados(self) -> Optional[Dict[str, Tuple[float, float]]]:
+        if self.arbol is None or self.coordenadas is None:
+            return None
+        return dict(zip(self.nombres, map(tuple, self.coordenadas.tolist())))
+
+    def establecer_distancias(self, nombres: List[str], condensada: np.ndarray):
+        """Usa una matriz de distancias precalculada (forma condensada, orden de `nombres`)"""
+        n = len(nombres)
+        if len(condensada) != n * (n - 1) // 2:
+            raise ValueError("La matriz condensada no corresponde al número de estados")
+        self.distancias_fijas = condensada
+        self._nombres_fijos = list(nombres)
+
+    def _validar_distancias_fijas(self):
+        if self._nombres_fijos != self.nombres:
+            raise ValueError("Las distancias precalculadas no corresponden a los estados recibidos")
+
+    def calcular_distancias(self, estados: Dict[str, Estado]) -> np.ndarray:
+        """Calcula en lote los pesos de todas las aristas del grafo completo"""
+        self.nombres, self.coordenadas = coordenadas_a_arreglo(estados)
+        if self.distancias_fijas is not None:
+            self._validar_distancias_fijas()
+            self.distancias = self.distancias_fijas
+        else:
+            self.distancias = distancias_condensadas(self.coordenadas, self.metrica)
+        self._grafo_completo = None
+        return self.distancias
+
+    def _construir_grafo_networkx(self) -> "nx.Graph":
+        """Materializa el grafo completo a partir del arreglo condensado"""
+        import networkx as nx
+        grafo = nx.Graph()
+        grafo.add_nodes_from(self.nombres)
+        if self.distancias is None or len(self.distancias) == 0:
+            return grafo
+
+        i, j = pares_condensados(len(self.nombres))
+        nombres = self.nombres
+        grafo.add_weighted_edges_from(
+            (nombres[a], nombres[b], peso)
+            for a, b, peso in zip(i.tolist(), j.tolist(), self.distancias.tolist())
+        )
+        return grafo
+
+    @abstractmethod
+    def _calcular_arbol(self, estados: Dict[str, Estado]) -> ArbolExpansion:
+        """Calcula el MST de los estados como arreglos"""
+        pass
+
+    def calcular_ruta(
+        self,
+        estados: Dict[str, Estado],
+        inicio: Optional[str] = None
+    ) -> Tuple[ArbolExpansion, RutaEstados]:
+        """MST y ruta en preorden desde `inicio` (ver `resolver_inicio`)"""
+        inicio = resolver_inicio(estados, inicio)
+        self._mst_grafo = None
+        self.arbol = self._calcular_arbol(estados)
+        ruta = self._generar_ruta_dfs(estados, inicio)
+        return self.arbol, ruta
+
+    def _generar_ruta_dfs(self, estados: Dict[str, Estado], inicio: str) -> RutaEstados:
+        """Ruta en preorden del MST desde `inicio`, como arreglo de índices"""
+        if self.arbol is None:
+            raise AttributeError("El MST no se ha generado correctamente")
+
+        self.ruta_indices = self.arbol.preorden(self.nombres.index(inicio))
+        return RutaEstados(self.ruta_indices, self.nombres, estados)
+
+    def calcular_ruta_multiinicio(
+        self,
+        estados: Dict[str, Estado],
+        heuristicas: Sequence[str] = HEURISTICAS,
+        num_procesos: Optional[int] = None,
+        tamano_tabla: int = 20
+    ) -> Tuple[RutaEstados, ResultadoBusqueda]:
+        """Ruta en preorden del MST con el mejor inicio y orden de hijos (ver `buscar_multiinicio`)"""
+        if self.arbol is None or self.coordenadas is None:
+            raise ValueError("No hay un MST calculado sobre el que buscar")
+        if self.distancias_fijas is not None:
+            self._validar_distancias_fijas()
+        resultado = buscar_multiinicio(
+            self.arbol, self.coordenadas, self.metrica,
+            distancias=self.distancias_fijas,
+            heuristicas=heuristicas,
+            num_procesos=num_procesos,
+            tamano_tabla=tamano_tabla
+        )
+        self.ruta_indices = resultado.ruta
+        return RutaEstados(self.ruta_indices, self.nombres, estados), resultado
+
+    def obtener_peso_total_mst(self) -> float:
+        if self.arbol is None:
+            return 0.0
+        return self.arbol.peso_total()
+
+    def identificador(self) -> str:
+        """Describe la estrategia y su configuración, para las claves de caché"""
+        origen = 'fijas' if self.distancias_fijas is not None else 'metrica'
+        return f"{type(self).__name__}:{self.metrica!r}:{origen}"
+
+    def exportar_resultado(self) -> Dict[str, np.ndarray]:
+        """Arreglos necesarios para restaurar el MST y la ruta sin recalcularlos"""
+        if self.arbol is None or self.ruta_indices is None:
+            raise ValueError("No hay un MST calculado que exportar")
+        resultado = {
+            'nombres': np.array(self.nombres, dtype=np.str_),
+            'origen': self.arbol.origen,
+            'destino': self.arbol.destino,
+            'pesos': self.arbol.pesos,
+            'ruta': np.asarray(self.ruta_indices, dtype=np.int64),
+        }
+        if self.distancias is not None:
+            resultado['distancias'] = self.distancias
+        return resultado
+
+    def restaurar_resultado(self, estados: Dict[str, Estado], datos: Dict[str, np.ndarray]) -> RutaEstados:
+        """Restaura el MST y la ruta exportados con `exportar_resultado`"""
+        nombres, coordenadas = coordenadas_a_arreglo(estados)
+        if list(datos['nombres']) != nombres:
+            raise ValueError("Los datos guardados no corresponden a los estados recibidos")
+        self.nombres, self.coordenadas = nombres, coordenadas
+        self.distancias = datos.get('distancias')
+        self._grafo_completo = None
+        self._mst_grafo = None
+        self.arbol = ArbolExpansion(nombres, datos['origen'], datos['destino'], datos['pesos'])
+        self.ruta_indices = np.asarray(datos['ruta'], dtype=np.int64)
+        return RutaEstados(self.ruta_indices, self.nombres, estados)
+
+    # Cambios incrementales del conjunto de estados
+    def insertar_estado(
+        self,
+        estados: Dict[str, Estado],
+        nombre: str,
+        fijas: int = 1,
+        ruta: Optional[Sequence[int]] = None
+    ) -> RutaEstados:
+        """Actualiza MST y ruta tras agregar `nombre` (ya presente en `estados`).
+
+        El MST se actualiza en O(n) y el estado se inserta en la ruta donde
+        menos la alarga, sin mover las `fijas` primeras paradas. `ruta` es la
+        que sigue el viaje (p. ej. ya refinada); por omisión, el preorden.
+        """
+        nombres, coordenadas = self._preparar_cambio(estados)
+        posicion = nombres.index(nombre)
+        if len(nombres) != len(self.nombres) + 1:
+            raise ValueError(f"Se esperaba un estado nuevo: {nombre}")
+        self.arbol = insertar_nodo(self.arbol, coordenadas, nombres, self.metrica, posicion)
+        ruta = desplazar_ruta(self._ruta_base(ruta), posicion)
+        ruta = insertar_en_ruta(coordenadas, ruta, posicion, self.metrica, fijas)
+        return self._aplicar_cambio(estados, nombres, coordenadas, ruta)
+
+    def eliminar_estado(
+        self,
+        estados: Dict[str, Estado],
+        nombre: str,
+        fijas: int = 1,
+        ruta: Optional[Sequence[int]] = None
+    ) -> RutaEstados:
+        """Actualiza MST y ruta tras quitar `nombre` (ya ausente de `estados`)"""
+        nombres, coordenadas = self._preparar_cambio(estados)
+        posicion = self.nombres.index(nombre)
+        ruta = self._ruta_base(ruta)
+        if int(np.flatnonzero(ruta == posicion)[0]) < fijas:
+            raise ValueError(f"No se puede quitar una parada ya fija de la ruta: {nombre}")
+        self.arbol = eliminar_nodo(self.arbol, coordenadas, nombres, self.metrica, posicion)
+        ruta = quitar_de_ruta(ruta, posicion)
+        return self._aplicar_cambio(estados, nombres, coordenadas, ruta)
+
+    def mover_estado(
+        self,
+        estados: Dict[str, Estado],
+        nombre: str,
+        fijas: int = 1,
+        ruta: Optional[Sequence[int]] = None
+    ) -> RutaEstados:
+        """Actualiza MST y ruta tras cambiar las coordenadas de `nombre` en `estados`.
+
+        Equivale a quitar el nodo y volver a insertarlo en el mismo índice;
+        si su parada es fija, conserva su lugar en la ruta.
+        """
+        nombres, coordenadas = self._preparar_cambio(estados)
+        posicion = nombres.index(nombre)
+        if nombres != self.nombres:
+            raise ValueError("Mover un estado no debe cambiar el conjunto de estados")
+        sin_nodo = np.delete(coordenadas, posicion, axis=0)
+        arbol = eliminar_nodo(self.arbol, sin_nodo, nombres[:posicion] + nombres[posicion + 1:],
+                              self.metrica, posicion)
+        self.arbol = insertar_nodo(arbol, coordenadas, nombres, self.metrica, posicion)
+        ruta = self._ruta_base(ruta)
+        if int(np.flatnonzero(ruta == posicion)[0]) >= fijas:
+            ruta = insertar_en_ruta(coordenadas, ruta[ruta != posicion], posicion, self.metrica, fijas)
+        return self._aplicar_cambio(estados, nombres, coordenadas, ruta)
+
+    def _preparar_cambio(self, estados: Dict[str, Estado]) -> Tuple[List[str], np.ndarray]:
+        if self.arbol is None or self.ruta_indices is None:
+            raise ValueError("No hay un MST calculado que actualizar")
+        if self.distancias_fijas is not None:
+            raise ValueError("Las distancias precalculadas no admiten cambios incrementales")
+        return coordenadas_a_arreglo(estados)
+
+    def _ruta_base(self, ruta: Optional[Sequence[int]]) -> np.ndarray:
+        """Ruta sobre la que se repara: la dada o, si no hay, el preorden calculado"""
+        if ruta is None:
+            return self.ruta_indices
+        ruta = np.asarray(ruta, dtype=np.int64)
+        if len(ruta) != len(self.nombres):
+            raise ValueError("La ruta no corresponde al conjunto de estados actual")
+        return ruta
+
+    def _aplicar_cambio(
+        self,
+        estados: Dict[str, Estado],
+        nombres: List[str],
+        coordenadas: np.ndarray,
+        ruta: np.ndarray
+    ) -> RutaEstados:
+        self.nombres, self.coordenadas = nombres, coordenadas
+        self.distancias = None
+        self._grafo_completo = None
+        self._mst_grafo = None
+        self.ruta_indices = np.asarray(ruta, dtype=np.int64)
+        return RutaEstados(self.ruta_indices, self.nombres, estados)
+
+    def verificar_mst(self, estados: Dict[str, Estado]) -> bool:
+        """Compara el MST actual con un recálculo completo (Kruskal con el mismo desempate)"""
+        if self.arbol is None:
+            return False
+        referencia = KruskalArrayGraphStrategy(self.metrica)._calcular_arbol(estados)
+        return (
+            referencia.nombres == self.arbol.nombres
+            and np.array_equal(referencia.origen, self.arbol.origen)
+            and np.array_equal(referencia.destino, self.arbol.destino)
+            and np.allclose(referencia.pesos, self.arbol.pesos)
+        )
+
+    def _coordenadas_proyectadas(self) -> np.ndarray:
+        """Coordenadas planas equivalentes a la métrica, para las estrategias geométricas"""
+        if self.distancias_fijas is not None:
+            raise ValueError(
+                f"{type(self).__name__} es geométrica y no admite distancias precalculadas"
+            )
+        proyectadas = self.metrica.proyectar(self.coordenadas)
+        if proyectadas is None:
+            raise ValueError(
+                f"{type(self).__name__} requiere una métrica proyectable al plano; "
+                f"{self.metrica!r} no lo es"
+            )
+        return proyectadas
+
+class KruskalGraphStrategy(ArbolGraphStrategy):
     """Implementación concreta usando algoritmo de Kruskal"""
-    def __init__(self):
-        self.grafo_completo: Optional[nx.Graph] = None
-        self.mst_grafo: nx.Graph = nx.Graph()  # Inicializado con grafo vacío
-        self.pos_estados: Optional[Dict[str, Tuple[float, float]]] = None
-    
     def calcular_distancia(self, estado1: Estado, estado2: Estado) -> float:
-        x1, y1 = estado1.coordenadas
-        x2, y2 = estado2.coordenadas
-        return ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
-    
-    def construir_grafo_completo(self, estados: Dict[str, Estado]) -> nx.Graph:
-        self.grafo_completo = nx.Graph()
-        estados_lista = list(estados.values())
-        
-        for i in range(len(estados_lista)):
-            for j in range(i + 1, len(estados_lista)):
-                estado1 = estados_lista[i]
-                estado2 = estados_lista[j]
-                distancia = self.calcular_distancia(estado1, estado2)
-                self.grafo_completo.add_edge(estado1.nombre, estado2.nombre, weight=distancia)
-        return self.grafo_completo
-    
-    def calcular_ruta(self, estados: Dict[str, Estado]) -> Tuple[nx.Graph, List[Estado]]:
-        if not self.grafo_completo:
-            self.construir_grafo_completo(estados)
-        
+        return self.metrica.distancia(estado1.coordenadas, estado2.coordenadas)
+
+    def construir_grafo_completo(self, estados: Dict[str, Estado]) -> "nx.Graph":
+        self.calcular_distancias(estados)
+        grafo = self.grafo_completo
+        if grafo is None:
+            raise ValueError("El grafo completo no se ha construido correctamente")
+        return grafo
+
+    def _calcular_arbol(self, estados: Dict[str, Estado]) -> ArbolExpansion:
+        # Las distancias de `construir_grafo_completo` se reutilizan solo si son de estos estados
+        nombres, coordenadas = coordenadas_a_arreglo(estados)
+        if (self.distancias is None or nombres != self.nombres
+                or not np.array_equal(coordenadas, self.coordenadas)):
+            self.calcular_distancias(estados)
+
         if self.grafo_completo is None:
             raise ValueError("El grafo completo no se ha construido correctamente")
-        
-        self.mst_grafo = nx.minimum_spanning_tree(self.grafo_completo, algorithm="kruskal")
-        self.pos_estados = {
-            estado.nombre: (estado.longitud, estado.latitud) 
-            for estado in estados.values()
-        }
-        
-        ruta = self._generar_ruta_dfs(estados, 'Ciudad de México')
-        return self.mst_grafo, ruta
-    
-    def _generar_ruta_dfs(self, estados: Dict[str, Estado], inicio: str) -> List[Estado]:
-        visitados = set()
-        ruta: List[Estado] = []
-        
-        if not hasattr(self.mst_grafo, 'neighbors'):
-            raise AttributeError("El MST no se ha generado correctamente")
-        
-        def dfs(nombre_estado: str):
-            nonlocal visitados, ruta
-            visitados.add(nombre_estado)
-            ruta.append(estados[nombre_estado])
-            
-            if self.mst_grafo is None:
-                raise ValueError("El MST no está inicializado")
-                
-            for vecino in self.mst_grafo.neighbors(nombre_estado):
-                if vecino not in visitados:
-                    dfs(vecino)
-        
-        dfs(inicio)
-        return ruta
-    
-    def obtener_peso_total_mst(self) -> float:
-        if self.mst_grafo is None:
-            return 0.0
-        return sum(data['weight'] for _, _, data in self.mst_grafo.edges(data=True))
\ No newline at end of file
+
+        import networkx as nx
+        mst = nx.minimum_spanning_tree(self.grafo_completo, algorithm="kruskal")
+        indices = {nombre: i for i, nombre in enumerate(self.nombres)}
+        aristas = list(mst.edges(data='weight'))
+        arbol = ArbolExpansion(
+            self.nombres,
+            np.array([indices[u] for u, _, _ in aristas], dtype=np.int64),
+            np.array([indices[v] for _, v, _ in aristas], dtype=np.int64),
+            np.array([peso for _, _, peso in aristas], dtype=np.float64)
+        )
+        self._mst_grafo = mst
+        return arbol
+
+class KruskalArrayGraphStrategy(ArbolGraphStrategy):
+    """Kruskal nativo: aristas ordenadas con argsort y conjuntos disjuntos en arreglos"""
+    def __init__(self, metrica: Optional[Metrica] = None, aristas_por_lote: int = 4096):
+        super().__init__(metrica)
+        self.aristas_por_lote = aristas_por_lote
+
+    def _calcular_arbol(self, estados: Dict[str, Estado]) -> ArbolExpansion:
+        self.calcular_distancias(estados)
+        distancias = self.distancias
+        n = len(self.nombres)
+        origen = np.empty(max(n - 1, 0), dtype=np.int64)
+        destino = np.empty(max(n - 1, 0), dtype=np.int64)
+        pesos = np.empty(max(n - 1, 0), dtype=np.float64)
+
+        orden = np.argsort(distancias, kind='stable')
+        conjuntos = UnionFind(n)
+        agregadas = 0
+        # Los pares (i, j) se reconstruyen por lotes para no materializarlos todos
+        for inicio in range(0, len(orden), self.aristas_por_lote):
+            if agregadas == n - 1:
+                break
+            lote = orden[inicio:inicio + self.aristas_por_lote]
+            i, j = pares_desde_posiciones(lote, n)
+            for a, b, posicion in zip(i.tolist(), j.tolist(), lote.tolist()):
+                if conjuntos.unir(a, b):
+                    origen[agregadas] = a
+                    destino[agregadas] = b
+                    pesos[agregadas] = distancias[posicion]
+                    agregadas += 1
+                    if agregadas == n - 1:
+                        break
+        return ArbolExpansion(self.nombres, origen, destino, pesos)
+
+class SparseGraphStrategy(ArbolGraphStrategy):
+    """MST euclidiano sobre aristas candidatas dispersas, sin grafo completo.
+
+    Válido para coordenadas planas. El grafo completo solo se calcula si
+    alguien lo solicita explícitamente (p. ej. la ventana de comparación).
+    """
+    def __init__(self, metrica: Optional[Metrica] = None, k_vecinos: int = K_VECINOS):
+        super().__init__(metrica)
+        self.k_vecinos = k_vecinos
+
+    def _calcular_arbol(self, estados: Dict[str, Estado]) -> ArbolExpansion:
+        self.nombres, self.coordenadas = coordenadas_a_arreglo(estados)
+        self.distancias = None
+        self._grafo_completo = None
+
+        origen, destino, pesos = mst_euclidiano(self._coordenadas_proyectadas(), self.k_vecinos)
+        return ArbolExpansion(self.nombres, origen, destino, pesos)
+
+class BoruvkaGraphStrategy(ArbolGraphStrategy):
+    """Borůvka en paralelo sobre varios procesos, para conjuntos muy grandes de puntos"""
+    def __init__(
+        self,
+        metrica: Optional[Metrica] = None,
+        num_procesos: Optional[int] = None,
+        k_vecinos: int = K_VECINOS
+    ):
+        super().__init__(metrica)
+        self.num_procesos = num_procesos
+        self.k_vecinos = k_vecinos
+
+    def _calcular_arbol(self, estados: Dict[str, Estado]) -> ArbolExpansion:
+        self.nombres, self.coordenadas = coordenadas_a_arreglo(estados)
+        self.distancias = None
+        self._grafo_completo = None
+
+        origen, destino, pesos = mst_boruvka_paralelo(
+            self._coordenadas_proyectadas(), self.num_procesos, self.k_vecinos
+        )
+        return ArbolExpansion(self.nombres, origen, destino, pesos)
+
+class PrimGraphStrategy(ArbolGraphStrategy):
+    """Prim denso O(n²): calcula distancias fila por fila sin guardar la lista de aristas"""
+    def _calcular_arbol(self, estados: Dict[str, Estado]) -> ArbolExpansion:
+        self.nombres, self.coordenadas = coordenadas_a_arreglo(estados)
+        self.distancias = None
+        self._grafo_completo = None
+        fijas = self.distancias_fijas
+        if fijas is not None:
+            self._validar_distancias_fijas()
+
+        n = len(self.nombres)
+        coordenadas = self.coordenadas
+        # Distancia mínima de cada nodo al árbol y nodo del árbol que la alcanza
+        costo = np.full(n, np.inf)
+        mas_cercano = np.full(n, -1, dtype=np.int64)
+        en_arbol = np.zeros(n, dtype=bool)
+        origen = np.empty(max(n - 1, 0), dtype=np.int64)
+        destino = np.empty(max(n - 1, 0), dtype=np.int64)
+        pesos = np.empty(max(n - 1, 0), dtype=np.float64)
+
+        nodo = 0
+        for k in range(n - 1):
+            en_arbol[nodo] = True
+            costo[nodo] = np.inf
+            if fijas is not None:
+                fila = fila_condensada(fijas, nodo, n)
+            else:
+                fila = self.metrica.matriz(coordenadas[nodo:nodo + 1], coordenadas)[0]
+            mejora = (fila < costo) & ~en_arbol
+            costo[mejora] = fila[mejora]
+            mas_cercano[mejora] = nodo
+
+            nodo = int(np.argmin(costo))
+            origen[k] = mas_cercano[nodo]
+            destino[k] = nodo
+            pesos[k] = costo[nodo]
+        return ArbolExpansion(self.nombres, origen, destino, pesos)
+
+def seleccionar_estrategia(
+    num_estados: int,
+    metrica: Optional[Metrica] = None
+) -> ArbolGraphStrategy:
+    """Elige el motor de MST más rápido según el tamaño del grafo.
+
+    Las estrategias siempre trabajan sobre el grafo completo (con red de
+    carreteras, su cierre métrico), así que la densidad no interviene:
+    - Muchos puntos con métrica proyectable al plano: MST disperso.
+    - En otro caso: Prim denso, con memoria O(n).
+    """
+    metrica = metrica or MetricaEuclidiana()
+    if metrica.proyectable and num_estados > UMBRAL_NODOS_DISPERSO:
+        return SparseGraphStrategy(metrica)
+    return PrimGraphStrategy(metrica)
+
+
+# Nombres cortos de las estrategias, para archivos de escenario y línea de comandos
+ESTRATEGIAS = {
+    'kruskal': KruskalGraphStrategy,
+    'kruskal_arreglos': KruskalArrayGraphStrategy,
+    'disperso': SparseGraphStrategy,
+    'prim': PrimGraphStrategy,
+    'boruvka': BoruvkaGraphStrategy,
+}
+
+
+def estrategia_por_nombre(
+    nombre: str,
+    num_estados: int,
+    metrica: Optional[Metrica] = None
+) -> ArbolGraphStrategy:
+    """Instancia una estrategia por nombre; 'auto' delega en `seleccionar_estrategia`"""
+    if nombre == 'auto':
+        return seleccionar_estrategia(num_estados, metrica=metrica)
+    if nombre not in ESTRATEGIAS:
+        raise ValueError(f"Estrategia desconocida: {nombre}")
+    return ESTRATEGIAS[nombre](metrica)
@@ -0,0 +1,216 @@
+import math
+import numpy as np
+from typing import Tuple
+
+
+class IndiceEspacial:
+    """Índice de rejilla uniforme sobre coordenadas planas (n, 2).
+
+    Además de los vecinos entre los propios puntos (MST, 2-opt), responde
+    consultas desde posiciones arbitrarias (`mas_cercano`, `k_mas_cercanos`,
+    `en_radio`), p. ej. para seleccionar estados con el ratón.
+    """
+
+    def __init__(self, coordenadas: np.ndarray, puntos_por_celda: float = 4.0):
+        self.coordenadas = np.ascontiguousarray(coordenadas, dtype=np.float64)
+        n = len(self.coordenadas)
+        if n == 0:
+            raise ValueError("No se puede indexar un conjunto vacío de coordenadas")
+
+        self.minimo = self.coordenadas.min(axis=0)
+        extension = self.coordenadas.max(axis=0) - self.minimo
+        area = float(extension[0]) * float(extension[1])
+        # La cota lineal evita rejillas gigantes cuando los puntos están casi alineados
+        self.lado = max(
+            math.sqrt(area * puntos_por_celda / n),
+            float(extension.max()) * puntos_por_celda / n,
+            1e-12
+        )
+        self.celdas_x = int(extension[0] // self.lado) + 1
+        self.celdas_y = int(extension[1] // self.lado) + 1
+
+        celda_xy = ((self.coordenadas - self.minimo) // self.lado).astype(np.int64)
+        self.celda_x = np.minimum(celda_xy[:, 0], self.celdas_x - 1)
+        self.celda_y = np.minimum(celda_xy[:, 1], self.celdas_y - 1)
+        celda = self.celda_x * self.celdas_y + self.celda_y
+
+        # Puntos ordenados por celda: las celdas (cx, cy0..cy1) quedan contiguas
+        self.orden = np.argsort(celda, kind='stable')
+        conteo = np.bincount(celda, minlength=self.celdas_x * self.celdas_y)
+        self.inicio_celda = np.zeros(len(conteo) + 1, dtype=np.int64)
+        np.cumsum(conteo, out=self.inicio_celda[1:])
+
+    def __len__(self) -> int:
+        return len(self.coordenadas)
+
+    def _puntos_rectangulo(self, cx0: int, cx1: int, cy0: int, cy1: int) -> np.ndarray:
+        """Índices de los puntos en las celdas [cx0, cx1] x [cy0, cy1]"""
+        cx0, cy0 = max(cx0, 0), max(cy0, 0)
+        cx1, cy1 = min(cx1, self.celdas_x - 1), min(cy1, self.celdas_y - 1)
+        if cx0 > cx1 or cy0 > cy1:
+            return np.empty(0, dtype=np.int64)
+        tramos = [
+            self.orden[self.inicio_celda[cx * self.celdas_y + cy0]:
+                       self.inicio_celda[cx * self.celdas_y + cy1 + 1]]
+            for cx in range(cx0, cx1 + 1)
+        ]
+        return np.concatenate(tramos) if len(tramos) > 1 else tramos[0]
+
+    def _puntos_anillo(self, cx: int, cy: int, r: int) -> np.ndarray:
+        """Índices de los puntos en el anillo de celdas a distancia r de (cx, cy)"""
+        if r == 0:
+            return self._puntos_rectangulo(cx, cx, cy, cy)
+        partes = [
+            self._puntos_rectangulo(cx - r, cx - r, cy - r, cy + r),
+            self._puntos_rectangulo(cx + r, cx + r, cy - r, cy + r),
+            self._puntos_rectangulo(cx - r + 1, cx + r - 1, cy - r, cy - r),
+            self._puntos_rectangulo(cx - r + 1, cx + r - 1, cy + r, cy + r),
+        ]
+        return np.concatenate(partes)
+
+    def _cubre_todo(self, cx: int, cy: int, r: int) -> bool:
+        return (cx - r <= 0 and cy - r <= 0 and
+                cx + r >= self.celdas_x - 1 and cy + r >= self.celdas_y - 1)
+
+    def _celda_de(self, punto: Tuple[float, float]) -> Tuple[int, int]:
+        """Celda de un punto cualquiera; fuera de la rejilla, la celda del borde más cercana"""
+        cx = int((punto[0] - self.minimo[0]) // self.lado)
+        cy = int((punto[1] - self.minimo[1]) // self.lado)
+        return min(max(cx, 0), self.celdas_x - 1), min(max(cy, 0), self.celdas_y - 1)
+
+    def _distancias_a(self, indices: np.ndarray, punto: Tuple[float, float]) -> np.ndarray:
+        dx = self.coordenadas[indices, 0] - punto[0]
+        dy = self.coordenadas[indices, 1] - punto[1]
+        return np.sqrt(dx * dx + dy * dy)
+
+    def k_mas_cercanos(
+        self,
+        punto: Tuple[float, float],
+        k: int = 1,
+        limite: float = math.inf
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Los k puntos más cercanos a `punto` dentro de `limite`, por (distancia, índice)"""
+        k = min(k, len(self.coordenadas))
+        cx, cy = self._celda_de(punto)
+        candidatos = np.empty(0, dtype=np.int64)
+        distancias = np.empty(0, dtype=np.float64)
+        r = 0
+        while True:
+            nuevos = self._puntos_anillo(cx, cy, r)
+            if len(nuevos):
+                candidatos = np.concatenate((candidatos, nuevos))
+                distancias = np.concatenate((distancias, self._distancias_a(nuevos, punto)))
+            # Todo punto no revisado está al menos a r * lado de distancia
+            alcance = r * self.lado
+            if len(candidatos) >= k:
+                orden = np.lexsort((candidatos, distancias))[:k]
+                if distancias[orden[-1]] < alcance:
+                    break
+            if alcance > limite or self._cubre_todo(cx, cy, r):
+                break
+            r += 1
+        orden = np.lexsort((candidatos, distancias))[:k]
+        orden = orden[distancias[orden] <= limite]
+        return candidatos[orden], distancias[orden]
+
+    def mas_cercano(self, punto: Tuple[float, float], limite: float = math.inf) -> Tuple[float, int]:
+        """Punto más cercano a `punto` dentro de `limite` (o (inf, -1))"""
+        indices, distancias = self.k_mas_cercanos(punto, 1, limite)
+        if len(indices) == 0:
+            return math.inf, -1
+        return float(distancias[0]), int(indices[0])
+
+    def en_radio(self, punto: Tuple[float, float], radio: float) -> np.ndarray:
+        """Índices de los puntos a distancia <= `radio`, ordenados por (distancia, índice)"""
+        if radio < 0:
+            return np.empty(0, dtype=np.int64)
+        x, y = punto
+        cx0, cy0 = self._celda_de((x - radio, y - radio))
+        cx1, cy1 = self._celda_de((x + radio, y + radio))
+        candidatos = self._puntos_rectangulo(cx0, cx1, cy0, cy1)
+        distancias = self._distancias_a(candidatos, punto)
+        dentro = distancias <= radio
+        candidatos, distancias = candidatos[dentro], distancias[dentro]
+        return candidatos[np.lexsort((candidatos, distancias))]
+
+    def celdas_ocupadas(self) -> np.ndarray:
+        """Identificadores de las celdas con al menos un punto"""
+        return np.flatnonzero(np.diff(self.inicio_celda))
+
+    def k_vecinos(self, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """k vecinos más cercanos de cada punto, ordenados por (distancia, índice)"""
+        n = len(self.coordenadas)
+        k = min(k, n - 1)
+        vecinos = np.empty((n, k), dtype=np.int64)
+        distancias = np.empty((n, k), dtype=np.float64)
+        if k > 0:
+            self.k_vecinos_en_celdas(k, self.celdas_ocupadas(), vecinos, distancias)
+        return vecinos, distancias
+
+    def k_vecinos_en_celdas(
+        self,
+        k: int,
+        celdas: np.ndarray,
+        vecinos: np.ndarray,
+        distancias: np.ndarray
+    ):
+        """Llena `vecinos` y `distancias` solo para los puntos de las celdas dadas"""
+        for celda in celdas:
+            cx, cy = divmod(int(celda), self.celdas_y)
+            pendientes = self.orden[self.inicio_celda[celda]:self.inicio_celda[celda + 1]]
+            r = 1
+            while len(pendientes):
+                candidatos = np.sort(self._puntos_rectangulo(cx - r, cx + r, cy - r, cy + r))
+                completo = self._cubre_todo(cx, cy, r)
+                if len(candidatos) - 1 < k and not completo:
+                    r += 1
+                    continue
+
+                dx = self.coordenadas[candidatos, 0] - self.coordenadas[pendientes, 0][:, None]
+                dy = self.coordenadas[candidatos, 1] - self.coordenadas[pendientes, 1][:, None]
+                d = np.sqrt(dx * dx + dy * dy)
+                d[candidatos[None, :] == pendientes[:, None]] = np.inf
+                # Orden estable: a igual distancia gana el índice menor
+                orden = np.argsort(d, axis=1, kind='stable')[:, :k]
+                d_k = np.take_along_axis(d, orden, axis=1)
+
+                # Solo es exacto si ningún punto fuera del rectángulo puede estar más cerca
+                exactos = np.ones(len(pendientes), dtype=bool) if completo else d_k[:, -1] < r * self.lado
+                vecinos[pendientes[exactos]] = candidatos[orden[exactos]]
+                distancias[pendientes[exactos]] = d_k[exactos]
+                pendientes = pendientes[~exactos]
+                r += 1
+
+    def vecino_externo(
+        self,
+        i: int,
+        etiquetas: np.ndarray,
+        limite: float = math.inf
+    ) -> Tuple[float, int]:
+        """Punto más cercano a i con etiqueta distinta, dentro de `limite` (o (inf, -1))"""
+        cx, cy = int(self.celda_x[i]), int(self.celda_y[i])
+        x, y = self.coordenadas[i]
+        etiqueta = etiquetas[i]
+        mejor_d, mejor_j = math.inf, -1
+        r = 0
+        while True:
+            candidatos = self._puntos_anillo(cx, cy, r)
+            if len(candidatos):
+                candidatos = candidatos[etiquetas[candidatos] != etiqueta]
+            if len(candidatos):
+                dx = self.coordenadas[candidatos, 0] - x
+                dy = self.coordenadas[candidatos, 1] - y
+                d = np.sqrt(dx * dx + dy * dy)
+                minimo = d.min()
+                if minimo <= mejor_d:
+                    j = int(candidatos[d == minimo].min())
+                    if minimo < mejor_d or j < mejor_j:
+                        mejor_d, mejor_j = float(minimo), j
+            # Todo punto no revisado está al menos a r * lado de distancia
+            alcance = r * self.lado
+            if mejor_d < alcance or alcance > limite or self._cubre_todo(cx, cy, r):
+                break
+            r += 1
+        if mejor_d > limite:
+            return math.inf, -1
+        return mejor_d, mejor_j
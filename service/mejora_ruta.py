@@ -0,0 +1,197 @@
+import time
+import numpy as np
+from dataclasses import dataclass
+from typing import Optional
+from .indice_espacial import IndiceEspacial
+from .metricas import Metrica, MetricaEquirectangular, MetricaEuclidiana
+
+
+def longitud_ruta(
+    coordenadas: np.ndarray,
+    ruta: np.ndarray,
+    metrica: Optional[Metrica] = None
+) -> float:
+    """Longitud recorrida siguiendo la ruta (camino abierto)"""
+    if len(ruta) < 2:
+        return 0.0
+    metrica = metrica or MetricaEuclidiana()
+    puntos = coordenadas[ruta]
+    return float(metrica.distancias_lote(puntos[:-1], puntos[1:]).sum())
+
+
+@dataclass
+class ResultadoMejora:
+    """Ruta refinada y métricas del refinamiento"""
+    ruta: np.ndarray
+    longitud_inicial: float
+    longitud_final: float
+    iteraciones: int
+
+
+class MejoradorRuta:
+    """Refina una ruta abierta con movimientos 2-opt y Or-opt.
+
+    Los candidatos salen de listas de vecinos cercanos precalculadas, de modo
+    que cada posición evalúa solo k movimientos en lote. El primer estado de
+    la ruta queda fijo y el final queda libre. Se detiene al no encontrar
+    mejoras o al agotar el presupuesto de tiempo o de iteraciones.
+    """
+
+    def __init__(
+        self,
+        k_vecinos: int = 8,
+        max_iteraciones: int = 50,
+        tiempo_limite: Optional[float] = 2.0,
+        longitud_segmento: int = 3,
+        metrica: Optional[Metrica] = None
+    ):
+        self.metrica: Metrica = metrica or MetricaEuclidiana()
+        self.k_vecinos = k_vecinos
+        self.max_iteraciones = max_iteraciones
+        self.tiempo_limite = tiempo_limite
+        self.longitud_segmento = longitud_segmento
+
+    def mejorar(self, coordenadas: np.ndarray, ruta: np.ndarray) -> ResultadoMejora:
+        coordenadas = np.ascontiguousarray(coordenadas, dtype=np.float64)
+        ruta = np.array(ruta, dtype=np.int64)
+        inicial = longitud_ruta(coordenadas, ruta, self.metrica)
+        if len(ruta) < 4:
+            return ResultadoMejora(ruta, inicial, inicial, 0)
+
+        # Para métricas no planas, los candidatos salen de la proyección equirectangular
+        planas = self.metrica.proyectar(coordenadas)
+        if planas is None:
+            planas = MetricaEquirectangular().proyectar(coordenadas)
+        vecinos, _ = IndiceEspacial(planas).k_vecinos(self.k_vecinos)
+        limite = None if self.tiempo_limite is None else time.perf_counter() + self.tiempo_limite
+        iteraciones = 0
+        while iteraciones < self.max_iteraciones:
+            iteraciones += 1
+            mejoro = self._pasada_2opt(coordenadas, ruta, vecinos, limite)
+            mejoro = self._pasada_or_opt(coordenadas, ruta, vecinos, limite) or mejoro
+            if not mejoro or (limite is not None and time.perf_counter() > limite):
+                break
+
+        final = longitud_ruta(coordenadas, ruta, self.metrica)
+        return ResultadoMejora(ruta, inicial, final, iteraciones)
+
+    def _distancia(self, coordenadas: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        return self.metrica.distancias_lote(coordenadas[a], coordenadas[b])
+
+    def _pasada_2opt(
+        self,
+        coordenadas: np.ndarray,
+        ruta: np.ndarray,
+        vecinos: np.ndarray,
+        limite: Optional[float]
+    ) -> bool:
+        """Invierte tramos ruta[i+1..j] cuando la nueva arista (ruta[i], ruta[j]) acorta la ruta"""
+        n = len(ruta)
+        posicion = np.empty(n, dtype=np.int64)
+        posicion[ruta] = np.arange(n)
+        # Extremo virtual: la arista de salida del último estado cuesta 0
+        extendida = np.append(ruta, -1)
+        mejoro = False
+        for p in range(n - 1):
+            if limite is not None and time.perf_counter() > limite:
+                break
+            q = posicion[vecinos[ruta[p]]]
+            i = np.minimum(p, q)
+            j = np.maximum(p, q)
+            validos = j > i + 1
+            if not validos.any():
+                continue
+            i, j = i[validos], j[validos]
+            siguiente = extendida[j + 1]
+            hay_siguiente = siguiente >= 0
+            siguiente = np.where(hay_siguiente, siguiente, ruta[j])
+            delta = (
+                self._distancia(coordenadas, ruta[i], ruta[j])
+                - self._distancia(coordenadas, ruta[i], ruta[i + 1])
+                + (self._distancia(coordenadas, ruta[i + 1], siguiente)
+                   - self._distancia(coordenadas, ruta[j], siguiente)) * hay_siguiente
+            )
+            mejor = int(np.argmin(delta))
+            if delta[mejor] < -1e-12:
+                a, b = int(i[mejor]) + 1, int(j[mejor]) + 1
+                ruta[a:b] = ruta[a:b][::-1].copy()
+                posicion[ruta[a:b]] = np.arange(a, b)
+                extendida[a:b] = ruta[a:b]
+                mejoro = True
+        return mejoro
+
+    def _pasada_or_opt(
+        self,
+        coordenadas: np.ndarray,
+        ruta: np.ndarray,
+        vecinos: np.ndarray,
+        limite: Optional[float]
+    ) -> bool:
+        """Reubica segmentos cortos junto a vecinos cercanos, en cualquier orientación"""
+        n = len(ruta)
+        posicion = np.empty(n, dtype=np.int64)
+        posicion[ruta] = np.arange(n)
+        mejoro = False
+        p = 1
+        while p < n:
+            if limite is not None and time.perf_counter() > limite:
+                break
+            movido = False
+            for largo in range(1, self.longitud_segmento + 1):
+                if p + largo > n:
+                    break
+                nueva = self._mover_segmento(coordenadas, ruta, posicion, vecinos, p, largo)
+                if nueva is not None:
+                    ruta[:] = nueva
+                    posicion[ruta] = np.arange(n)
+                    movido = mejoro = True
+                    break
+            if not movido:
+                p += 1
+        return mejoro
+
+    def _mover_segmento(
+        self,
+        coordenadas: np.ndarray,
+        ruta: np.ndarray,
+        posicion: np.ndarray,
+        vecinos: np.ndarray,
+        p: int,
+        largo: int
+    ) -> Optional[np.ndarray]:
+        n = len(ruta)
+        primero, ultimo = ruta[p], ruta[p + largo - 1]
+        previo = ruta[p - 1]
+
+        def d(a, b):
+            return self._distancia(coordenadas, a, b)
+
+        if p + largo < n:
+            siguiente = ruta[p + largo]
+            ahorro = float(d(previo, primero) + d(ultimo, siguiente) - d(previo, siguiente))
+        else:
+            ahorro = float(d(previo, primero))
+
+        # Inserción entre ruta[q] y ruta[q + 1], con q vecino de algún extremo
+        q = np.unique(posicion[np.concatenate([vecinos[primero], vecinos[ultimo]])])
+        q = q[((q < p - 1) | (q >= p + largo)) & (q >= 0)]
+        if len(q) == 0:
+            return None
+        izquierda = ruta[q]
+        tiene_derecha = q + 1 < n
+        derecha = ruta[np.minimum(q + 1, n - 1)]
+        base = np.where(tiene_derecha, d(izquierda, derecha), 0.0)
+        directo = d(izquierda, primero) + np.where(tiene_derecha, d(ultimo, derecha), 0.0) - base
+        invertido = d(izquierda, ultimo) + np.where(tiene_derecha, d(primero, derecha), 0.0) - base
+        costos = np.minimum(directo, invertido)
+        mejor = int(np.argmin(costos))
+        if costos[mejor] - ahorro >= -1e-12:
+            return None
+
+        segmento = ruta[p:p + largo]
+        if invertido[mejor] < directo[mejor]:
+            segmento = segmento[::-1]
+        resto = np.concatenate([ruta[:p], ruta[p + largo:]])
+        destino = int(q[mejor])
+        destino = destino if destino < p else destino - largo
+        return np.concatenate([resto[:destino + 1], segmento, resto[destino + 1:]])
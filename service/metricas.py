@@ -0,0 +1,122 @@
+import math
+import numpy as np
+from abc import ABC, abstractmethod
+from typing import Optional, Sequence
+
+# Radio medio de la Tierra en km
+RADIO_TIERRA_KM = 6371.0088
+# Latitud central aproximada de México, referencia para la proyección equirectangular
+LATITUD_REFERENCIA_MEXICO = 23.6
+
+
+class Metrica(ABC):
+    """Métrica de distancia entre coordenadas (longitud, latitud) con API por lotes"""
+    nombre = "metrica"
+
+    @abstractmethod
+    def distancias_lote(self, origen: np.ndarray, destino: np.ndarray) -> np.ndarray:
+        """Distancias elemento a elemento entre arreglos (..., 2) compatibles"""
+        pass
+
+    def matriz(self, origen: np.ndarray, destino: np.ndarray) -> np.ndarray:
+        """Matriz (m, k) de distancias entre cada punto de `origen` y cada uno de `destino`"""
+        return self.distancias_lote(origen[:, None, :], destino[None, :, :])
+
+    def distancia(self, a: Sequence[float], b: Sequence[float]) -> float:
+        return float(self.distancias_lote(np.asarray(a, dtype=np.float64),
+                                          np.asarray(b, dtype=np.float64)))
+
+    def proyectar(self, coordenadas: np.ndarray) -> Optional[np.ndarray]:
+        """Coordenadas planas donde la distancia euclidiana coincide con esta métrica.
+
+        Devuelve None si la métrica no admite tal proyección; las estrategias
+        geométricas (rejilla, Borůvka) la necesitan.
+        """
+        return None
+
+    @property
+    def proyectable(self) -> bool:
+        return self.proyectar(np.zeros((1, 2))) is not None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class MetricaEuclidiana(Metrica):
+    """Distancia euclidiana plana sobre los grados sin transformar"""
+    nombre = "euclidiana"
+
+    def distancias_lote(self, origen: np.ndarray, destino: np.ndarray) -> np.ndarray:
+        dx = destino[..., 0] - origen[..., 0]
+        dy = destino[..., 1] - origen[..., 1]
+        return np.sqrt(dx * dx + dy * dy)
+
+    def distancia(self, a: Sequence[float], b: Sequence[float]) -> float:
+        x1, y1 = a
+        x2, y2 = b
+        return ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
+
+    def proyectar(self, coordenadas: np.ndarray) -> Optional[np.ndarray]:
+        return coordenadas
+
+
+class MetricaHaversine(Metrica):
+    """Distancia de círculo máximo en km (fórmula de haversine)"""
+    nombre = "haversine"
+
+    def __init__(self, radio: float = RADIO_TIERRA_KM):
+        self.radio = radio
+
+    def distancias_lote(self, origen: np.ndarray, destino: np.ndarray) -> np.ndarray:
+        lon1, lat1 = np.radians(origen[..., 0]), np.radians(origen[..., 1])
+        lon2, lat2 = np.radians(destino[..., 0]), np.radians(destino[..., 1])
+        s_lat = np.sin((lat2 - lat1) / 2)
+        s_lon = np.sin((lon2 - lon1) / 2)
+        a = s_lat * s_lat + np.cos(lat1) * np.cos(lat2) * s_lon * s_lon
+        return 2 * self.radio * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+    def __repr__(self) -> str:
+        return f"MetricaHaversine(radio={self.radio})"
+
+
+class MetricaEquirectangular(Metrica):
+    """Aproximación equirectangular en km con una latitud de referencia fija.
+
+    Con la referencia fija es exactamente euclidiana tras proyectar, por lo que
+    sirve para las estrategias geométricas y es más barata que haversine.
+    """
+    nombre = "equirectangular"
+
+    def __init__(
+        self,
+        latitud_referencia: float = LATITUD_REFERENCIA_MEXICO,
+        radio: float = RADIO_TIERRA_KM
+    ):
+        self.latitud_referencia = latitud_referencia
+        self.radio = radio
+        self._escala_x = radio * math.radians(1.0) * math.cos(math.radians(latitud_referencia))
+        self._escala_y = radio * math.radians(1.0)
+
+    def distancias_lote(self, origen: np.ndarray, destino: np.ndarray) -> np.ndarray:
+        dx = (destino[..., 0] - origen[..., 0]) * self._escala_x
+        dy = (destino[..., 1] - origen[..., 1]) * self._escala_y
+        return np.sqrt(dx * dx + dy * dy)
+
+    def proyectar(self, coordenadas: np.ndarray) -> Optional[np.ndarray]:
+        return np.ascontiguousarray(coordenadas * (self._escala_x, self._escala_y))
+
+    def __repr__(self) -> str:
+        return (f"MetricaEquirectangular(latitud_referencia={self.latitud_referencia}, "
+                f"radio={self.radio})")
+
+
+def metrica_por_nombre(nombre: str) -> Metrica:
+    """Instancia una métrica a partir de su nombre ('euclidiana', 'haversine', ...)"""
+    metricas = {
+        MetricaEuclidiana.nombre: MetricaEuclidiana,
+        MetricaHaversine.nombre: MetricaHaversine,
+        MetricaEquirectangular.nombre: MetricaEquirectangular,
+    }
+    if nombre not in metricas:
+        raise ValueError(f"Métrica desconocida: {nombre}")
+    return metricas[nombre]()
@@ -0,0 +1,226 @@
+"""Mantenimiento incremental del MST y reparación local de la ruta.
+
+Las aristas se comparan con la clave (peso, menor índice, mayor índice), el
+mismo orden total con el que Kruskal rompe empates, así que el árbol
+resultante coincide con el de un recálculo completo sobre los mismos índices.
+"""
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+from .arbol import ArbolExpansion
+from .metricas import Metrica
+from .recorrido import adyacencia_csr, preorden
+
+Clave = Tuple[float, int, int]
+
+# Filas por bloque al buscar la arista mínima entre dos grupos de puntos
+FILAS_POR_BLOQUE = 1024
+
+
+def _clave(peso: float, a: int, b: int) -> Clave:
+    return (peso, a, b) if a < b else (peso, b, a)
+
+
+def _arbol_desde_claves(nombres: List[str], claves: Sequence[Clave]) -> ArbolExpansion:
+    if not claves:
+        vacio = np.empty(0, dtype=np.int64)
+        return ArbolExpansion(nombres, vacio, vacio.copy(), np.empty(0, dtype=np.float64))
+    pesos, origen, destino = (np.array(columna) for columna in zip(*claves))
+    return ArbolExpansion(
+        nombres, origen.astype(np.int64), destino.astype(np.int64), pesos.astype(np.float64)
+    )
+
+
+def _padres_desde(
+    num_nodos: int,
+    origen: np.ndarray,
+    destino: np.ndarray,
+    pesos: np.ndarray,
+    raiz: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    indptr, vecinos, _ = adyacencia_csr(num_nodos, origen, destino, pesos)
+    return preorden(indptr, vecinos, raiz)
+
+
+def insertar_nodo(
+    arbol: ArbolExpansion,
+    coordenadas: np.ndarray,
+    nombres: List[str],
+    metrica: Metrica,
+    posicion: int
+) -> ArbolExpansion:
+    """MST tras insertar el punto `coordenadas[posicion]` (los índices >= posicion se desplazan).
+
+    Algoritmo de Chin y Houck, O(n): el árbol nuevo está contenido en el
+    anterior más las aristas del punto nuevo. En postorden, cada nodo
+    conserva la arista más pesada de su camino al punto nuevo y, al unirse
+    con su padre, se descarta la más pesada del ciclo que se cierra.
+    """
+    n = len(coordenadas)
+    origen = arbol.origen + (arbol.origen >= posicion)
+    destino = arbol.destino + (arbol.destino >= posicion)
+    if n == 1:
+        return _arbol_desde_claves(nombres, [])
+    distancias = metrica.matriz(coordenadas[posicion:posicion + 1], coordenadas)[0]
+
+    # El nodo `posicion` no está en el árbol anterior: queda aislado en el recorrido
+    raiz = 1 if posicion == 0 else 0
+    orden, padres = _padres_desde(n, origen, destino, arbol.pesos, raiz)
+    peso_arista = {
+        (a, b): w for a, b, w in zip(origen.tolist(), destino.tolist(), arbol.pesos.tolist())
+    }
+    padres_lista = padres.tolist()
+    # maximo[v]: arista más pesada del camino de v al punto nuevo, en lo ya procesado
+    maximo = [_clave(w, v, posicion) for v, w in enumerate(distancias.tolist())]
+    descartadas = set()
+    for v in reversed(orden.tolist()):
+        p = padres_lista[v]
+        if p < 0:
+            continue
+        a, b = (v, p) if v < p else (p, v)
+        candidata = max(maximo[v], (peso_arista[(a, b)], a, b))
+        mayor = max(candidata, maximo[p])
+        descartadas.add(mayor)
+        if mayor == maximo[p]:
+            maximo[p] = candidata
+
+    claves = [(w, a, b) for (a, b), w in peso_arista.items()]
+    claves.extend(_clave(w, v, posicion) for v, w in enumerate(distancias.tolist()) if v != posicion)
+    return _arbol_desde_claves(nombres, [clave for clave in claves if clave not in descartadas])
+
+
+def _arista_minima(
+    coordenadas: np.ndarray,
+    metrica: Metrica,
+    grupo_a: np.ndarray,
+    grupo_b: np.ndarray
+) -> Clave:
+    """Arista de menor clave entre dos grupos disjuntos de puntos"""
+    mejor: Optional[Clave] = None
+    for inicio in range(0, len(grupo_a), FILAS_POR_BLOQUE):
+        filas = grupo_a[inicio:inicio + FILAS_POR_BLOQUE]
+        matriz = metrica.matriz(coordenadas[filas], coordenadas[grupo_b])
+        minimo = matriz.min()
+        if mejor is not None and minimo > mejor[0]:
+            continue
+        # Empates: gana el par de índices lexicográficamente menor
+        i, j = np.nonzero(matriz == minimo)
+        a, b = filas[i], grupo_b[j]
+        bajo, alto = np.minimum(a, b), np.maximum(a, b)
+        k = np.lexsort((alto, bajo))[0]
+        clave = (float(minimo), int(bajo[k]), int(alto[k]))
+        if mejor is None or clave < mejor:
+            mejor = clave
+    assert mejor is not None
+    return mejor
+
+
+def eliminar_nodo(
+    arbol: ArbolExpansion,
+    coordenadas: np.ndarray,
+    nombres: List[str],
+    metrica: Metrica,
+    posicion: int
+) -> ArbolExpansion:
+    """MST tras quitar el nodo `posicion` (`coordenadas` y `nombres` ya sin él).
+
+    Las aristas no incidentes siguen en el MST; solo se reconectan los
+    componentes que deja el nodo (uno por vecino) con Prim sobre componentes,
+    empezando por el mayor. El costo es O(n · tamaño de los componentes
+    menores); quitar una hoja no requiere distancias.
+    """
+    n_previo = arbol.num_nodos
+    incidente = (arbol.origen == posicion) | (arbol.destino == posicion)
+    vecinos = np.where(arbol.origen[incidente] == posicion,
+                       arbol.destino[incidente], arbol.origen[incidente])
+    origen, destino, pesos = arbol.origen[~incidente], arbol.destino[~incidente], arbol.pesos[~incidente]
+    claves = list(zip(pesos.tolist(), origen.tolist(), destino.tolist()))
+
+    if len(vecinos) > 1:
+        # Componentes: el subárbol de cada vecino al enraizar en el nodo quitado
+        orden, padres = _padres_desde(
+            n_previo, arbol.origen, arbol.destino, arbol.pesos, posicion
+        )
+        componente = np.full(n_previo, -1, dtype=np.int64)
+        componente[vecinos] = np.arange(len(vecinos))
+        padres_lista = padres.tolist()
+        componente_lista = componente.tolist()
+        for v in orden.tolist()[1:]:
+            if componente_lista[v] < 0:
+                componente_lista[v] = componente_lista[padres_lista[v]]
+        componente = np.array(componente_lista, dtype=np.int64)
+        grupos = [np.flatnonzero(componente == c) for c in range(len(vecinos))]
+        claves.extend(_reconectar(coordenadas, metrica, grupos, posicion))
+
+    # Índices posteriores al nodo quitado bajan una posición
+    claves = [
+        (w, a - (a > posicion), b - (b > posicion)) for w, a, b in claves
+    ]
+    return _arbol_desde_claves(nombres, claves)
+
+
+def _reconectar(
+    coordenadas_actuales: np.ndarray,
+    metrica: Metrica,
+    grupos: List[np.ndarray],
+    quitado: int
+) -> List[Clave]:
+    """Aristas que unen los componentes (índices previos a quitar el nodo)"""
+    # Las coordenadas ya no incluyen el nodo quitado: se traducen los índices
+    def coordenadas_de(indices: np.ndarray) -> np.ndarray:
+        return indices - (indices > quitado)
+
+    grupos = sorted(grupos, key=len, reverse=True)
+    unidos = [grupos[0]]
+    mejores: Dict[int, Clave] = {}
+    pendientes = set(range(1, len(grupos)))
+    aristas: List[Clave] = []
+    while pendientes:
+        ultimo = unidos[-1]
+        for g in pendientes:
+            w, a, b = _arista_minima(
+                coordenadas_actuales, metrica, coordenadas_de(grupos[g]), coordenadas_de(ultimo)
+            )
+            # De vuelta a índices previos para ordenar igual que el resto de aristas
+            clave = _clave(w, int(a + (a >= quitado)), int(b + (b >= quitado)))
+            if g not in mejores or clave < mejores[g]:
+                mejores[g] = clave
+        elegido = min(pendientes, key=lambda g: mejores[g])
+        aristas.append(mejores.pop(elegido))
+        pendientes.remove(elegido)
+        unidos.append(grupos[elegido])
+    return aristas
+
+
+def insertar_en_ruta(
+    coordenadas: np.ndarray,
+    ruta: np.ndarray,
+    nodo: int,
+    metrica: Metrica,
+    fijas: int = 1
+) -> np.ndarray:
+    """Inserta `nodo` en la ruta abierta donde menos la alarga, sin tocar las `fijas` primeras"""
+    fijas = max(1, min(fijas, len(ruta)))
+    if len(ruta) == 0:
+        return np.array([nodo], dtype=np.int64)
+    previos = ruta[fijas - 1:]
+    punto = coordenadas[nodo:nodo + 1]
+    hacia = metrica.matriz(punto, coordenadas[previos])[0]
+    # Entre previos[k] y previos[k + 1], o al final
+    costo = np.empty(len(previos))
+    if len(previos) > 1:
+        tramo = metrica.distancias_lote(coordenadas[previos[:-1]], coordenadas[previos[1:]])
+        costo[:-1] = hacia[:-1] + hacia[1:] - tramo
+    costo[-1] = hacia[-1]
+    k = int(np.argmin(costo))
+    return np.insert(ruta, fijas + k, nodo)
+
+
+def quitar_de_ruta(ruta: np.ndarray, nodo: int) -> np.ndarray:
+    """Ruta sin `nodo`; los índices posteriores bajan una posición"""
+    ruta = ruta[ruta != nodo]
+    return ruta - (ruta > nodo)
+
+
+def desplazar_ruta(ruta: np.ndarray, posicion: int) -> np.ndarray:
+    """Abre el índice `posicion` para un nodo insertado"""
+    return ruta + (ruta >= posicion)
@@ -0,0 +1,163 @@
+import math
+import numpy as np
+from typing import List, Tuple
+from .indice_espacial import IndiceEspacial
+from .union_find import UnionFind
+
+# Vecinos candidatos por punto; el resto se resuelve con búsquedas exactas
+K_VECINOS = 10
+
+# (componente, peso, u, v) con u < v: mejor arista conocida por componente
+Candidatas = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def candidatas_por_vecinos(
+    puntos: np.ndarray,
+    etiquetas: np.ndarray,
+    vecinos: np.ndarray,
+    dist_vecinos: np.ndarray
+) -> Tuple[Candidatas, np.ndarray]:
+    """Mejor arista por componente usando solo las listas de vecinos de `puntos`.
+
+    Devuelve también los puntos sin ningún vecino externo en su lista.
+    """
+    # Primer vecino (en orden (distancia, índice)) fuera de la componente
+    externos = etiquetas[vecinos[puntos]] != etiquetas[puntos, None]
+    tiene = externos.any(axis=1)
+    primero = externos.argmax(axis=1)
+    con_candidato = puntos[tiene]
+    filas = primero[tiene]
+    candidatas = reducir_candidatas(
+        etiquetas[con_candidato],
+        dist_vecinos[con_candidato, filas],
+        con_candidato,
+        vecinos[con_candidato, filas]
+    )
+    return candidatas, puntos[~tiene]
+
+
+def reducir_candidatas(
+    componente: np.ndarray,
+    peso: np.ndarray,
+    u: np.ndarray,
+    v: np.ndarray
+) -> Candidatas:
+    """Conserva la arista mínima de cada componente según el orden total (peso, min, max)"""
+    a = np.minimum(u, v)
+    b = np.maximum(u, v)
+    orden = np.lexsort((b, a, peso, componente))
+    ordenada = componente[orden]
+    primeros = orden[np.r_[True, ordenada[1:] != ordenada[:-1]]] if len(orden) else orden
+    return componente[primeros], peso[primeros], a[primeros], b[primeros]
+
+
+def resolver_dudosos(
+    indice: IndiceEspacial,
+    puntos: np.ndarray,
+    etiquetas: np.ndarray,
+    cota: np.ndarray,
+    mejor_peso: np.ndarray,
+    mejor_u: np.ndarray,
+    mejor_v: np.ndarray
+) -> Candidatas:
+    """Búsqueda exacta para puntos cuyo vecino externo puede estar fuera de su lista.
+
+    Solo se revisan los puntos cuya k-ésima distancia no supera la mejor
+    candidata de su componente; la búsqueda queda acotada por esa candidata.
+    Las mejoras se escriben en `mejor_*` y se devuelven en forma compacta.
+    """
+    dudosos = puntos[cota[puntos] <= mejor_peso[etiquetas[puntos]]]
+    mejoradas = set()
+    for i in dudosos[np.lexsort((cota[dudosos], etiquetas[dudosos]))].tolist():
+        c = etiquetas[i]
+        if cota[i] > mejor_peso[c]:
+            continue
+        peso, j = indice.vecino_externo(i, etiquetas, mejor_peso[c])
+        if j < 0:
+            continue
+        a, b = min(i, j), max(i, j)
+        if (peso, a, b) < (mejor_peso[c], mejor_u[c], mejor_v[c]):
+            mejor_peso[c], mejor_u[c], mejor_v[c] = peso, a, b
+            mejoradas.add(int(c))
+    comps = np.array(sorted(mejoradas), dtype=np.int64)
+    return comps, mejor_peso[comps], mejor_u[comps], mejor_v[comps]
+
+
+def tablas_de_mejores(candidatas: Candidatas, num_componentes: int):
+    """Expande candidatas compactas a arreglos indexados por componente"""
+    componente, peso, u, v = candidatas
+    mejor_peso = np.full(num_componentes, np.inf)
+    mejor_u = np.full(num_componentes, -1, dtype=np.int64)
+    mejor_v = np.full(num_componentes, -1, dtype=np.int64)
+    mejor_peso[componente] = peso
+    mejor_u[componente] = u
+    mejor_v[componente] = v
+    return mejor_peso, mejor_u, mejor_v
+
+
+def contraer(
+    coordenadas: np.ndarray,
+    etiquetas: np.ndarray,
+    num_componentes: int,
+    mejor_u: np.ndarray,
+    mejor_v: np.ndarray
+) -> Tuple[np.ndarray, int, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Agrega las aristas elegidas y renumera las componentes resultantes"""
+    # Con el orden total estricto las aristas elegidas no forman ciclos
+    elegidas = np.unique(np.stack([mejor_u, mejor_v], axis=1), axis=0)
+    componentes = UnionFind(num_componentes)
+    nuevas_u, nuevas_v, nuevas_w = [], [], []
+    for u, v in elegidas.tolist():
+        if u < 0 or not componentes.unir(int(etiquetas[u]), int(etiquetas[v])):
+            continue
+        dx = coordenadas[u, 0] - coordenadas[v, 0]
+        dy = coordenadas[u, 1] - coordenadas[v, 1]
+        nuevas_u.append(u)
+        nuevas_v.append(v)
+        nuevas_w.append(math.sqrt(dx * dx + dy * dy))
+
+    _, compactas = np.unique(componentes.etiquetas(), return_inverse=True)
+    aristas = (
+        np.array(nuevas_u, dtype=np.int64),
+        np.array(nuevas_v, dtype=np.int64),
+        np.array(nuevas_w, dtype=np.float64)
+    )
+    return compactas[etiquetas], int(compactas.max()) + 1, aristas
+
+
+def mst_euclidiano(
+    coordenadas: np.ndarray,
+    k: int = K_VECINOS
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MST euclidiano exacto sin construir el grafo completo.
+
+    Usa rondas de Borůvka: la arista más barata que sale de cada componente
+    se toma de los k vecinos más cercanos y, cuando estos no bastan para
+    garantizarla, de una búsqueda exacta en la rejilla acotada por la mejor
+    candidata. Devuelve arreglos (origen, destino, peso) con n - 1 aristas.
+    """
+    n = len(coordenadas)
+    if n < 2:
+        vacio = np.empty(0, dtype=np.int64)
+        return vacio, vacio.copy(), np.empty(0, dtype=np.float64)
+
+    indice = IndiceEspacial(coordenadas)
+    vecinos, dist_vecinos = indice.k_vecinos(k)
+    cota = dist_vecinos[:, -1]
+    puntos = np.arange(n)
+
+    etiquetas = np.arange(n, dtype=np.int64)
+    num_componentes = n
+    aristas: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+
+    while num_componentes > 1:
+        candidatas, sin_candidato = candidatas_por_vecinos(puntos, etiquetas, vecinos, dist_vecinos)
+        mejor_peso, mejor_u, mejor_v = tablas_de_mejores(candidatas, num_componentes)
+        resolver_dudosos(indice, sin_candidato, etiquetas, cota, mejor_peso, mejor_u, mejor_v)
+        etiquetas, num_componentes, nuevas = contraer(
+            coordenadas, etiquetas, num_componentes, mejor_u, mejor_v
+        )
+        aristas.append(nuevas)
+
+    origen, destino, pesos = zip(*aristas)
+    return np.concatenate(origen), np.concatenate(destino), np.concatenate(pesos)
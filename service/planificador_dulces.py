@@ -0,0 +1,205 @@
+import math
+import numpy as np
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+from models.estado import Dulce
+
+# Resolución (kg) con la que se discretizan los pesos en la programación dinámica
+RESOLUCION_PESO = 0.01
+# Dulces distintos que se eligen en cada estado
+DULCES_POR_ESTADO = 3
+# Presupuestos distintos cuyas tablas por etapa se conservan (LRU)
+MAXIMO_MEMO = 64
+
+
+@dataclass
+class PlanDulces:
+    """Selección sugerida para cada estado restante"""
+    selecciones: List[Tuple[int, ...]]  # Índices del catálogo, una tupla por estado
+    peso_total: float
+    variedad: int  # Dulces distintos en todo el plan
+    objetivo: str
+
+
+class PlanificadorDulces:
+    """Planifica los dulces de todo el viaje: 3 distintos por estado bajo un peso máximo.
+
+    Objetivos:
+    - 'peso': máximo peso total que cabe. Programación dinámica por etapas
+      sobre el peso discretizado (redondeado hacia arriba, así que el plan
+      siempre cabe); las tablas de alcanzables por etapa se memorizan por
+      presupuesto (los `maximo_memo` más recientes) y se podan con el peso
+      mínimo de las etapas restantes.
+    - 'variedad': máximo de dulces distintos y, a igualdad, el menor peso.
+      Tiene solución directa: los m más ligeros como distintos y el resto
+      de huecos con repeticiones de los más ligeros.
+    """
+    OBJETIVOS = ('peso', 'variedad')
+
+    def __init__(
+        self,
+        dulces: Sequence[Dulce],
+        resolucion: float = RESOLUCION_PESO,
+        maximo_memo: int = MAXIMO_MEMO
+    ):
+        pesos = getattr(dulces, 'pesos', None)
+        if pesos is None:
+            pesos = [dulce.peso for dulce in dulces]
+        self.pesos = np.asarray(pesos, dtype=np.float64)
+        if (self.pesos < 0).any():
+            raise ValueError("Los pesos de los dulces no pueden ser negativos")
+        if maximo_memo < 1:
+            raise ValueError("El máximo de presupuestos memorizados debe ser positivo")
+        self.resolucion = resolucion
+        # Unidades enteras redondeadas hacia arriba: la suma discreta acota la real
+        self.unidades = np.ceil(self.pesos / resolucion - 1e-9).astype(np.int64)
+        self.orden = np.argsort(self.pesos, kind='stable')
+        self._por_unidad: Dict[int, List[int]] = {}
+        for i in self.orden.tolist():
+            self._por_unidad.setdefault(int(self.unidades[i]), []).append(i)
+        self._sumas_seleccion = self._sumas_alcanzables()
+        self.maximo_memo = maximo_memo
+        self._memo: "OrderedDict[int, List[np.ndarray]]" = OrderedDict()
+
+    def _sumas_alcanzables(self) -> np.ndarray:
+        """Máscara de sumas (en unidades) que logra alguna selección de dulces distintos"""
+        k = DULCES_POR_ESTADO
+        if len(self.pesos) < k:
+            return np.zeros(1, dtype=bool)
+        largo = int(self.unidades.max()) * k + 1
+        # Polinomios de potencias p_j(x) = sum x^(j * u_i); e_k por las identidades de Newton
+        potencias = []
+        for j in range(1, k + 1):
+            p = np.zeros(largo, dtype=np.float64)
+            np.add.at(p, self.unidades[self.unidades * j < largo] * j, 1.0)
+            potencias.append(p)
+        elementales = [np.zeros(largo)]
+        elementales[0][0] = 1.0
+        for m in range(1, k + 1):
+            e = np.zeros(largo)
+            for j in range(1, m + 1):
+                termino = np.convolve(elementales[m - j], potencias[j - 1])[:largo]
+                e += termino if j % 2 == 1 else -termino
+            elementales.append(e / m)
+        return elementales[k] > 0.5
+
+    def _etapas(self, presupuesto: int, num_estados: int) -> List[np.ndarray]:
+        """Sumas alcanzables tras cada etapa (memorizado por presupuesto, LRU)"""
+        etapas = self._memo.get(presupuesto)
+        if etapas is None:
+            etapas = [np.eye(1, presupuesto + 1, dtype=bool)[0]]
+            self._memo[presupuesto] = etapas
+            while len(self._memo) > self.maximo_memo:
+                self._memo.popitem(last=False)
+        else:
+            self._memo.move_to_end(presupuesto)
+        opciones = self._sumas_seleccion.astype(np.int64)
+        while len(etapas) <= num_estados:
+            siguiente = np.convolve(etapas[-1].astype(np.int64), opciones)[:presupuesto + 1] > 0
+            etapas.append(siguiente)
+        return etapas
+
+    def planificar(self, num_estados: int, presupuesto_kg: float, objetivo: str = 'peso') -> PlanDulces:
+        if objetivo not in self.OBJETIVOS:
+            raise ValueError(f"Objetivo desconocido: {objetivo}")
+        if num_estados <= 0:
+            return PlanDulces([], 0.0, 0, objetivo)
+        if objetivo == 'variedad':
+            selecciones = self._plan_variedad(num_estados, presupuesto_kg)
+        else:
+            selecciones = self._plan_peso(num_estados, presupuesto_kg)
+        usados = {i for seleccion in selecciones for i in seleccion}
+        peso = float(sum(self.pesos[list(seleccion)].sum() for seleccion in selecciones))
+        return PlanDulces(selecciones, peso, len(usados), objetivo)
+
+    def _plan_peso(self, num_estados: int, presupuesto_kg: float) -> List[Tuple[int, ...]]:
+        presupuesto = int(math.floor(presupuesto_kg / self.resolucion + 1e-9))
+        if presupuesto < 0 or not self._sumas_seleccion.any():
+            raise ValueError("No existe un plan de dulces que quepa en el peso disponible")
+        opciones = np.flatnonzero(self._sumas_seleccion)
+        minimo = int(opciones[0])
+        if minimo * num_estados > presupuesto:
+            raise ValueError("No existe un plan de dulces que quepa en el peso disponible")
+
+        etapas = self._etapas(presupuesto, num_estados)
+        total = int(np.flatnonzero(etapas[num_estados])[-1])
+        # Reconstrucción hacia atrás: en cada etapa, la opción más pesada que deja un
+        # resto alcanzable por las etapas anteriores
+        sumas: List[int] = []
+        for etapa in range(num_estados, 0, -1):
+            previas = total - opciones
+            validas = (previas >= 0) & (previas <= presupuesto)
+            validas[validas] = etapas[etapa - 1][previas[validas]]
+            suma = int(opciones[np.flatnonzero(validas)[-1]])
+            sumas.append(suma)
+            total -= suma
+        usos = np.zeros(len(self.pesos), dtype=np.int64)
+        selecciones = []
+        for suma in sumas:
+            seleccion = self._seleccion_con_suma(suma, usos)
+            usos[list(seleccion)] += 1
+            selecciones.append(seleccion)
+        return selecciones
+
+    def _seleccion_con_suma(self, suma: int, usos: np.ndarray) -> Tuple[int, ...]:
+        """Trío de dulces distintos cuyas unidades suman `suma`, prefiriendo los menos usados"""
+        unidades = sorted(self._por_unidad)
+        mejor = None
+        for a_pos, a in enumerate(unidades):
+            if 3 * a > suma:
+                break
+            for b in unidades[a_pos:]:
+                c = suma - a - b
+                if c < b:
+                    break
+                if c not in self._por_unidad:
+                    continue
+                necesarios: Dict[int, int] = {}
+                for u in (a, b, c):
+                    necesarios[u] = necesarios.get(u, 0) + 1
+                if any(len(self._por_unidad[u]) < n for u, n in necesarios.items()):
+                    continue
+                seleccion = []
+                for u, n in necesarios.items():
+                    candidatos = sorted(self._por_unidad[u], key=lambda i: usos[i])
+                    seleccion.extend(candidatos[:n])
+                costo = int(usos[seleccion].sum())
+                if mejor is None or costo < mejor[0]:
+                    mejor = (costo, tuple(sorted(seleccion)))
+                    if costo == 0:
+                        return mejor[1]
+        if mejor is None:
+            raise ValueError(f"No hay selección con suma {suma}")
+        return mejor[1]
+
+    def _plan_variedad(self, num_estados: int, presupuesto_kg: float) -> List[Tuple[int, ...]]:
+        k = DULCES_POR_ESTADO
+        huecos = k * num_estados
+        ligeros = self.pesos[self.orden]
+        acumulado = np.concatenate(([0.0], np.cumsum(ligeros)))
+
+        def peso_minimo(m: int) -> float:
+            # m distintos + (huecos - m) repeticiones; cada dulce admite num_estados - 1 más
+            extra = huecos - m
+            llenos, resto = divmod(extra, num_estados - 1) if num_estados > 1 else (0, extra)
+            if llenos + (resto > 0) > m:
+                return math.inf
+            parcial = resto * ligeros[llenos] if resto else 0.0
+            return float(acumulado[m] + (num_estados - 1) * acumulado[llenos] + parcial)
+
+        for m in range(min(len(ligeros), huecos), k - 1, -1):
+            if peso_minimo(m) <= presupuesto_kg + 1e-9:
+                break
+        else:
+            raise ValueError("No existe un plan de dulces que quepa en el peso disponible")
+
+        # Multiconjunto agrupado por dulce; el reparto circular nunca repite dulce en un estado
+        extra = huecos - m
+        conteos = np.ones(m, dtype=np.int64)
+        for j in range(m):
+            adicional = min(extra, num_estados - 1)
+            conteos[j] += adicional
+            extra -= adicional
+        piezas = np.repeat(self.orden[:m], conteos)
+        return [tuple(sorted(piezas[e::num_estados].tolist())) for e in range(num_estados)]
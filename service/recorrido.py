@@ -0,0 +1,51 @@
+import numpy as np
+from typing import Tuple
+
+
+def adyacencia_csr(
+    num_nodos: int,
+    origen: np.ndarray,
+    destino: np.ndarray,
+    pesos: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Adyacencia CSR de un grafo no dirigido.
+
+    Los vecinos de cada nodo quedan ordenados por (peso, índice de vecino),
+    un orden determinista que no depende del motor que produjo las aristas.
+    """
+    fuente = np.concatenate([origen, destino])
+    vecino = np.concatenate([destino, origen])
+    peso = np.concatenate([pesos, pesos])
+    orden = np.lexsort((vecino, peso, fuente))
+    indptr = np.zeros(num_nodos + 1, dtype=np.int64)
+    np.cumsum(np.bincount(fuente, minlength=num_nodos), out=indptr[1:])
+    return indptr, vecino[orden], peso[orden]
+
+
+def preorden(indptr: np.ndarray, indices: np.ndarray, inicio: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Recorrido en preorden iterativo desde `inicio` sobre una adyacencia CSR.
+
+    Devuelve el orden de visita y el padre de cada nodo (-1 en la raíz y en
+    los nodos no alcanzados). Equivale a un DFS recursivo que visita los
+    vecinos en el orden del CSR, sin límite de profundidad.
+    """
+    n = len(indptr) - 1
+    punteros = indptr.tolist()
+    vecinos = indices.tolist()
+    visitados = bytearray(n)
+    padres = [-1] * n
+    orden = []
+    pila = [inicio]
+    while pila:
+        nodo = pila.pop()
+        if visitados[nodo]:
+            continue
+        visitados[nodo] = 1
+        orden.append(nodo)
+        # Se apilan al revés para visitar primero el vecino de menor orden
+        for posicion in range(punteros[nodo + 1] - 1, punteros[nodo] - 1, -1):
+            vecino = vecinos[posicion]
+            if not visitados[vecino]:
+                padres[vecino] = nodo
+                pila.append(vecino)
+    return np.array(orden, dtype=np.int64), np.array(padres, dtype=np.int64)
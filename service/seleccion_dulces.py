@@ -0,0 +1,122 @@
+import numpy as np
+from bisect import bisect_right
+from typing import Iterator, Optional, Sequence, Tuple
+from models.estado import Dulce
+
+# Holgura para comparar sumas de pesos en punto flotante
+TOLERANCIA_PESO = 1e-9
+
+
+class IndiceSeleccionDulces:
+    """Índice sobre el catálogo de dulces para consultar selecciones que caben.
+
+    Guarda los pesos ordenados y las sumas prefijo de los más ligeros y de
+    los más pesados, de modo que "¿queda alguna selección?" y "¿caben
+    todas?" son O(1), "¿este dulce sigue siendo elegible?" es O(k) y la
+    máscara de elegibles de todo el catálogo es O(n).
+    """
+
+    def __init__(self, dulces: Sequence[Dulce], tamano_seleccion: int = 3):
+        pesos = getattr(dulces, 'pesos', None)
+        if pesos is None:
+            pesos = [dulce.peso for dulce in dulces]
+        self.pesos = np.asarray(pesos, dtype=np.float64)
+        self.tamano_seleccion = tamano_seleccion
+        self.orden = np.argsort(self.pesos, kind='stable')
+        self.pesos_ordenados = self.pesos[self.orden]
+        # suma_menores[r] / suma_mayores[r]: suma de los r más ligeros / más pesados
+        self.suma_menores = np.concatenate(([0.0], np.cumsum(self.pesos_ordenados)))
+        self.suma_mayores = np.concatenate(([0.0], np.cumsum(self.pesos_ordenados[::-1])))
+        self._lista_ordenada = self.pesos_ordenados.tolist()
+
+    def __len__(self) -> int:
+        return len(self.pesos)
+
+    def peso_minimo(self) -> float:
+        """Peso de la selección más ligera posible"""
+        return float(self.suma_menores[min(self.tamano_seleccion, len(self))])
+
+    def hay_seleccion_factible(self, presupuesto: float) -> bool:
+        return len(self) >= self.tamano_seleccion and self.peso_minimo() <= presupuesto + TOLERANCIA_PESO
+
+    def todas_factibles(self, presupuesto: float) -> bool:
+        """True si incluso la selección más pesada cabe en el presupuesto"""
+        return float(self.suma_mayores[min(self.tamano_seleccion, len(self))]) <= presupuesto + TOLERANCIA_PESO
+
+    def _menores_excluyendo(self, excluidos: Sequence[int], cantidad: int) -> np.ndarray:
+        """Pesos de los `cantidad` dulces más ligeros fuera de `excluidos` (O(cantidad + k))"""
+        excluir = set(excluidos)
+        pesos = [
+            self.pesos[i] for i in self.orden[:cantidad + len(excluir)].tolist() if i not in excluir
+        ]
+        return np.array(pesos[:cantidad], dtype=np.float64)
+
+    def es_seleccionable(self, indice: int, presupuesto: float, elegidos: Sequence[int] = ()) -> bool:
+        """¿Puede `indice` completar, junto a `elegidos`, una selección que quepa?"""
+        if indice in elegidos:
+            return True
+        faltan = self.tamano_seleccion - len(elegidos) - 1
+        if faltan < 0:
+            return False
+        relleno = self._menores_excluyendo([*elegidos, indice], faltan)
+        if len(relleno) < faltan:
+            return False
+        peso = self.pesos[list(elegidos)].sum() + self.pesos[indice] + relleno.sum()
+        return bool(peso <= presupuesto + TOLERANCIA_PESO)
+
+    def seleccionables(self, presupuesto: float, elegidos: Sequence[int] = ()) -> np.ndarray:
+        """Máscara booleana de dulces que aún pueden formar parte de la selección"""
+        mascara = np.zeros(len(self), dtype=bool)
+        elegidos = list(elegidos)
+        mascara[elegidos] = True
+        faltan = self.tamano_seleccion - len(elegidos) - 1
+        if faltan < 0:
+            return mascara
+        # Los faltan + 1 más ligeros libres: si i está entre los primeros `faltan`,
+        # su relleno es el siguiente; si no, el relleno son esos `faltan`
+        ligeros = self._menores_excluyendo(elegidos, faltan + 1)
+        if len(ligeros) < faltan + 1:
+            return mascara
+        fijo = self.pesos[elegidos].sum()
+        umbral = presupuesto + TOLERANCIA_PESO - fijo
+        relleno = np.full(len(self), ligeros[:faltan].sum())
+        if faltan > 0:
+            primeros = self._primeros_libres(elegidos, faltan)
+            relleno[primeros] = ligeros.sum() - self.pesos[primeros]
+        libres = self.pesos + relleno <= umbral
+        libres[elegidos] = True
+        return libres
+
+    def _primeros_libres(self, elegidos: Sequence[int], cantidad: int) -> np.ndarray:
+        excluir = set(elegidos)
+        return np.array(
+            [i for i in self.orden[:cantidad + len(excluir)].tolist() if i not in excluir][:cantidad],
+            dtype=np.int64
+        )
+
+    def selecciones_factibles(
+        self, presupuesto: float, limite: Optional[int] = None
+    ) -> Iterator[Tuple[int, ...]]:
+        """Tríos (índices del catálogo) con peso <= presupuesto, en orden de pesos ascendente por posición.
+
+        Recorre los pesos ordenados con poda y búsqueda binaria, así que el
+        coste es proporcional al número de tríos devueltos (más O(n)).
+        """
+        if self.tamano_seleccion != 3:
+            raise ValueError("La enumeración solo está disponible para selecciones de 3 dulces")
+        w = self._lista_ordenada
+        n = len(w)
+        tope = presupuesto + TOLERANCIA_PESO
+        emitidos = 0
+        for a in range(n - 2):
+            if w[a] + w[a + 1] + w[a + 2] > tope:
+                break
+            for b in range(a + 1, n - 1):
+                if w[a] + w[b] + w[b + 1] > tope:
+                    break
+                fin = bisect_right(w, tope - w[a] - w[b], b + 1)
+                for c in range(b + 1, fin):
+                    yield (int(self.orden[a]), int(self.orden[b]), int(self.orden[c]))
+                    emitidos += 1
+                    if limite is not None and emitidos >= limite:
+                        return
@@ -0,0 +1,39 @@
+import numpy as np
+
+
+class UnionFind:
+    """Conjuntos disjuntos sobre arreglos, con compresión de caminos y unión por rango"""
+
+    def __init__(self, n: int):
+        # Listas planas: el acceso por índice es más barato que en arreglos de numpy
+        self._padres = list(range(n))
+        self._rangos = [0] * n
+        self.num_conjuntos = n
+
+    def buscar(self, x: int) -> int:
+        padres = self._padres
+        raiz = x
+        while padres[raiz] != raiz:
+            raiz = padres[raiz]
+        while padres[x] != raiz:
+            padres[x], x = raiz, padres[x]
+        return raiz
+
+    def unir(self, a: int, b: int) -> bool:
+        """Une los conjuntos de a y b; devuelve False si ya estaban unidos"""
+        ra, rb = self.buscar(a), self.buscar(b)
+        if ra == rb:
+            return False
+        rangos = self._rangos
+        if rangos[ra] < rangos[rb]:
+            ra, rb = rb, ra
+        self._padres[rb] = ra
+        if rangos[ra] == rangos[rb]:
+            rangos[ra] += 1
+        self.num_conjuntos -= 1
+        return True
+
+    def etiquetas(self) -> np.ndarray:
+        """Raíz de cada elemento como arreglo"""
+        return np.fromiter((self.buscar(x) for x in range(len(self._padres))),
+                           dtype=np.int64, count=len(self._padres))
@@ -0,0 +1,125 @@
+"""Servicio local de viajes multisesión: JSON-RPC 2.0 sobre TCP, un mensaje por línea.
+
+Uso:
+    python servidor.py [--puerto 8765] [--ttl 1800] [--max-sesiones 10000]
+
+La ruta se calcula una sola vez al arrancar y todas las sesiones la
+comparten; cada sesión solo guarda su propio viaje. Ejemplo con netcat:
+
+    {"jsonrpc": "2.0", "id": 1, "method": "crear_sesion"}
+    {"jsonrpc": "2.0", "id": 2, "method": "confirmar", "params": {"sesion": "...", "dulces": [0, 1, 2]}}
+
+Métodos: ver `ServicioViajes`. Como `cli.py`, no importa tkinter ni matplotlib.
+"""
+import argparse
+import asyncio
+import sys
+from typing import List, Optional
+from controller import AlmacenSesiones, InstantaneaRuta, ServicioViajes, ViajeController
+from controller.sesiones import MAXIMO_SESIONES, TTL_SESIONES_S
+from repositories import CacheCalculos, DataRepository
+from service import estrategia_por_nombre, metrica_por_nombre
+
+# Líneas más largas que esto se rechazan (protege la memoria del servidor)
+LIMITE_LINEA = 1 << 20
+
+
+def crear_servicio(
+    estrategia: str = 'auto',
+    metrica: str = 'euclidiana',
+    ttl_s: Optional[float] = None,
+    max_sesiones: Optional[int] = None,
+    cache: bool = True
+) -> ServicioViajes:
+    """Calcula la ruta una vez y prepara el servicio sobre ella"""
+    repositorio = DataRepository()
+    num_estados = len(repositorio.obtener_estados())
+    controller = ViajeController(
+        estrategia_por_nombre(estrategia, num_estados, metrica_por_nombre(metrica)),
+        cache=CacheCalculos() if cache else None,
+        data_repository=repositorio
+    )
+    almacen: AlmacenSesiones[ViajeController] = AlmacenSesiones(
+        ttl_s or TTL_SESIONES_S, max_sesiones or MAXIMO_SESIONES
+    )
+    return ServicioViajes(InstantaneaRuta.desde_controlador(controller), almacen)
+
+
+async def atender_conexion(
+    servicio: ServicioViajes,
+    lector: asyncio.StreamReader,
+    escritor: asyncio.StreamWriter
+):
+    """Responde las peticiones de una conexión en orden, una línea por mensaje"""
+    try:
+        while True:
+            try:
+                linea = await lector.readline()
+            except ValueError:  # Línea por encima del límite
+                break
+            if not linea:
+                break
+            if not linea.strip():
+                continue
+            respuesta = servicio.procesar(linea)
+            if respuesta is not None:
+                escritor.write(respuesta.encode('utf-8') + b'\n')
+                await escritor.drain()
+    except ConnectionError:
+        pass
+    finally:
+        escritor.close()
+
+
+async def _purgar_periodicamente(servicio: ServicioViajes):
+    intervalo = max(1.0, servicio.almacen.ttl_s / 10)
+    while True:
+        await asyncio.sleep(intervalo)
+        servicio.almacen.purgar()
+
+
+async def iniciar_servidor(servicio: ServicioViajes, host: str, puerto: int) -> asyncio.Server:
+    return await asyncio.start_server(
+        lambda lector, escritor: atender_conexion(servicio, lector, escritor),
+        host, puerto, limit=LIMITE_LINEA, backlog=4096
+    )
+
+
+async def servir(servicio: ServicioViajes, host: str, puerto: int, aviso: bool = True):
+    servidor = await iniciar_servidor(servicio, host, puerto)
+    purga = asyncio.create_task(_purgar_periodicamente(servicio))
+    if aviso:
+        direcciones = ', '.join(str(s.getsockname()) for s in servidor.sockets)
+        print(f"Servicio de viajes en {direcciones} ({len(servicio.instantanea.ruta)} paradas)",
+              file=sys.stderr, flush=True)
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        purga.cancel()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Servicio JSON-RPC de viajes con sesiones concurrentes")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--puerto', type=int, default=8765)
+    parser.add_argument('--estrategia', default='auto')
+    parser.add_argument('--metrica', default='euclidiana')
+    parser.add_argument('--ttl', type=float, help="Segundos de inactividad antes de expirar una sesión")
+    parser.add_argument('--max-sesiones', type=int, help="Sesiones vivas antes de desalojar la menos usada")
+    parser.add_argument('--sin-cache', action='store_true', help="No usar la caché en disco de la ruta")
+    args = parser.parse_args(argv)
+    try:
+        servicio = crear_servicio(args.estrategia, args.metrica, args.ttl, args.max_sesiones, not args.sin_cache)
+    except (OSError, ValueError) as error:
+        print(f"Error al preparar la ruta: {error}", file=sys.stderr)
+        return 1
+    try:
+        asyncio.run(servir(servicio, args.host, args.puerto))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,11 +1,15 @@
 from .constants import (
     _DIRECTIONS,
     PESO_MAXIMO,
-    ESTADO_INICIAL
+    ESTADO_INICIAL,
+    RUTA_RED_CARRETERAS,
+    DIRECTORIO_CACHE
 )
 
 __all__ = [
     '_DIRECTIONS',
     'PESO_MAXIMO',
-    'ESTADO_INICIAL'
+    'ESTADO_INICIAL',
+    'RUTA_RED_CARRETERAS',
+    'DIRECTORIO_CACHE'
 ]
\ No newline at end of file
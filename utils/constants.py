@@ -2,5 +2,9 @@
 PESO_MAXIMO = 20.0  # Peso máximo de dulces en kg
 ESTADO_INICIAL = "Ciudad de México"
 
+# Red de carreteras opcional (CSV: origen,destino,distancia_km) y caché en disco
+RUTA_RED_CARRETERAS = "data/red_carreteras.csv"
+DIRECTORIO_CACHE = ".cache"
+
 
 _DIRECTIONS = "nsew"  # Constante para reutilizar
\ No newline at end of file
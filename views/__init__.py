@@ -1,9 +1,24 @@
+from typing import TYPE_CHECKING
 from .base_view import BaseView
 from .viaje_view import ViajeView
-from .graph_view import GraphView
+from .actualizaciones import ProgramadorActualizaciones
+from .lista_virtual import ListaVirtual
+
+if TYPE_CHECKING:
+    from .graph_view import GraphView
 
 __all__ = [
     'BaseView',
     'ViajeView',
+    'ProgramadorActualizaciones',
+    'ListaVirtual',
     'GraphView'
 ]
+
+
+def __getattr__(nombre: str):
+    # GraphView arrastra matplotlib y networkx: se importa solo al usarse
+    if nombre == 'GraphView':
+        from .graph_view import GraphView
+        return GraphView
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
@@ -0,0 +1,64 @@
+import tkinter as tk
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+_SIN_VALOR = object()
+
+
+class ProgramadorActualizaciones:
+    """Agrupa las actualizaciones de widgets y las aplica una vez por cuadro.
+
+    - `fijar(clave, valor, aplicar)` registra el estado deseado de un widget;
+      si coincide con el ya aplicado no se hace ninguna llamada a Tk, y si se
+      fija varias veces antes del cuadro solo se aplica el último valor.
+    - `agregar_texto(widget, texto)` acumula texto; al vaciar se hace un solo
+      `insert` y un solo `see(END)` por widget.
+
+    El vaciado se programa con `after_idle`, así todas las llamadas de un
+    mismo evento se aplican juntas.
+    """
+
+    def __init__(self, widget: tk.Misc):
+        self._widget = widget
+        self._actuales: Dict[Hashable, Any] = {}
+        self._pendientes: Dict[Hashable, Tuple[Any, Callable[[Any], None]]] = {}
+        self._textos: Dict[tk.Text, List[str]] = {}
+        self._programado: Optional[str] = None
+
+    def fijar(self, clave: Hashable, valor: Any, aplicar: Callable[[Any], None]):
+        if clave not in self._pendientes and self._actuales.get(clave, _SIN_VALOR) == valor:
+            return
+        if self._actuales.get(clave, _SIN_VALOR) == valor:
+            del self._pendientes[clave]  # Volvió al valor ya aplicado
+            return
+        self._pendientes[clave] = (valor, aplicar)
+        self._programar()
+
+    def agregar_texto(self, widget: tk.Text, texto: str):
+        self._textos.setdefault(widget, []).append(texto)
+        self._programar()
+
+    def olvidar(self, clave: Hashable):
+        """Descarta el valor recordado (p. ej. si el widget se cambió por fuera)"""
+        self._actuales.pop(clave, None)
+
+    @property
+    def hay_pendientes(self) -> bool:
+        return bool(self._pendientes or self._textos)
+
+    def _programar(self):
+        if self._programado is None:
+            self._programado = self._widget.after_idle(self.vaciar)
+
+    def vaciar(self):
+        """Aplica ya lo pendiente (antes de diálogos modales o al medir)"""
+        if self._programado is not None:
+            self._widget.after_cancel(self._programado)
+            self._programado = None
+        pendientes, self._pendientes = self._pendientes, {}
+        for clave, (valor, aplicar) in pendientes.items():
+            aplicar(valor)
+            self._actuales[clave] = valor
+        textos, self._textos = self._textos, {}
+        for widget, partes in textos.items():
+            widget.insert(tk.END, ''.join(partes))
+            widget.see(tk.END)
@@ -1,8 +1,163 @@
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
+from tkinter import ttk
 import networkx as nx
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import numpy as np
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
-from typing import Optional, Dict, Tuple
+from typing import Callable, Optional, Dict, Sequence, Tuple
+from service.arbol import ArbolExpansion
+from service.indice_espacial import IndiceEspacial
+from .nivel_detalle import preparar_comparacion
+
+# Intervalo (ms) para revisar la figura que se prepara en segundo plano
+_INTERVALO_SONDEO_MS = 50
+# Como mucho una consulta de "hover" por intervalo (ms); cuenta el último movimiento
+_INTERVALO_HOVER_MS = 30
+# Tamaño de los nodos del MST (puntos²); también fija la tolerancia del clic
+_TAMANO_NODO = 800
+
+
+class CapaMST:
+    """MST dibujado una vez como artistas persistentes, con el resalte animado.
+    
+    Nodos, aristas y etiquetas se dibujan solo en la primera pasada. El
+    marcador del estado actual es un artista `animated`: tras cada dibujo
+    completo se guarda el fondo (`draw_event`) y moverlo solo restaura ese
+    fondo, dibuja el marcador y hace blit de la figura, así el costo no
+    depende del tamaño del grafo. El nodo bajo el ratón se busca con un
+    `IndiceEspacial` (construido al primer uso) y su descripción se muestra
+    como otro artista animado. Funciona con cualquier lienzo de Agg.
+    """
+    
+    def __init__(self, fig: Figure, mst_grafo: nx.Graph, pos_estados: Dict[str, Tuple[float, float]]):
+        self.fig = fig
+        self.mst_grafo = mst_grafo
+        # Convertir posiciones a formato numérico seguro
+        self.posiciones = {
+            nodo: (float(x), float(y)) 
+            for nodo, (x, y) in pos_estados.items()
+        }
+        self.nombres = list(self.posiciones)
+        self._indice: Optional[IndiceEspacial] = None
+        self._fondo = None
+        
+        fig.clf()  # Usar clf() en lugar de clear() para mayor compatibilidad
+        self.ax = fig.add_subplot(111)
+        self._dibujar_mst()
+        
+        # Resaltar estado actual (fuera del dibujo completo)
+        self.marcador = self.ax.scatter(
+            [0.0], [0.0],
+            c='red',
+            s=1000,
+            alpha=0.7,
+            zorder=3,
+            animated=True,
+            visible=False
+        )
+        self.descripcion = self.ax.annotate(
+            "", xy=(0.0, 0.0), xytext=(12, 12), textcoords='offset points',
+            fontsize=8, zorder=5, animated=True, visible=False,
+            bbox=dict(boxstyle='round', fc='lightyellow', alpha=0.9)
+        )
+        self._conexion = fig.canvas.mpl_connect('draw_event', self._al_dibujar)
+    
+    def _dibujar_mst(self):
+        ax = self.ax
+        # Dibujar el MST
+        nx.draw_networkx(
+            self.mst_grafo, 
+            pos=self.posiciones, 
+            ax=ax,
+            with_labels=True,
+            node_color='lightgreen',
+            node_size=_TAMANO_NODO,
+            font_size=8,
+            font_weight='bold'
+        )
+        
+        # Etiquetas de peso
+        edge_labels = {
+            (u, v): f"{d['weight']:.1f}" 
+            for u, v, d in self.mst_grafo.edges(data=True)
+        }
+        nx.draw_networkx_edge_labels(
+            self.mst_grafo,
+            pos=self.posiciones,
+            edge_labels=edge_labels,
+            ax=ax,
+            font_size=6
+        )
+        
+        ax.set_title("Ruta Óptima (Algoritmo de Kruskal)", fontsize=12, fontweight='bold')
+        ax.axis('off')
+    
+    def _al_dibujar(self, _evento=None):
+        """Tras un dibujo completo (inicial o por redimensionar) guarda el fondo"""
+        canvas = self.fig.canvas
+        self._fondo = canvas.copy_from_bbox(self.fig.bbox)
+        self._dibujar_animados()
+    
+    def _dibujar_animados(self):
+        self.ax.draw_artist(self.marcador)
+        self.ax.draw_artist(self.descripcion)
+    
+    def _blit(self):
+        canvas = self.fig.canvas
+        if self._fondo is None:
+            canvas.draw_idle()  # Aún no hay fondo: el primer dibujo lo guardará
+            return
+        canvas.restore_region(self._fondo)
+        self._dibujar_animados()
+        canvas.blit(self.fig.bbox)
+    
+    def resaltar(self, estado: Optional[str]):
+        if estado is not None and estado in self.posiciones:
+            self.marcador.set_offsets([self.posiciones[estado]])
+            self.marcador.set_visible(True)
+        else:
+            self.marcador.set_visible(False)
+        self._blit()
+    
+    @property
+    def indice(self) -> IndiceEspacial:
+        if self._indice is None:
+            self._indice = IndiceEspacial(np.array([self.posiciones[n] for n in self.nombres]))
+        return self._indice
+    
+    def estado_en(self, evento) -> Optional[str]:
+        """Estado bajo la posición del ratón (a menos del radio de un nodo) o None"""
+        if evento.inaxes is not self.ax or evento.xdata is None or not self.nombres:
+            return None
+        # Radio del nodo en píxeles y su equivalente (cota) en unidades de datos
+        tolerancia = (_TAMANO_NODO ** 0.5) / 2 * self.fig.dpi / 72.0
+        inversa = self.ax.transData.inverted()
+        x0, y0 = inversa.transform((evento.x, evento.y))
+        x1, y1 = inversa.transform((evento.x + tolerancia, evento.y + tolerancia))
+        radio = max(abs(x1 - x0), abs(y1 - y0))
+        distancia, indice = self.indice.mas_cercano((evento.xdata, evento.ydata), radio)
+        if indice < 0:
+            return None
+        px, py = self.ax.transData.transform(self.indice.coordenadas[indice])
+        if (px - evento.x) ** 2 + (py - evento.y) ** 2 > tolerancia ** 2:
+            return None
+        return self.nombres[indice]
+    
+    def describir(self, estado: Optional[str], texto: Optional[str] = None):
+        """Muestra (o con None oculta) la descripción junto a un estado"""
+        visible = estado is not None and estado in self.posiciones
+        if not visible and not self.descripcion.get_visible():
+            return
+        if visible:
+            self.descripcion.xy = self.posiciones[estado]
+            self.descripcion.set_text(texto or estado)
+        self.descripcion.set_visible(visible)
+        self._blit()
+    
+    def desconectar(self):
+        self.fig.canvas.mpl_disconnect(self._conexion)
+
 
 class GraphView:
     """Vista para la visualización de grafos"""
@@ -13,6 +168,14 @@ class GraphView:
         self.parent_frame = parent_frame
         self.fig = None
         self.canvas = None
+        self.capa: Optional[CapaMST] = None
+        self._ejecutor: Optional[ThreadPoolExecutor] = None
+        # Callbacks: clic sobre un estado y texto a mostrar al pasar el ratón
+        self.on_seleccionar_estado: Optional[Callable[[str], None]] = None
+        self.on_describir_estado: Optional[Callable[[str], str]] = None
+        self._ultimo_movimiento = None
+        self._hover_programado: Optional[str] = None
+        self._estado_bajo_raton: Optional[str] = None
         self.setup_canvas()
     
     def setup_canvas(self):
@@ -30,6 +193,7 @@ class GraphView:
                 self.canvas.get_tk_widget().destroy()  # Eliminar el canvas viejo
                 self.canvas = FigureCanvasTkAgg(self.fig, master=self.parent_frame)
                 self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            self._conectar_raton()
                 
         except Exception as e:
             print(f"Error al configurar canvas: {e}")
@@ -40,9 +204,47 @@ class GraphView:
         if self.canvas:
             self.canvas.get_tk_widget().destroy()
         
+        self.capa = None
         self.fig = Figure(figsize=(8, 6), dpi=100)
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.parent_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self._conectar_raton()
+    
+    def _conectar_raton(self):
+        """Clic y movimiento del ratón sobre el MST (consultas con el índice espacial)"""
+        self.canvas.mpl_connect('button_press_event', self._al_hacer_clic)
+        self.canvas.mpl_connect('motion_notify_event', self._al_mover_raton)
+    
+    def _al_hacer_clic(self, evento):
+        if self.capa is None or evento.button != 1:
+            return
+        estado = self.capa.estado_en(evento)
+        if estado is not None and self.on_seleccionar_estado:
+            self.on_seleccionar_estado(estado)
+    
+    def _al_mover_raton(self, evento):
+        # Se guarda el último evento y se atiende a lo sumo uno por intervalo
+        self._ultimo_movimiento = evento
+        if self._hover_programado is None:
+            self._hover_programado = self.parent_frame.after(_INTERVALO_HOVER_MS, self._atender_movimiento)
+    
+    def _atender_movimiento(self):
+        self._hover_programado = None
+        evento, self._ultimo_movimiento = self._ultimo_movimiento, None
+        if self.capa is None or evento is None:
+            return
+        estado = self.capa.estado_en(evento)
+        if estado == self._estado_bajo_raton:
+            return
+        self._estado_bajo_raton = estado
+        texto = None
+        if estado is not None and self.on_describir_estado:
+            texto = self.on_describir_estado(estado)
+        self.capa.describir(estado, texto)
+    
+    def muestra_mst(self, mst_grafo: nx.Graph) -> bool:
+        """Indica si la capa dibujada corresponde a este MST (basta mover el resalte)"""
+        return self.capa is not None and self.capa.mst_grafo is mst_grafo
     
     def actualizar_grafo_mst(
         self, 
@@ -50,66 +252,27 @@ class GraphView:
         pos_estados: Dict[str, Tuple[float, float]], 
         estado_actual: Optional[str] = None
     ):
-        """Actualiza la visualización del MST"""
+        """Actualiza la visualización del MST.
+        
+        El MST se dibuja una sola vez; si no cambió, solo se mueve el resalte
+        del estado actual (ver `resaltar_estado`).
+        """
         if not mst_grafo or not pos_estados:
             return
         
         try:
+            if self.muestra_mst(mst_grafo):
+                self.resaltar_estado(estado_actual)
+                return
+            
             # Limpiar figura de manera segura
             if self.fig is None:
                 self._recreate_canvas()
-            else:
-                self.fig.clf()  # Usar clf() en lugar de clear() para mayor compatibilidad
-            
-            # Crear subplot con manejo de errores
-            ax = self.fig.add_subplot(111) if self.fig else None
-            if ax is None:
-                raise ValueError("No se pudo crear el subplot")
-            
-            # Convertir posiciones a formato numérico seguro
-            pos_numerico = {
-                nodo: (float(x), float(y)) 
-                for nodo, (x, y) in pos_estados.items()
-            }
-            
-            # Dibujar el MST
-            nx.draw_networkx(
-                mst_grafo, 
-                pos=pos_numerico, 
-                ax=ax,
-                with_labels=True,
-                node_color='lightgreen',
-                node_size=800,
-                font_size=8,
-                font_weight='bold'
-            )
-            
-            # Etiquetas de peso
-            edge_labels = {
-                (u, v): f"{d['weight']:.1f}" 
-                for u, v, d in mst_grafo.edges(data=True)
-            }
-            nx.draw_networkx_edge_labels(
-                mst_grafo,
-                pos=pos_numerico,
-                edge_labels=edge_labels,
-                ax=ax,
-                font_size=6
-            )
-            
-            # Resaltar estado actual
-            if estado_actual and estado_actual in pos_numerico:
-                x, y = pos_numerico[estado_actual]
-                ax.scatter(
-                    [x], [y],
-                    c='red',
-                    s=1000,
-                    alpha=0.7,
-                    zorder=3
-                )
-            
-            ax.set_title("Ruta Óptima (Algoritmo de Kruskal)", fontsize=12, fontweight='bold')
-            ax.axis('off')
+            if self.capa is not None:
+                self.capa.desconectar()
+            self.capa = CapaMST(self.fig, mst_grafo, pos_estados)
+            self._estado_bajo_raton = None
+            self.capa.resaltar(estado_actual)
             
             # Actualizar canvas de manera segura
             if self.canvas:
@@ -119,17 +282,33 @@ class GraphView:
                 
         except Exception as e:
             print(f"Error al actualizar grafo MST: {e}")
+            self.capa = None
             self._recreate_canvas()
     
+    def resaltar_estado(self, estado_actual: Optional[str]) -> bool:
+        """Mueve el resalte al estado indicado con blitting; costo constante.
+        
+        Devuelve False si aún no hay un MST dibujado.
+        """
+        if self.capa is None:
+            return False
+        self.capa.resaltar(estado_actual)
+        return True
+    
     def mostrar_comparacion_grafos(
         self, 
-        grafo_completo: nx.Graph, 
-        mst_grafo: nx.Graph, 
-        pos_estados: Dict[str, Tuple[float, float]], 
+        coordenadas: np.ndarray, 
+        nombres: Sequence[str], 
+        arbol: ArbolExpansion, 
         peso_mst: float
     ):
-        """Muestra una ventana con la comparación de grafos"""
-        if not grafo_completo or not mst_grafo or not pos_estados:
+        """Muestra una ventana con la comparación de grafos.
+        
+        La figura (aristas agrupadas y diezmadas, ver `views.nivel_detalle`) se
+        prepara en un hilo de trabajo; la ventana se abre de inmediato y el
+        lienzo se adjunta al terminar, sondeando con `after`.
+        """
+        if coordenadas is None or arbol is None or len(nombres) == 0:
             return
         
         graph_window = None
@@ -137,48 +316,44 @@ class GraphView:
             graph_window = tk.Toplevel()
             graph_window.title("Comparación de Grafos")
             graph_window.geometry("1200x600")
+            aviso = ttk.Label(graph_window, text="Preparando la comparación...", font=('Arial', 12))
+            aviso.pack(expand=True)
             
-            fig = Figure(figsize=(16, 8), dpi=100)
-            canvas = FigureCanvasTkAgg(fig, master=graph_window)
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            
-            pos_numerico = {
-                nodo: (float(x), float(y)) 
-                for nodo, (x, y) in pos_estados.items()
-            }
-            
-            # Grafo completo
-            ax1 = fig.add_subplot(121)
-            nx.draw_networkx(
-                grafo_completo,
-                pos=pos_numerico,
-                ax=ax1,
-                with_labels=True,
-                node_color='lightblue',
-                node_size=600,
-                font_size=6,
-                font_weight='bold'
-            )
-            
-            # MST
-            ax2 = fig.add_subplot(122)
-            nx.draw_networkx(
-                mst_grafo,
-                pos=pos_numerico,
-                ax=ax2,
-                with_labels=True,
-                node_color='lightgreen',
-                node_size=600,
-                font_size=6,
-                font_weight='bold'
+            if self._ejecutor is None:
+                self._ejecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='comparacion')
+            future = self._ejecutor.submit(
+                preparar_comparacion, coordenadas, nombres, arbol.origen, arbol.destino, peso_mst
             )
+            graph_window.after(_INTERVALO_SONDEO_MS, self._adjuntar_comparacion, graph_window, aviso, future)
             
+        except Exception as e:
+            print(f"Error en comparación de grafos: {e}")
+            self._cerrar_ventana(graph_window)
+    
+    def _adjuntar_comparacion(self, graph_window: tk.Toplevel, aviso: ttk.Label, future: Future):
+        if not graph_window.winfo_exists():
+            return  # El usuario cerró la ventana antes de terminar
+        if not future.done():
+            graph_window.after(_INTERVALO_SONDEO_MS, self._adjuntar_comparacion, graph_window, aviso, future)
+            return
+        try:
+            fig, etiquetas = future.result()
+            aviso.destroy()
+            canvas = FigureCanvasTkAgg(fig, master=graph_window)
+            # Barra de navegación: el zoom es lo que hace visibles las etiquetas
+            NavigationToolbar2Tk(canvas, graph_window).update()
+            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            # Los callbacks de matplotlib guardan referencias débiles
+            graph_window.etiquetas_zoom = etiquetas
             canvas.draw()
-            
         except Exception as e:
             print(f"Error en comparación de grafos: {e}")
-            if graph_window and graph_window.winfo_exists():
-                try:
-                    graph_window.destroy()
-                except:
-                    pass
\ No newline at end of file
+            self._cerrar_ventana(graph_window)
+    
+    @staticmethod
+    def _cerrar_ventana(graph_window: Optional[tk.Toplevel]):
+        if graph_window and graph_window.winfo_exists():
+            try:
+                graph_window.destroy()
+            except:
+                pass
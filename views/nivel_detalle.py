@@ -0,0 +1,184 @@
+"""Dibujo por nivel de detalle para grafos grandes.
+
+Las aristas se agrupan en un solo `LineCollection` y, si exceden el
+presupuesto, se dibuja una muestra uniforme (con transparencia
+proporcional); las etiquetas solo aparecen cuando el zoom deja pocas a la
+vista. La preparación no toca Tk, así que puede correr fuera del hilo de
+la interfaz.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.text import Text
+from service.distancias import pares_condensados, pares_desde_posiciones
+
+# Máximo de aristas dibujadas por panel
+PRESUPUESTO_ARISTAS_COMPLETO = 20_000
+PRESUPUESTO_ARISTAS_MST = 200_000
+# Las etiquetas se muestran cuando a lo sumo este número de nodos queda a la vista
+LIMITE_ETIQUETAS = 60
+
+
+@dataclass
+class SegmentosGrafo:
+    """Aristas listas para un LineCollection: arreglo (m, 2, 2) de extremos"""
+    segmentos: np.ndarray
+    total: int  # Aristas del grafo antes de diezmar
+
+    @property
+    def diezmado(self) -> bool:
+        return len(self.segmentos) < self.total
+
+    @property
+    def alfa(self) -> float:
+        # Con muchas aristas cada una se aclara para que se lea la densidad
+        return float(min(1.0, max(0.02, 1000.0 / max(len(self.segmentos), 1))))
+
+
+def _segmentos(coordenadas: np.ndarray, i: np.ndarray, j: np.ndarray, total: int) -> SegmentosGrafo:
+    return SegmentosGrafo(np.stack((coordenadas[i], coordenadas[j]), axis=1), total)
+
+
+def segmentos_completo(
+    coordenadas: np.ndarray,
+    presupuesto: int = PRESUPUESTO_ARISTAS_COMPLETO,
+    semilla: int = 0
+) -> SegmentosGrafo:
+    """Aristas del grafo completo; muestra uniforme sin repetición si exceden el presupuesto"""
+    n = len(coordenadas)
+    total = n * (n - 1) // 2
+    if total <= presupuesto:
+        i, j = pares_condensados(n)
+    else:
+        rng = np.random.default_rng(semilla)
+        i, j = pares_desde_posiciones(np.sort(rng.choice(total, presupuesto, replace=False)), n)
+    return _segmentos(coordenadas, i, j, total)
+
+
+def segmentos_arbol(
+    coordenadas: np.ndarray,
+    origen: np.ndarray,
+    destino: np.ndarray,
+    presupuesto: int = PRESUPUESTO_ARISTAS_MST,
+    semilla: int = 0
+) -> SegmentosGrafo:
+    total = len(origen)
+    if total > presupuesto:
+        indices = np.sort(np.random.default_rng(semilla).choice(total, presupuesto, replace=False))
+        origen, destino = origen[indices], destino[indices]
+    return _segmentos(coordenadas, origen, destino, total)
+
+
+def tamano_nodo(n: int, base: float = 600.0) -> float:
+    """Tamaño de marcador que se reduce con la cantidad de nodos"""
+    return float(min(base, max(1.0, base * 32.0 / max(n, 1))))
+
+
+class EtiquetasPorZoom:
+    """Etiquetas de nodos que solo se crean cuando pocas quedan a la vista.
+
+    Escucha los cambios de límites de los ejes (zoom y desplazamiento) y
+    crea o retira los textos de los nodos visibles; con más de `limite` a la
+    vista no hay ninguna, así que el costo de dibujo queda acotado.
+    """
+
+    def __init__(
+        self,
+        ax: Axes,
+        coordenadas: np.ndarray,
+        nombres: Sequence[str],
+        limite: int = LIMITE_ETIQUETAS,
+        font_size: int = 6
+    ):
+        self.ax = ax
+        self.coordenadas = coordenadas
+        self.nombres = nombres
+        self.limite = limite
+        self.font_size = font_size
+        self._textos: Dict[int, Text] = {}
+        ax.callbacks.connect('xlim_changed', self.actualizar)
+        ax.callbacks.connect('ylim_changed', self.actualizar)
+
+    def visibles(self) -> np.ndarray:
+        """Índices de los nodos dentro de los límites actuales de los ejes"""
+        (x0, x1), (y0, y1) = sorted(self.ax.get_xlim()), sorted(self.ax.get_ylim())
+        x, y = self.coordenadas[:, 0], self.coordenadas[:, 1]
+        return np.flatnonzero((x >= x0) & (x <= x1) & (y >= y0) & (y <= y1))
+
+    def actualizar(self, _ax: Optional[Axes] = None):
+        indices = self.visibles()
+        mostrar = set(indices.tolist()) if len(indices) <= self.limite else set()
+        for indice in [i for i in self._textos if i not in mostrar]:
+            self._textos.pop(indice).remove()
+        for indice in mostrar - self._textos.keys():
+            x, y = self.coordenadas[indice]
+            self._textos[indice] = self.ax.text(
+                x, y, self.nombres[indice],
+                fontsize=self.font_size, fontweight='bold',
+                ha='center', va='center', clip_on=True, zorder=4
+            )
+
+    @property
+    def mostradas(self) -> int:
+        return len(self._textos)
+
+
+def _dibujar_panel(
+    ax: Axes,
+    coordenadas: np.ndarray,
+    nombres: Sequence[str],
+    segmentos: SegmentosGrafo,
+    color_nodo: str,
+    titulo: str
+) -> EtiquetasPorZoom:
+    ax.add_collection(LineCollection(
+        segmentos.segmentos, colors='k', linewidths=1.0, alpha=segmentos.alfa, zorder=1
+    ))
+    ax.scatter(
+        coordenadas[:, 0], coordenadas[:, 1],
+        s=tamano_nodo(len(coordenadas)), c=color_nodo, zorder=2
+    )
+    if segmentos.diezmado:
+        titulo += f"\n(muestra de {len(segmentos.segmentos):,} de {segmentos.total:,} aristas)"
+    ax.set_title(titulo, fontsize=10)
+    ax.autoscale_view()
+    ax.axis('off')
+    etiquetas = EtiquetasPorZoom(ax, coordenadas, nombres)
+    etiquetas.actualizar()
+    return etiquetas
+
+
+def preparar_comparacion(
+    coordenadas: np.ndarray,
+    nombres: Sequence[str],
+    origen_mst: np.ndarray,
+    destino_mst: np.ndarray,
+    peso_mst: float,
+    presupuesto_completo: int = PRESUPUESTO_ARISTAS_COMPLETO,
+    presupuesto_mst: int = PRESUPUESTO_ARISTAS_MST
+) -> Tuple[Figure, List[EtiquetasPorZoom]]:
+    """Figura de comparación (grafo completo | MST) sin lienzo asociado.
+
+    El número de artistas está acotado por los presupuestos, no por el tamaño
+    del grafo; la figura se adjunta a un lienzo después, en el hilo de la UI.
+    """
+    coordenadas = np.asarray(coordenadas, dtype=np.float64)
+    fig = Figure(figsize=(16, 8), dpi=100)
+    ax1 = fig.add_subplot(121)
+    ax2 = fig.add_subplot(122, sharex=ax1, sharey=ax1)
+    etiquetas = [
+        _dibujar_panel(
+            ax1, coordenadas, nombres,
+            segmentos_completo(coordenadas, presupuesto_completo),
+            'lightblue', "Grafo completo"
+        ),
+        _dibujar_panel(
+            ax2, coordenadas, nombres,
+            segmentos_arbol(coordenadas, origen_mst, destino_mst, presupuesto_mst),
+            'lightgreen', f"Árbol de expansión mínima (peso {peso_mst:.1f})"
+        ),
+    ]
+    return fig, etiquetas
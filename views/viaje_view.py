@@ -1,13 +1,20 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import List, Callable, Optional
+from typing import Callable, Optional, Sequence
 from models import Estado, Dulce
 from views import BaseView
 from utils import _DIRECTIONS
+from .actualizaciones import ProgramadorActualizaciones
+from .lista_virtual import ListaVirtual
 
 
 class ViajeView(BaseView):
-    """Vista principal de la aplicación"""
+    """Vista principal de la aplicación.
+    
+    Etiquetas, botones y el registro del viaje se actualizan a través de un
+    `ProgramadorActualizaciones`: solo se aplica lo que cambió y una vez por
+    cuadro. La lista de dulces es virtual (solo existen las filas visibles).
+    """
     
     def setup_ui(self):
         self.root.title("Recorrido por México - Algoritmo de Kruskal")
@@ -17,6 +24,11 @@ class ViajeView(BaseView):
         self.on_confirmar_seleccion: Optional[Callable] = None
         self.on_siguiente_estado: Optional[Callable] = None
         self.on_mostrar_grafo_completo: Optional[Callable] = None
+        self.on_cambio_seleccion: Optional[Callable] = None
+        self.on_cancelar_calculo: Optional[Callable] = None
+        self.on_reintentar_calculo: Optional[Callable] = None
+        self._carga_frame: Optional[ttk.Frame] = None
+        self.actualizaciones = ProgramadorActualizaciones(self.root)
         
         self._setup_ui()
     
@@ -76,16 +88,11 @@ class ViajeView(BaseView):
         dulces_frame.rowconfigure(0, weight=1)
         dulces_frame.columnconfigure(0, weight=1)
         
-        # Listbox para dulces
-        self.dulces_listbox = tk.Listbox(dulces_frame, height=8, selectmode=tk.MULTIPLE, 
-                                        font=('Arial', 10), bg='white', 
+        # Lista virtual para dulces (catálogos grandes sin crear todas las filas)
+        self.dulces_listbox = ListaVirtual(dulces_frame, filas=8, font=('Arial', 10), bg='white', 
                                         selectbackground='lightblue')
         self.dulces_listbox.grid(row=0, column=0, sticky="nsew")
-        
-        # Scrollbar para listbox
-        scrollbar = ttk.Scrollbar(dulces_frame, orient=tk.VERTICAL, command=self.dulces_listbox.yview)
-        scrollbar.grid(row=0, column=1, sticky="nsew")
-        self.dulces_listbox.config(yscrollcommand=scrollbar.set)
+        self.dulces_listbox.bind('<<ListboxSelect>>', self._on_seleccion_cambiada)
     
     def _setup_buttons(self):
         """Configura los botones"""
@@ -123,6 +130,16 @@ class ViajeView(BaseView):
             seleccionados = list(self.dulces_listbox.curselection())
             self.on_confirmar_seleccion(seleccionados)
     
+    def _on_seleccion_cambiada(self, _evento=None):
+        """Descarta dulces atenuados y avisa del cambio para recalcular los elegibles"""
+        seleccionables = self.dulces_listbox.seleccionables
+        if seleccionables is not None:
+            for i in self.dulces_listbox.curselection():
+                if not seleccionables[i]:
+                    self.dulces_listbox.selection_clear(i)
+        if self.on_cambio_seleccion:
+            self.on_cambio_seleccion(list(self.dulces_listbox.curselection()))
+    
     def _on_siguiente_clicked(self):
         """Maneja el clic en siguiente estado"""
         if self.on_siguiente_estado:
@@ -136,45 +153,98 @@ class ViajeView(BaseView):
     # Métodos públicos para actualizar la vista
     def actualizar_estado_actual(self, estado: Estado):
         """Actualiza la información del estado actual"""
-        self.estado_actual_label.config(text=f"Estado Actual: {estado.nombre}")
+        self._fijar_texto(self.estado_actual_label, f"Estado Actual: {estado.nombre}")
     
     def actualizar_progreso(self, progreso: str):
         """Actualiza el progreso del viaje"""
-        self.progreso_label.config(text=progreso)
+        self._fijar_texto(self.progreso_label, progreso)
     
     def actualizar_peso(self, peso_info: str):
         """Actualiza la información del peso"""
-        self.peso_label.config(text=peso_info)
+        self._fijar_texto(self.peso_label, peso_info)
+    
+    def cargar_dulces(self, dulces: Sequence[Dulce]):
+        """Carga la lista de dulces; si el catálogo es el mismo solo limpia la selección"""
+        if dulces is self.dulces_listbox.elementos:
+            self.dulces_listbox.selection_clear(0, tk.END)
+        else:
+            self.dulces_listbox.cargar(dulces)
     
-    def cargar_dulces(self, dulces: List[Dulce]):
-        """Carga la lista de dulces en el listbox"""
-        self.dulces_listbox.delete(0, tk.END)
-        for dulce in dulces:
-            self.dulces_listbox.insert(tk.END, str(dulce))
-        self.dulces_listbox.selection_clear(0, tk.END)
+    def actualizar_dulces_seleccionables(self, seleccionables: Sequence[bool]):
+        """Atenúa los dulces que ya no caben en ninguna selección válida"""
+        self.dulces_listbox.establecer_seleccionables(seleccionables)
     
     def mostrar_mensaje_error(self, titulo: str, mensaje: str):
         """Muestra un mensaje de error"""
+        self.actualizaciones.vaciar()
         messagebox.showwarning(titulo, mensaje)
     
     def mostrar_mensaje_info(self, titulo: str, mensaje: str):
         """Muestra un mensaje informativo"""
+        self.actualizaciones.vaciar()
         messagebox.showinfo(titulo, mensaje)
     
     def agregar_info_viaje(self, texto: str):
-        """Agrega texto al área de información del viaje"""
-        self.info_text.insert(tk.END, texto)
-        self.info_text.see(tk.END)
+        """Agrega texto al área de información del viaje (un solo insert por cuadro)"""
+        self.actualizaciones.agregar_texto(self.info_text, texto)
     
     def habilitar_confirmar(self, habilitado: bool):
         """Habilita/deshabilita el botón confirmar"""
-        state = tk.NORMAL if habilitado else tk.DISABLED
-        self.confirmar_btn.config(state=state)
+        self._fijar_estado(self.confirmar_btn, habilitado)
     
     def habilitar_siguiente(self, habilitado: bool):
         """Habilita/deshabilita el botón siguiente"""
+        self._fijar_estado(self.siguiente_btn, habilitado)
+    
+    def _fijar_texto(self, etiqueta: ttk.Label, texto: str):
+        self.actualizaciones.fijar((etiqueta, 'text'), texto, lambda valor: etiqueta.config(text=valor))
+    
+    def _fijar_estado(self, boton: ttk.Button, habilitado: bool):
         state = tk.NORMAL if habilitado else tk.DISABLED
-        self.siguiente_btn.config(state=state)
+        self.actualizaciones.fijar((boton, 'state'), state, lambda valor: boton.config(state=valor))
+    
+    def mostrar_carga(self, mensaje: str = "Calculando la ruta..."):
+        """Marcador en el área del grafo mientras la ruta se calcula en segundo plano"""
+        if self._carga_frame is None:
+            self._carga_frame = ttk.Frame(self.graph_frame)
+            self._carga_label = ttk.Label(self._carga_frame, font=('Arial', 12))
+            self._carga_label.pack(pady=(0, 10))
+            self._carga_barra = ttk.Progressbar(self._carga_frame, length=300, maximum=1.0)
+            self._carga_barra.pack(pady=5)
+            self._carga_btn = ttk.Button(self._carga_frame)
+            self._carga_btn.pack(pady=10)
+        self._carga_label.config(text=mensaje)
+        self._carga_barra['value'] = 0.0
+        self._carga_btn.config(text="Cancelar", command=self._on_cancelar_clicked, state=tk.NORMAL)
+        self._carga_frame.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+    
+    def actualizar_carga(self, etapa: str, fraccion: float):
+        """Muestra la etapa en curso del cálculo y su avance (0 a 1)"""
+        if self._carga_frame is None:
+            return
+        self._carga_label.config(text=f"Calculando: {etapa}...")
+        self._carga_barra['value'] = fraccion
+    
+    def mostrar_carga_interrumpida(self, mensaje: str):
+        """Deja el marcador con un mensaje y la opción de reintentar"""
+        if self._carga_frame is None:
+            self.mostrar_carga()
+        self._carga_label.config(text=mensaje)
+        self._carga_btn.config(text="Reintentar", command=self._on_reintentar_clicked, state=tk.NORMAL)
+    
+    def ocultar_carga(self):
+        if self._carga_frame is not None:
+            self._carga_frame.destroy()
+            self._carga_frame = None
+    
+    def _on_cancelar_clicked(self):
+        self._carga_btn.config(state=tk.DISABLED)
+        if self.on_cancelar_calculo:
+            self.on_cancelar_calculo()
+    
+    def _on_reintentar_clicked(self):
+        if self.on_reintentar_calculo:
+            self.on_reintentar_calculo()
     
     def obtener_graph_frame(self):
         """Retorna el frame para el grafo"""